@@ -0,0 +1,45 @@
+import sys
+from dataclasses import replace
+
+from neutrino.clf.config.dist_config import ClfDistConfig
+from neutrino.clf.config.feature_config import ClfFeatureConfig
+from neutrino.clf.config.train_config import ClfTrainConfig
+from neutrino.clf.distributed import train_local
+from neutrino.prep.io.threads import ThreadBudget
+
+# Ranks are spawned processes: keep the entry point importable
+if __name__ == "__main__":
+    # Usage: bench_dist.py [MAX_RANKS] [EPOCHS]
+    train_cfg = ClfTrainConfig.load_config()
+    base = ThreadBudget.from_config(total_cores=train_cfg.threads)
+    max_ranks = int(sys.argv[1]) if len(sys.argv) > 1 else base.total_cores
+    if len(sys.argv) > 2:
+        train_cfg = replace(train_cfg, epochs=int(sys.argv[2]))
+
+    dist_cfg = ClfDistConfig.load_config()
+    features = ClfFeatureConfig.load_config().feature_order
+    curve = sorted({1, max_ranks, *(2**k for k in range(8) if 2**k <= max_ranks)})
+
+    results = []
+    for i, ranks in enumerate(curve):
+        # A fresh port per run: the previous rendezvous may still be closing
+        cfg = replace(dist_cfg, master_port=dist_cfg.master_port + i)
+        result = train_local(
+            features, ranks, train_cfg=train_cfg, dist_cfg=cfg, verbose=False
+        )
+        results.append(result)
+
+    base.report()
+    print("---------- Distributed scaling ----------")
+    print(
+        f"{'ranks':>5} {'thr/rank':>8} {'partition':>9} {'samples/s':>11} "
+        f"{'speedup':>8} {'efficiency':>10} {'loss':>8} {'AUC':>7}"
+    )
+    rate_1 = results[0].samples_per_s
+    for r in results:
+        speedup = r.samples_per_s / rate_1 if rate_1 else 0.0
+        print(
+            f"{r.world_size:>5} {r.threads_per_rank:>8} {r.partition:>9} "
+            f"{r.samples_per_s:>11,.0f} {speedup:>7.2f}x "
+            f"{speedup / r.world_size:>10.0%} {r.epoch_loss[-1]:>8.5f} {r.auc:>7.4f}"
+        )
@@ -0,0 +1,98 @@
+import multiprocessing as mp
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from neutrino.prep.config.split_config import SplitConfig
+from neutrino.prep.io.root_io import RootIO
+from neutrino.prep.io.threads import ThreadBudget, init_worker, worker_env
+from neutrino.prep.io.tree_reader import TreeReader
+from neutrino.prep.io.tree_ref import TreeRef
+
+MATMULS = 64  # total BLAS work, split evenly between the workers
+SIZE = 512
+
+
+def _matmuls(
+    n: int,
+) -> float:
+    """BLAS-bound work: n (SIZE x SIZE) float64 products."""
+
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((SIZE, SIZE))
+    t0 = time.perf_counter()
+    for _ in range(n):
+        a = a @ a
+        a /= np.abs(a).max()
+    return time.perf_counter() - t0
+
+
+def _blas_stage(
+    workers: int,
+    threads: int,
+) -> float:
+    """Wall time of MATMULS products on `workers` spawned processes."""
+
+    per_worker = [MATMULS // workers + (i < MATMULS % workers) for i in range(workers)]
+    ctx = mp.get_context("spawn")
+
+    with worker_env(threads), ProcessPoolExecutor(
+        max_workers=workers, mp_context=ctx, initializer=init_worker, initargs=(threads,)
+    ) as pool:
+        list(pool.map(_matmuls, [1] * workers))  # start + warm up every worker
+        t0 = time.perf_counter()
+        list(pool.map(_matmuls, per_worker))
+        return time.perf_counter() - t0
+
+
+def _read_stage(
+    reader: TreeReader,
+    branches: list[str],
+    workers: int,
+) -> float:
+    """Wall time of a cold parallel read + decompression of `branches`."""
+
+    reader.io.cache.clear()
+    t0 = time.perf_counter()
+    if workers == 1:
+        reader.read_multiple(branches)
+    else:
+        reader.read_parallel(branches, workers=workers)
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    # Usage: bench_threads.py [MAX_WORKERS]
+    base = ThreadBudget.from_config()
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else base.total_cores
+
+    curve = sorted({1, max_workers, *(2**k for k in range(8) if 2**k <= max_workers)})
+    branches = SplitConfig.load_config().target_branches
+
+    rows = []
+    with RootIO() as rio:
+        reader = TreeReader(TreeRef.load_ref(rio))
+
+        for workers in curve:
+            budget = ThreadBudget.from_config(workers)
+            read_s = _read_stage(reader, branches, workers)
+            shared_s = _blas_stage(workers, budget.threads_per_worker)
+            # Every worker sizing its pools from the whole machine
+            naive_s = _blas_stage(workers, budget.total_cores)
+            rows.append((workers, budget.threads_per_worker, read_s, shared_s, naive_s))
+
+    base.report()
+    print("---------- Thread scaling ----------")
+    print(
+        f"{'workers':>7} {'thr/wkr':>7} {'read s':>8} {'speedup':>8} "
+        f"{'BLAS s':>8} {'speedup':>8} {'naive s':>8} {'naive/budget':>12}"
+    )
+    read_1, blas_1 = rows[0][2], rows[0][3]
+    for workers, threads, read_s, shared_s, naive_s in rows:
+        print(
+            f"{workers:>7} {threads:>7} {read_s:>8.3f} {read_1 / read_s:>7.2f}x "
+            f"{shared_s:>8.3f} {blas_1 / shared_s:>7.2f}x {naive_s:>8.3f} "
+            f"{naive_s / shared_s:>11.2f}x"
+        )
@@ -0,0 +1,11 @@
+import sys
+
+from neutrino.prep.pipeline.split_cache import SplitCache
+
+dry_run: bool = "--dry-run" in sys.argv[1:]
+
+stale = SplitCache.collect_garbage("output", dry_run=dry_run)
+
+print(f"{'Would remove' if dry_run else 'Removed'} {len(stale)} stale split(s)")
+for path in stale:
+    print(path)
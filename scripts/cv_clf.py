@@ -0,0 +1,12 @@
+from neutrino.clf.config.feature_config import ClfFeatureConfig
+from neutrino.clf.cv import CrossValidator
+from neutrino.clf.prepare import TensorPair
+
+# Fold workers are spawned processes: keep the entry point importable
+if __name__ == "__main__":
+    features = ClfFeatureConfig.load_config().feature_order
+    pair = TensorPair.load_tensor().select(features)
+
+    cv = CrossValidator.from_pair(pair)
+    result = cv.run()
+    result.report()
@@ -0,0 +1,13 @@
+import sys
+
+from neutrino.clf.config.daemon_config import ClfDaemonConfig
+from neutrino.clf.dataset_daemon import DatasetDaemon
+
+# Optional: path to a daemon_config.json other than the default
+config = ClfDaemonConfig.load_config(sys.argv[1] if len(sys.argv) > 1 else None)
+
+daemon = DatasetDaemon(config)
+try:
+    daemon.serve_forever()
+except KeyboardInterrupt:
+    pass
@@ -0,0 +1,34 @@
+import sys
+
+import numpy as np
+
+from neutrino.clf.bundle import ModelBundle
+from neutrino.clf.config.serve_config import ClfServeConfig
+from neutrino.clf.evaluate import RocEvaluator
+from neutrino.clf.prepare import TensorPair
+from neutrino.clf.train import finite_rows
+
+# Optional: bundle directory (default: the one the scoring server uses)
+args = [a for a in sys.argv[1:] if not a.startswith("--")]
+bundle_dir = args[0] if args else ClfServeConfig.load_config().bundle_dir
+exact: bool = "--exact" in sys.argv[1:]
+
+bundle = ModelBundle.load(bundle_dir)
+
+pair = TensorPair.load_tensor().select(bundle.feature_order)
+_, _, X_val, y_val = pair.train_val_split(val_fraction=0.2, seed=0)
+
+X_np, y_np = X_val.numpy(), y_val.numpy()
+
+# Rows with a non-finite feature score NaN and cannot be ranked
+rows = finite_rows(X_np)
+print(f"skipped {len(X_np) - len(rows)} validation rows with non-finite features")
+
+# Score batch by batch; the evaluator only keeps per-class histograms
+evaluator = RocEvaluator(exact=exact)
+batch_size = 65536
+for start in range(0, len(rows), batch_size):
+    batch = rows[start : start + batch_size]
+    evaluator.update(bundle.score(X_np[batch]), y_np[batch])
+
+evaluator.report(np.linspace(0.1, 0.9, 9))
@@ -0,0 +1,15 @@
+import sys
+
+from neutrino.prep.io.root_io import RootIO
+from neutrino.prep.io.tree_ref import TreeRef
+from neutrino.prep.pipeline.data_sep import DataSep
+
+# Reader pools spawn workers, which re-import this module
+if __name__ == "__main__":
+    # Usage: python scripts/explain_split.py [flag|categories]
+    method: str = sys.argv[1] if len(sys.argv) > 1 else "flag"
+
+    with RootIO() as rio:
+        ref: TreeRef = TreeRef.load_ref(rio)
+        with DataSep(ref) as sep:
+            sep.explain(method)
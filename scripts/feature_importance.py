@@ -0,0 +1,19 @@
+import sys
+
+from neutrino.clf.bundle import ModelBundle
+from neutrino.clf.config.serve_config import ClfServeConfig
+from neutrino.clf.importance import PermutationImportance
+from neutrino.clf.prepare import TensorPair
+
+# Optional: bundle directory (default: the one the scoring server uses)
+args = [a for a in sys.argv[1:] if not a.startswith("--")]
+bundle_dir = args[0] if args else ClfServeConfig.load_config().bundle_dir
+
+bundle = ModelBundle.load(bundle_dir)
+
+pair = TensorPair.load_tensor().select(bundle.feature_order)
+_, _, X_val, y_val = pair.train_val_split(val_fraction=0.2, seed=0)
+
+engine = PermutationImportance.from_bundle(bundle, n_repeats=5)
+result = engine.run(X_val.numpy(), y_val.numpy())
+result.report()
@@ -0,0 +1,29 @@
+import sys
+
+from neutrino.prep.io.root_io import RootIO
+from neutrino.prep.io.tree_ref import TreeRef
+from neutrino.prep.pipeline.data_sep import DataSep
+
+# Reader pools spawn workers, which re-import this module
+if __name__ == "__main__":
+    # Usage: sample_tree.py [FRACTION or N_EVENTS] [--stratify] [--seed=N]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    stratify: bool = "--stratify" in sys.argv[1:]
+    seed = next(
+        (int(a.split("=", 1)[1]) for a in sys.argv[1:] if a.startswith("--seed=")), 0
+    )
+
+    size = float(args[0]) if args else 0.01
+    fraction = size if size < 1 else None
+    n_events = int(size) if size >= 1 else None
+
+    with RootIO() as rio:
+        ref: TreeRef = TreeRef.load_ref(rio)
+        with DataSep(ref) as sep:
+            result = sep.sample(
+                fraction=fraction, n_events=n_events, stratify=stratify, seed=seed
+            )
+
+            print("---------- Sampled branches ----------")
+            for name, arr in result.data.items():
+                print(f"{name}: {arr.shape}")
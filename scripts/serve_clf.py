@@ -0,0 +1,13 @@
+import sys
+
+from neutrino.clf.config.serve_config import ClfServeConfig
+from neutrino.clf.serve import ScoringServer
+
+# Optional: path to a serve_config.json other than the default
+config = ClfServeConfig.load_config(sys.argv[1] if len(sys.argv) > 1 else None)
+
+server = ScoringServer.from_config(config)
+try:
+    server.serve_forever()
+except KeyboardInterrupt:
+    pass
@@ -0,0 +1,28 @@
+import glob
+import sys
+
+from neutrino.prep.config.file_config import FileConfig
+from neutrino.prep.config.split_config import SplitConfig
+from neutrino.prep.pipeline.shard_set import ShardSet
+from neutrino.prep.pipeline.split_spec import SplitSpec
+
+# Reader pools spawn workers, which re-import this module
+if __name__ == "__main__":
+    # Usage: split_data_append.py [--rebuild] [--use-index] [ROOT files / globs ...]
+    # Without files, the file from file_config.json is used.
+    flags = {arg for arg in sys.argv[1:] if arg.startswith("--")}
+    patterns = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+
+    sources: list[str] = []
+    for pattern in patterns or [str(FileConfig.load_config().file_path)]:
+        sources.extend(sorted(glob.glob(pattern)) or [pattern])
+
+    config = SplitConfig.load_config()
+
+    # Every split from split_config.json "splits" grows its own shard set
+    for spec in SplitSpec.from_config(config):
+        shards = ShardSet(spec, config)
+        shards.update(
+            sources, use_index="--use-index" in flags, rebuild="--rebuild" in flags
+        )
+        shards.report()
@@ -1,12 +1,34 @@
+import sys
+
 from neutrino.prep.io.root_io import RootIO
 from neutrino.prep.io.tree_ref import TreeRef
 from neutrino.prep.pipeline.data_sep import DataSep
 from neutrino.prep.pipeline.data_pair import SplitPair
+from neutrino.prep.pipeline.dtype_plan import DtypePlan
+from neutrino.prep.pipeline.split_cache import SplitCache
 
+# Reader pools spawn workers, which re-import this module
+if __name__ == "__main__":
+    force: bool = "--force" in sys.argv[1:]
 
-with RootIO() as rio:
-    ref: TreeRef = TreeRef.load_ref(rio)
-    sep: DataSep = DataSep(ref)
+    with RootIO() as rio:
+        ref: TreeRef = TreeRef.load_ref(rio)
+        with DataSep(ref) as sep:
+            cache = SplitCache(
+                ref, sep.config, "split2/data", method="split_by_categories"
+            )
+            if force:
+                cache.invalidate()
 
-    pair: SplitPair = sep.split_by_categories()
-    pair.save_npy("split2/data")
\ No newline at end of file
+            if cache.is_valid():
+                print(f"split2 is up to date ({cache.manifest_path}), skipping.")
+            else:
+                pair: SplitPair = sep.split_by_categories()
+                plan = DtypePlan.from_config(sep.config, [pair.a, pair.b])
+                path_a, path_b, path_cols, _ = pair.save_npy(
+                    "split2/data",
+                    plan=plan,
+                    structured=sep.config.structured_output,
+                    memory_budget=sep.reader.config.memory_budget,
+                )
+                cache.record([path_a, path_b, path_cols])
@@ -0,0 +1,65 @@
+import sys
+
+from neutrino.prep.io.root_io import RootIO
+from neutrino.prep.io.tree_ref import TreeRef
+from neutrino.prep.pipeline.data_sep import DataSep
+from neutrino.prep.pipeline.dtype_plan import DtypePlan
+from neutrino.prep.pipeline.split_cache import SplitCache
+from neutrino.prep.pipeline.split_spec import SplitSpec
+
+# Reader pools spawn workers, which re-import this module
+if __name__ == "__main__":
+    force: bool = "--force" in sys.argv[1:]
+    use_index: bool = "--use-index" in sys.argv[1:]
+    # Write {prefix}.root (trees A, B) instead of .npy
+    to_root: bool = "--root" in sys.argv[1:]
+
+    with RootIO() as rio:
+        ref: TreeRef = TreeRef.load_ref(rio)
+        with DataSep(ref) as sep:
+            # Every split from split_config.json "splits", read in a single pass
+            specs = SplitSpec.from_config(sep.config)
+
+            caches: dict[str, SplitCache] = {}
+            todo: list[SplitSpec] = []
+
+            for spec in specs:
+                prefix = spec.out_prefix or f"{spec.name}/data"
+                cache = SplitCache(
+                    ref,
+                    sep.config,
+                    prefix,
+                    method=f"split_many:{spec.name}" + (":root" if to_root else ""),
+                    branches=spec.branches,
+                )
+                if force:
+                    cache.invalidate()
+
+                if cache.is_valid():
+                    print(
+                        f"{spec.name} is up to date ({cache.manifest_path}), skipping."
+                    )
+                else:
+                    caches[spec.name] = cache
+                    todo.append(spec)
+
+            if todo and to_root:
+                # Rows go to the ROOT files chunk by chunk, in their native dtypes
+                paths = sep.split_to_root(todo, use_index=use_index)
+                for spec in todo:
+                    caches[spec.name].record([paths[spec.name]])
+
+            elif todo:
+                # Keep one copy of the columns; each split is gathered while writing
+                pairs = sep.split_many(todo, use_index=use_index, lazy=True)
+
+                for spec in todo:
+                    pair = pairs[spec.name]
+                    plan = DtypePlan.from_config(sep.config, [pair.a, pair.b])
+                    path_a, path_b, path_cols, _ = pair.save_npy(
+                        spec.out_prefix or f"{spec.name}/data",
+                        plan=plan,
+                        structured=sep.config.structured_output,
+                        memory_budget=sep.reader.config.memory_budget,
+                    )
+                    caches[spec.name].record([path_a, path_b, path_cols])
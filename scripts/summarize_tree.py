@@ -0,0 +1,21 @@
+import sys
+
+from neutrino.prep.io.root_io import RootIO
+from neutrino.prep.io.tree_ref import TreeRef
+from neutrino.prep.io.tree_meta import TreeMeta
+
+# Reader pools spawn workers, which re-import this module
+if __name__ == "__main__":
+    # Usage: python scripts/summarize_tree.py [branch ...] [--refresh]
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    refresh: bool = "--refresh" in sys.argv[1:]
+
+    with RootIO() as rio:
+        ref: TreeRef = TreeRef.load_ref(rio)
+        meta: TreeMeta = TreeMeta(ref)
+
+        summaries = meta.summarize(args or None, refresh=refresh)
+
+        print(f"entries: {meta.get_num_entries()}")
+        for summary in summaries.values():
+            summary.report()
@@ -0,0 +1,27 @@
+import sys
+
+from neutrino.clf.config.feature_config import ClfFeatureConfig
+from neutrino.clf.config.io_config import ClfIoConfig
+from neutrino.clf.distributed import train_from_env, train_local
+
+# Usage:
+#   train_dist.py [RANKS]   local ranks (default: dist_config world_size)
+#   torchrun --nnodes N --nproc-per-node P --rdzv-endpoint HOST:PORT \
+#       scripts/train_dist.py --env   one rank per process, on every node
+# Ranks are spawned processes: keep the entry point importable
+if __name__ == "__main__":
+    features = ClfFeatureConfig.load_config().feature_order
+
+    if len(sys.argv) > 1 and sys.argv[1] == "--env":
+        result = train_from_env(features)
+    else:
+        result = train_local(features, int(sys.argv[1]) if len(sys.argv) > 1 else None)
+
+    # Only rank 0 holds the result
+    if result is not None:
+        result.report()
+
+        # The scoring server and optimizer default to <output_dir>/latest
+        out_dir = ClfIoConfig.load_config().output_dir / "latest"
+        result.bundle.save(out_dir)
+        print(f"Saved bundle to {out_dir}")
@@ -0,0 +1,26 @@
+from neutrino.clf.config.feature_config import ClfFeatureConfig
+from neutrino.clf.config.io_config import ClfIoConfig
+from neutrino.clf.config.model_config import ClfModelConfig
+from neutrino.clf.config.train_config import ClfTrainConfig
+from neutrino.clf.evaluate import RocEvaluator
+from neutrino.clf.prepare import TensorPair
+from neutrino.clf.train import finite_rows, train_mlp
+
+train_cfg = ClfTrainConfig.load_config()
+features = ClfFeatureConfig.load_config().feature_order
+
+pair = TensorPair.load_tensor().select(features)
+X_tr, y_tr, X_val, y_val = pair.train_val_split(train_cfg.val_fraction, train_cfg.seed)
+
+result = train_mlp(X_tr, y_tr, features, ClfModelConfig.load_config(), train_cfg)
+print(f"trained in {result.train_s:.1f} s")
+
+rows = finite_rows(X_val.numpy())
+evaluator = RocEvaluator()
+evaluator.update(result.bundle.score(X_val.numpy()[rows]), y_val.numpy()[rows])
+evaluator.report()
+
+# The scoring server and optimizer default to <output_dir>/latest
+out_dir = ClfIoConfig.load_config().output_dir / "latest"
+result.bundle.save(out_dir)
+print(f"Saved bundle to {out_dir}")
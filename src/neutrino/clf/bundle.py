@@ -0,0 +1,249 @@
+# src/neutrino/clf/bundle.py
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+import torch
+
+from neutrino.clf.model import MLPBCE
+
+
+@dataclass
+class StandardScaler:
+    """Per-feature (x - mean) / scale, fitted on training rows."""
+
+    mean: np.ndarray  # shape: [D], float32
+    scale: np.ndarray  # shape: [D], float32 (1 where a feature is constant)
+
+    @classmethod
+    def fit(
+        cls,
+        X: np.ndarray,
+        index: np.ndarray | None = None,
+        chunk_rows: int = 65536,
+    ) -> "StandardScaler":
+        """
+        Fit on the rows of `X` (or only `X[index]`), accumulating sums over
+        row chunks in float64 so no full-size copy of X is made.
+        """
+
+        return cls.from_moments(*cls.moments(X, index, chunk_rows))
+
+    @staticmethod
+    def moments(
+        X: np.ndarray,
+        index: np.ndarray | None = None,
+        chunk_rows: int = 65536,
+    ) -> tuple[int, np.ndarray, np.ndarray]:
+        """
+        (rows, per-feature sum, per-feature sum of squares) in float64.
+        Sums over disjoint row sets (e.g. distributed ranks) add up.
+        """
+
+        X = np.asarray(X)
+        n = len(X) if index is None else len(index)
+
+        total = np.zeros(X.shape[1], dtype=np.float64)
+        total_sq = np.zeros(X.shape[1], dtype=np.float64)
+
+        for start in range(0, n, chunk_rows):
+            if index is None:
+                rows = X[start : start + chunk_rows].astype(np.float64)
+            else:
+                rows = X[index[start : start + chunk_rows]].astype(np.float64)
+            total += rows.sum(axis=0)
+            total_sq += np.square(rows).sum(axis=0)
+
+        return n, total, total_sq
+
+    @classmethod
+    def from_moments(
+        cls,
+        n: int,
+        total: np.ndarray,
+        total_sq: np.ndarray,
+    ) -> "StandardScaler":
+
+        if n == 0:
+            raise ValueError("Cannot fit a scaler on zero rows")
+
+        mean = total / n
+        scale = np.sqrt(np.maximum(total_sq / n - np.square(mean), 0.0))
+        scale[scale == 0] = 1.0
+        return cls(mean=mean.astype(np.float32), scale=scale.astype(np.float32))
+
+    @classmethod
+    def identity(
+        cls,
+        dim: int,
+    ) -> "StandardScaler":
+        return cls(
+            mean=np.zeros(dim, dtype=np.float32),
+            scale=np.ones(dim, dtype=np.float32),
+        )
+
+    def transform(
+        self,
+        X: np.ndarray,
+    ) -> np.ndarray:
+        return ((np.asarray(X, dtype=np.float32) - self.mean) / self.scale).astype(
+            np.float32, copy=False
+        )
+
+    def to_dict(self) -> dict[str, list[float]]:
+        return {"mean": self.mean.tolist(), "scale": self.scale.tolist()}
+
+    @classmethod
+    def from_dict(
+        cls,
+        raw: Mapping[str, Sequence[float]],
+    ) -> "StandardScaler":
+        return cls(
+            mean=np.asarray(raw["mean"], dtype=np.float32),
+            scale=np.asarray(raw["scale"], dtype=np.float32),
+        )
+
+
+@dataclass
+class ModelBundle:
+    """
+    A trained MLPBCE together with everything needed to score raw events:
+    the feature order it was trained on and the fitted scaler.
+
+    On disk (one directory):
+    - model.pt    : state_dict of the network
+    - bundle.json : architecture, feature order and scaler
+    - model.<variant>.ts : optional optimized TorchScript exports
+      (see neutrino.clf.optimize), loaded with `load(..., variant=...)`
+    """
+
+    model: torch.nn.Module  # MLPBCE or an optimized TorchScript variant
+    feature_order: list[str]
+    scaler: StandardScaler
+    hidden_sizes: list[int]
+    dropout: float = 0.0
+    device: str = "cpu"
+    variant: str = "float"
+
+    MODEL_FILE = "model.pt"
+    META_FILE = "bundle.json"
+
+    @classmethod
+    def variant_path(
+        cls,
+        bundle_dir: Path | str,
+        variant: str,
+    ) -> Path:
+        return Path(bundle_dir) / f"model.{variant}.ts"
+
+    # ---------- persistence ----------
+    def save(
+        self,
+        out_dir: Path | str,
+    ) -> Path:
+        if self.variant != "float":
+            raise ValueError("Only the float model is saved; export variants instead")
+
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        torch.save(self.model.state_dict(), out_dir / self.MODEL_FILE)
+
+        meta: dict[str, Any] = {
+            "model_type": "torch_mlp_bce",
+            "in_dim": len(self.feature_order),
+            "hidden_sizes": list(self.hidden_sizes),
+            "dropout": float(self.dropout),
+            "feature_order": list(self.feature_order),
+            "scaler": self.scaler.to_dict(),
+        }
+        with open(out_dir / self.META_FILE, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=4)
+
+        return out_dir
+
+    @classmethod
+    def load(
+        cls,
+        bundle_dir: Path | str,
+        device: str = "cpu",
+        variant: str = "float",
+    ) -> "ModelBundle":
+        """
+        Rebuild the network in eval mode on `device`. Any `variant` other
+        than "float" loads the matching TorchScript export instead.
+        """
+
+        bundle_dir = Path(bundle_dir)
+
+        with open(bundle_dir / cls.META_FILE, "r", encoding="utf-8") as f:
+            meta: dict[str, Any] = json.load(f)
+
+        if meta.get("model_type") != "torch_mlp_bce":
+            raise ValueError(f"Unsupported model_type: {meta.get('model_type')!r}")
+
+        feature_order = [str(x) for x in meta["feature_order"]]
+        hidden = [int(h) for h in meta["hidden_sizes"]]
+        dropout = float(meta.get("dropout", 0.0))
+
+        model: torch.nn.Module
+        if variant == "float":
+            model = MLPBCE(
+                in_dim=int(meta["in_dim"]), hidden_sizes=hidden, dropout=dropout
+            )
+            state = torch.load(
+                bundle_dir / cls.MODEL_FILE, map_location=device, weights_only=True
+            )
+            model.load_state_dict(state)
+            model.to(device).eval()
+        else:
+            path = cls.variant_path(bundle_dir, variant)
+            if not path.is_file():
+                raise FileNotFoundError(f"No {variant!r} export at {path}")
+            model = torch.jit.load(str(path), map_location=device).eval()
+
+        return cls(
+            model=model,
+            feature_order=feature_order,
+            scaler=StandardScaler.from_dict(meta["scaler"]),
+            hidden_sizes=hidden,
+            dropout=dropout,
+            device=device,
+            variant=variant,
+        )
+
+    # ---------- scoring ----------
+    def features_from_records(
+        self,
+        events: Sequence[Mapping[str, float]],
+    ) -> np.ndarray:
+        """(N, D) matrix in the bundle's feature order from name → value rows."""
+
+        missing = [n for n in self.feature_order if events and n not in events[0]]
+        if missing:
+            raise ValueError(f"Events are missing features: {missing}")
+
+        return np.asarray(
+            [[ev[name] for name in self.feature_order] for ev in events],
+            dtype=np.float32,
+        ).reshape(len(events), len(self.feature_order))
+
+    @torch.inference_mode()
+    def score(
+        self,
+        X: np.ndarray,
+    ) -> np.ndarray:
+        """P(B | x) for raw (unscaled) rows in the bundle's feature order."""
+
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != len(self.feature_order):
+            raise ValueError(
+                f"Expected shape (N, {len(self.feature_order)}), got {X.shape}"
+            )
+
+        x = torch.from_numpy(self.scaler.transform(X)).to(self.device)
+        return torch.sigmoid(self.model(x)).cpu().numpy()
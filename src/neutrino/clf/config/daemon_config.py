@@ -0,0 +1,80 @@
+# src/neutrino/clf/config/daemon_config.py
+import json
+from pathlib import Path
+from typing import Any, ClassVar
+from dataclasses import dataclass
+
+from neutrino.prep.io.memory import parse_bytes
+
+
+@dataclass
+class ClfDaemonConfig:
+    """
+    Dataclass wrapper for the shared-memory dataset daemon configuration.
+
+    This loader handles JSON that specifies where the daemon listens, how
+    much shared memory its published datasets may use, and how long a
+    dataset without clients is kept before it is evicted.
+    """
+
+    # -------------------------------------------------------------------------
+    # Instance attributes (unique per config object)
+    # -------------------------------------------------------------------------
+    socket_path: Path  # Unix socket the daemon listens on
+    memory_cap: int | None  # Bytes of shared memory for all datasets (None → unlimited)
+    idle_timeout_s: float | None  # Evict datasets idle this long (None → only under the cap)
+    config_path: Path  # Path to the JSON file actually used
+
+    # -------------------------------------------------------------------------
+    # Class attributes (shared across all instances)
+    # -------------------------------------------------------------------------
+    DEFAULT_CONFIG_PATH: ClassVar[Path] = Path("configs") / "model" / "daemon_config.json"
+
+    # -------------------------------------------------------------------------
+    # Config loader
+    # -------------------------------------------------------------------------
+    @classmethod
+    def load_config(
+        cls,
+        path: Path | str | None = None,
+    ) -> "ClfDaemonConfig":
+        """
+        Load a ClfDaemonConfig instance from JSON.
+
+        Parameters
+        ----------
+        path : Path | str | None, optional
+            Path to a config JSON file. If None, uses DEFAULT_CONFIG_PATH.
+
+        Returns
+        -------
+        ClfDaemonConfig
+            Dataclass instance populated with config values.
+        """
+
+        # 1. Resolve path (either user-specified or default)
+        path = Path(path) if path else cls.DEFAULT_CONFIG_PATH
+
+        # 2. Load raw JSON dict
+        with open(path, "r", encoding="utf-8") as f:
+            raw: dict[str, Any] = json.load(f)
+
+        # 3. Parse fields explicitly
+
+        # Paths
+        socket_path: Path = Path(raw["socket_path"])
+
+        # Memory cap: bytes or a string like "4 GB"
+        memory_cap: int | None = parse_bytes(raw.get("memory_cap"))
+
+        # Idle eviction
+        raw_idle = raw.get("idle_timeout_s")
+        idle_timeout_s: float | None = None if raw_idle is None else float(raw_idle)
+
+        # 4. Construct dataclass and return
+        return cls(
+            socket_path=socket_path,
+            memory_cap=memory_cap,
+            idle_timeout_s=idle_timeout_s,
+            config_path=path,
+        )
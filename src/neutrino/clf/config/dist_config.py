@@ -0,0 +1,93 @@
+# src/neutrino/clf/config/dist_config.py
+import json
+from pathlib import Path
+from typing import Any, ClassVar
+from dataclasses import dataclass
+
+PARTITIONS = ("auto", "shards", "index")
+
+
+@dataclass
+class ClfDistConfig:
+    """
+    Dataclass wrapper for distributed (data-parallel) training configuration.
+
+    This loader handles JSON that specifies the torch.distributed backend,
+    where ranks rendezvous, how many ranks a local launch starts and how
+    the A/B data is divided between ranks.
+    """
+
+    # -------------------------------------------------------------------------
+    # Instance attributes (unique per config object)
+    # -------------------------------------------------------------------------
+    backend: str  # torch.distributed backend ("gloo" for CPU)
+    world_size: int  # Ranks started by a local launch
+    master_addr: str  # Host of rank 0 (rendezvous)
+    master_port: int  # TCP port of the rendezvous on master_addr
+    partition: str  # "shards", "index" or "auto" (shards if there are enough)
+    timeout_s: float  # Collective timeout before a stuck rank fails
+    config_path: Path  # Path to the JSON file actually used
+
+    # -------------------------------------------------------------------------
+    # Class attributes (shared across all instances)
+    # -------------------------------------------------------------------------
+    DEFAULT_CONFIG_PATH: ClassVar[Path] = Path("configs") / "model" / "dist_config.json"
+
+    # -------------------------------------------------------------------------
+    # Config loader
+    # -------------------------------------------------------------------------
+    @classmethod
+    def load_config(
+        cls,
+        path: Path | str | None = None,
+    ) -> "ClfDistConfig":
+        """
+        Load a ClfDistConfig instance from JSON.
+
+        Parameters
+        ----------
+        path : Path | str | None, optional
+            Path to a config JSON file. If None, uses DEFAULT_CONFIG_PATH.
+
+        Returns
+        -------
+        ClfDistConfig
+            Dataclass instance populated with config values.
+        """
+
+        # 1. Resolve path (either user-specified or default)
+        path = Path(path) if path else cls.DEFAULT_CONFIG_PATH
+
+        # 2. Load raw JSON dict
+        with open(path, "r", encoding="utf-8") as f:
+            raw: dict[str, Any] = json.load(f)
+
+        # 3. Parse fields explicitly
+
+        # Process group
+        backend: str = str(raw.get("backend", "gloo"))
+        world_size: int = int(raw.get("world_size", 1))
+        master_addr: str = str(raw.get("master_addr", "127.0.0.1"))
+        master_port: int = int(raw.get("master_port", 29500))
+        timeout_s: float = float(raw.get("timeout_s", 600))
+
+        # Data partitioning
+        partition: str = str(raw.get("partition", "auto"))
+
+        if world_size < 1:
+            raise ValueError(f"world_size must be >= 1, got {world_size}")
+        if partition not in PARTITIONS:
+            raise ValueError(
+                f"partition must be one of {PARTITIONS}, got {partition!r}"
+            )
+
+        # 4. Construct dataclass and return
+        return cls(
+            backend=backend,
+            world_size=world_size,
+            master_addr=master_addr,
+            master_port=master_port,
+            partition=partition,
+            timeout_s=timeout_s,
+            config_path=path,
+        )
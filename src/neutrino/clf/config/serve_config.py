@@ -0,0 +1,100 @@
+# src/neutrino/clf/config/serve_config.py
+import json
+from pathlib import Path
+from typing import Any, ClassVar
+from dataclasses import dataclass
+
+
+@dataclass
+class ClfServeConfig:
+    """
+    Dataclass wrapper for the scoring server configuration.
+
+    This loader handles JSON that specifies which trained model bundle to
+    serve, where to listen (localhost HTTP or a Unix socket) and how
+    concurrent requests are coalesced into batches.
+    """
+
+    # -------------------------------------------------------------------------
+    # Instance attributes (unique per config object)
+    # -------------------------------------------------------------------------
+    bundle_dir: Path  # Directory written by ModelBundle.save
+    variant: str  # "float" or an optimized export (e.g. "int8", "script")
+    host: str  # HTTP host (ignored when socket_path is set)
+    port: int  # HTTP port (ignored when socket_path is set)
+    socket_path: Path | None  # Unix socket to listen on instead of TCP
+    max_batch_rows: int  # Upper bound on rows per forward pass
+    max_latency_ms: float  # How long a request may wait for others to join
+    device: str  # torch device for the model (e.g. "cpu", "cuda")
+    config_path: Path  # Path to the JSON file actually used
+
+    # -------------------------------------------------------------------------
+    # Class attributes (shared across all instances)
+    # -------------------------------------------------------------------------
+    DEFAULT_CONFIG_PATH: ClassVar[Path] = Path("configs") / "model" / "serve_config.json"
+
+    # -------------------------------------------------------------------------
+    # Config loader
+    # -------------------------------------------------------------------------
+    @classmethod
+    def load_config(
+        cls,
+        path: Path | str | None = None,
+    ) -> "ClfServeConfig":
+        """
+        Load a ClfServeConfig instance from JSON.
+
+        Parameters
+        ----------
+        path : Path | str | None, optional
+            Path to a config JSON file. If None, uses DEFAULT_CONFIG_PATH.
+
+        Returns
+        -------
+        ClfServeConfig
+            Dataclass instance populated with config values.
+        """
+
+        # 1. Resolve path (either user-specified or default)
+        path = Path(path) if path else cls.DEFAULT_CONFIG_PATH
+
+        # 2. Load raw JSON dict
+        with open(path, "r", encoding="utf-8") as f:
+            raw: dict[str, Any] = json.load(f)
+
+        # 3. Parse fields explicitly
+
+        # Paths
+        bundle_dir: Path = Path(raw["bundle_dir"])
+        raw_socket = raw.get("socket_path")
+        socket_path: Path | None = None if raw_socket is None else Path(raw_socket)
+
+        # Which export of the bundle to serve
+        variant: str = str(raw.get("variant", "float"))
+
+        # Listening address
+        host: str = str(raw.get("host", "127.0.0.1"))
+        port: int = int(raw.get("port", 8765))
+
+        # Batching
+        max_batch_rows: int = int(raw.get("max_batch_rows", 8192))
+        max_latency_ms: float = float(raw.get("max_latency_ms", 5.0))
+        if max_batch_rows < 1:
+            raise ValueError(f"max_batch_rows must be >= 1, got {max_batch_rows}")
+        if max_latency_ms < 0:
+            raise ValueError(f"max_latency_ms must be >= 0, got {max_latency_ms}")
+
+        device: str = str(raw.get("device", "cpu"))
+
+        # 4. Construct dataclass and return
+        return cls(
+            bundle_dir=bundle_dir,
+            variant=variant,
+            host=host,
+            port=port,
+            socket_path=socket_path,
+            max_batch_rows=max_batch_rows,
+            max_latency_ms=max_latency_ms,
+            device=device,
+            config_path=path,
+        )
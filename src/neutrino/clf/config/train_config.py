@@ -0,0 +1,99 @@
+# src/neutrino/clf/config/train_config.py
+import json
+from pathlib import Path
+from typing import Any, ClassVar
+from dataclasses import dataclass
+
+
+@dataclass
+class ClfTrainConfig:
+    """
+    Dataclass wrapper for classifier training configuration.
+
+    This loader handles JSON that specifies the optimisation settings for
+    MLPBCE (epochs, batch size, learning rate), the held-out validation
+    fraction and how k-fold cross-validation is run in parallel.
+    """
+
+    # -------------------------------------------------------------------------
+    # Instance attributes (unique per config object)
+    # -------------------------------------------------------------------------
+    epochs: int  # Passes over the training rows
+    batch_size: int  # Rows per optimisation step
+    lr: float  # Adam learning rate
+    weight_decay: float  # Adam weight decay
+    val_fraction: float  # Held-out fraction for TensorPair.train_val_split
+    seed: int  # Seed for shuffling, fold assignment and initialisation
+    n_folds: int  # k for k-fold cross-validation
+    cv_workers: int  # Fold worker processes run at once
+    threads: int | None  # Total threads shared by all CV workers (None → resource_config)
+    config_path: Path  # Path to the JSON file actually used
+
+    # -------------------------------------------------------------------------
+    # Class attributes (shared across all instances)
+    # -------------------------------------------------------------------------
+    DEFAULT_CONFIG_PATH: ClassVar[Path] = Path("configs") / "model" / "train_config.json"
+
+    # -------------------------------------------------------------------------
+    # Config loader
+    # -------------------------------------------------------------------------
+    @classmethod
+    def load_config(
+        cls,
+        path: Path | str | None = None,
+    ) -> "ClfTrainConfig":
+        """
+        Load a ClfTrainConfig instance from JSON.
+
+        Parameters
+        ----------
+        path : Path | str | None, optional
+            Path to a config JSON file. If None, uses DEFAULT_CONFIG_PATH.
+
+        Returns
+        -------
+        ClfTrainConfig
+            Dataclass instance populated with config values.
+        """
+
+        # 1. Resolve path (either user-specified or default)
+        path = Path(path) if path else cls.DEFAULT_CONFIG_PATH
+
+        # 2. Load raw JSON dict
+        with open(path, "r", encoding="utf-8") as f:
+            raw: dict[str, Any] = json.load(f)
+
+        # 3. Parse fields explicitly
+
+        # Optimisation
+        epochs: int = int(raw["epochs"])
+        batch_size: int = int(raw["batch_size"])
+        lr: float = float(raw["lr"])
+        weight_decay: float = float(raw.get("weight_decay", 0.0))
+
+        # Validation / reproducibility
+        val_fraction: float = float(raw.get("val_fraction", 0.2))
+        seed: int = int(raw.get("seed", 0))
+
+        # Cross-validation
+        n_folds: int = int(raw.get("n_folds", 5))
+        cv_workers: int = int(raw.get("cv_workers", 1))
+        raw_threads = raw.get("threads")
+        threads: int | None = None if raw_threads is None else int(raw_threads)
+
+        if n_folds < 2:
+            raise ValueError(f"n_folds must be >= 2, got {n_folds}")
+
+        # 4. Construct dataclass and return
+        return cls(
+            epochs=epochs,
+            batch_size=batch_size,
+            lr=lr,
+            weight_decay=weight_decay,
+            val_fraction=val_fraction,
+            seed=seed,
+            n_folds=n_folds,
+            cv_workers=cv_workers,
+            threads=threads,
+            config_path=path,
+        )
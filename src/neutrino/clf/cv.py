@@ -0,0 +1,231 @@
+# src/neutrino/clf/cv.py
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, List
+
+import numpy as np
+import torch
+import torch.multiprocessing as mp
+
+from neutrino.clf.config.model_config import ClfModelConfig
+from neutrino.clf.config.train_config import ClfTrainConfig
+from neutrino.clf.evaluate import RocEvaluator
+from neutrino.clf.prepare import TensorPair
+from neutrino.clf.train import finite_rows, train_mlp
+from neutrino.prep.io.memory import peak_rss_bytes
+from neutrino.prep.io.threads import ThreadBudget, apply_threads, worker_env
+
+# Per-process state of a fold worker, set once by _init_worker
+_WORKER: dict[str, Any] = {}
+
+
+@dataclass
+class FoldResult:
+    fold: int
+    n_train: int
+    n_val: int
+    auc: float
+    val_loss: float
+    train_s: float
+    eval_s: float
+    peak_rss: int | None  # bytes, of the worker process
+
+
+@dataclass
+class CVResult:
+    folds: List[FoldResult]
+    wall_s: float
+    workers: int
+    threads_per_worker: int
+    data_bytes: int  # size of the shared X + y (held once)
+
+    @property
+    def aucs(self) -> np.ndarray:
+        return np.array([f.auc for f in self.folds])
+
+    def report(self) -> None:
+        mb = 1024**2
+        print("---------- Cross-validation ----------")
+        print(
+            f"{len(self.folds)} folds, {self.workers} workers x "
+            f"{self.threads_per_worker} threads, shared data {self.data_bytes / mb:.1f} MB"
+        )
+        print(
+            f"{'fold':>4} {'train':>9} {'val':>8} {'AUC':>8} {'loss':>8} "
+            f"{'train s':>8} {'eval s':>7} {'peak RSS':>9}"
+        )
+        for f in self.folds:
+            rss = "n/a" if f.peak_rss is None else f"{f.peak_rss / mb:.0f} MB"
+            print(
+                f"{f.fold:>4} {f.n_train:>9} {f.n_val:>8} {f.auc:>8.4f} "
+                f"{f.val_loss:>8.4f} {f.train_s:>8.2f} {f.eval_s:>7.2f} {rss:>9}"
+            )
+        print(f"AUC: {self.aucs.mean():.4f} ± {self.aucs.std():.4f}")
+        print(
+            f"wall time: {self.wall_s:.2f} s "
+            f"(fold time summed: {sum(f.train_s + f.eval_s for f in self.folds):.2f} s)"
+        )
+
+
+def _init_worker(
+    X: torch.Tensor,
+    y: torch.Tensor,
+    fold_id: torch.Tensor,
+    feature_order: List[str],
+    model_cfg: ClfModelConfig,
+    train_cfg: ClfTrainConfig,
+    threads: int,
+) -> None:
+    """Runs once per worker: X, y and fold_id arrive as shared-memory handles."""
+
+    # torch intra-op and BLAS / OpenMP pools sized to this worker's share
+    apply_threads(threads)
+    _WORKER.update(
+        X=X,
+        y=y,
+        fold_id=fold_id,
+        feature_order=feature_order,
+        model_cfg=model_cfg,
+        train_cfg=train_cfg,
+    )
+
+
+def _run_fold(
+    fold: int,
+) -> FoldResult:
+    """Train on every fold but `fold`, validate on `fold` (indices only)."""
+
+    X: torch.Tensor = _WORKER["X"]
+    y: torch.Tensor = _WORKER["y"]
+    fold_id = _WORKER["fold_id"].numpy()
+
+    train_idx = np.flatnonzero(fold_id != fold)
+    # Non-finite rows cannot be scored
+    val_idx = finite_rows(X.numpy(), np.flatnonzero(fold_id == fold))
+
+    result = train_mlp(
+        X,
+        y,
+        _WORKER["feature_order"],
+        _WORKER["model_cfg"],
+        _WORKER["train_cfg"],
+        train_idx=train_idx,
+        verbose=False,
+    )
+
+    # Validate in batches straight from the shared tensors
+    t0 = time.perf_counter()
+    bundle = result.bundle
+    evaluator = RocEvaluator()
+    loss_sum = 0.0
+    batch = 65536
+
+    for start in range(0, len(val_idx), batch):
+        rows = val_idx[start : start + batch]
+        scores = bundle.score(X[rows].numpy())
+        labels = y[rows].numpy()
+        evaluator.update(scores, labels)
+
+        p = np.clip(scores, 1e-7, 1 - 1e-7)
+        loss_sum += float(-(labels * np.log(p) + (1 - labels) * np.log(1 - p)).sum())
+
+    return FoldResult(
+        fold=fold,
+        n_train=result.n_train,
+        n_val=len(val_idx),
+        auc=evaluator.auc(),
+        val_loss=loss_sum / max(len(val_idx), 1),
+        train_s=result.train_s,
+        eval_s=time.perf_counter() - t0,
+        peak_rss=peak_rss_bytes(),
+    )
+
+
+class CrossValidator:
+    """
+    k-fold cross-validation of MLPBCE with the data held once.
+
+    X and y are moved into shared memory and handed to every worker
+    process when it starts; a task is just a fold number, and each worker
+    derives its train/validation rows from a shared fold-id vector. The
+    configured thread budget is split evenly between the workers.
+    """
+
+    def __init__(
+        self,
+        X: torch.Tensor,
+        y: torch.Tensor,
+        feature_order: List[str],
+        model_cfg: ClfModelConfig | None = None,
+        train_cfg: ClfTrainConfig | None = None,
+    ) -> None:
+
+        self.model_cfg = model_cfg or ClfModelConfig.load_config()
+        self.train_cfg = train_cfg or ClfTrainConfig.load_config()
+        self.feature_order = list(feature_order)
+
+        # One copy of the data for every fold worker
+        self.X = X.contiguous().float().share_memory_()
+        self.y = y.contiguous().float().share_memory_()
+        self.fold_id = self.assign_folds(
+            len(self.X), self.train_cfg.n_folds, self.train_cfg.seed
+        ).share_memory_()
+
+    @classmethod
+    def from_pair(
+        cls,
+        pair: TensorPair,
+        **kwargs: Any,
+    ) -> "CrossValidator":
+        X, y = pair.to_xy()
+        return cls(X, y, pair.columns, **kwargs)
+
+    @staticmethod
+    def assign_folds(
+        n_rows: int,
+        n_folds: int,
+        seed: int = 0,
+    ) -> torch.Tensor:
+        """Shuffled, near-equal fold number per row (int8)."""
+
+        gen = torch.Generator().manual_seed(seed)
+        fold_id = torch.empty(n_rows, dtype=torch.int8)
+        fold_id[torch.randperm(n_rows, generator=gen)] = (
+            torch.arange(n_rows) % n_folds
+        ).to(torch.int8)
+        return fold_id
+
+    def run(self) -> CVResult:
+        n_folds = self.train_cfg.n_folds
+        workers = max(1, min(self.train_cfg.cv_workers, n_folds))
+        # train_config "threads" overrides the package-wide core budget
+        budget = ThreadBudget.from_config(workers, total_cores=self.train_cfg.threads)
+        threads = budget.threads_per_worker
+
+        t0 = time.perf_counter()
+
+        ctx = mp.get_context("spawn")
+        with worker_env(threads), ctx.Pool(
+            processes=workers,
+            initializer=_init_worker,
+            initargs=(
+                self.X,
+                self.y,
+                self.fold_id,
+                self.feature_order,
+                self.model_cfg,
+                self.train_cfg,
+                threads,
+            ),
+        ) as pool:
+            folds = pool.map(_run_fold, range(n_folds), chunksize=1)
+
+        return CVResult(
+            folds=folds,
+            wall_s=time.perf_counter() - t0,
+            workers=workers,
+            threads_per_worker=threads,
+            data_bytes=self.X.nbytes + self.y.nbytes,
+        )
@@ -0,0 +1,468 @@
+# src/neutrino/clf/dataset_daemon.py
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from neutrino.clf.config.daemon_config import ClfDaemonConfig
+
+_MB = 1024**2
+
+
+def _attach_segment(name: str) -> shared_memory.SharedMemory:
+    """
+    Open an existing segment without taking ownership of it: only the
+    daemon may unlink it when the client process exits.
+    """
+
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        except Exception:
+            pass
+        return shm
+
+
+@dataclass
+class _Published:
+    """One split held by the daemon: A and B as float32 matrices."""
+
+    key: str
+    source: dict[str, Any]  # files + their size / mtime when published
+    columns: list[str]
+    segments: dict[str, shared_memory.SharedMemory]
+    shapes: dict[str, tuple[int, int]]
+    refs: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(shm.size for shm in self.segments.values())
+
+    def descriptor(self) -> dict[str, Any]:
+        return {
+            "dataset": self.key,
+            "columns": self.columns,
+            "segments": {
+                side: {
+                    "name": shm.name,
+                    "shape": list(self.shapes[side]),
+                    "dtype": "<f4",
+                }
+                for side, shm in self.segments.items()
+            },
+        }
+
+    def release(self) -> None:
+        for shm in self.segments.values():
+            shm.close()
+            shm.unlink()
+
+
+class DatasetDaemon:
+    """
+    Publish prepared A/B splits into named shared memory for every local
+    consumer.
+
+    Protocol: one JSON object per line over a Unix socket.
+    - {"op": "attach", "split_dir": ..., "prefix": "data",
+       "a_suffix": "_A.npy", "b_suffix": "_B.npy",
+       "columns_filename": "data_columns.txt"}
+        → {"ok": true, "dataset": key, "columns": [...],
+           "segments": {"A": {"name", "shape", "dtype"}, "B": {...}}}
+    - {"op": "detach", "dataset": key} → {"ok": true}
+    - {"op": "list"} → {"ok": true, "datasets": [...], "used_bytes": ...}
+
+    A split is loaded once (as float32, the layout TensorPair uses) and
+    shared by every client. Each connection's attachments are reference
+    counted and released when it detaches or disconnects. Datasets without
+    clients are evicted least-recently-used first when a new one would
+    exceed the memory cap, or once idle for `idle_timeout_s`. A split
+    whose files changed on disk is republished under a new key.
+    """
+
+    def __init__(
+        self,
+        config: ClfDaemonConfig | None = None,
+    ) -> None:
+
+        self.config = config or ClfDaemonConfig.load_config()
+        self.datasets: dict[str, _Published] = {}
+        # Splits being loaded (outside the lock): done event, reserved bytes
+        self._publishing: dict[str, tuple[threading.Event, int]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._server: socketserver.UnixStreamServer | None = None
+
+    # ---------- datasets ----------
+    @staticmethod
+    def _source(request: dict[str, Any]) -> dict[str, Any]:
+        split_dir = Path(request["split_dir"]).resolve()
+        prefix = str(request.get("prefix", "data"))
+        files = {
+            "A": split_dir / f"{prefix}{request.get('a_suffix', '_A.npy')}",
+            "B": split_dir / f"{prefix}{request.get('b_suffix', '_B.npy')}",
+            "columns": split_dir
+            / str(request.get("columns_filename", f"{prefix}_columns.txt")),
+        }
+
+        source: dict[str, Any] = {}
+        for role, path in files.items():
+            st = path.stat()  # FileNotFoundError → reported to the client
+            source[role] = {"path": str(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        return source
+
+    @staticmethod
+    def _key(source: dict[str, Any]) -> str:
+        blob = json.dumps(source, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(blob).hexdigest()[:16]
+
+    @staticmethod
+    def _load_into(
+        path: str,
+        dst: np.ndarray,
+    ) -> None:
+        """Cast a saved split into `dst` column by column, with no full copy."""
+
+        arr = np.load(path, mmap_mode="r")
+        if arr.dtype.names is None:
+            for j in range(arr.shape[1]):
+                dst[:, j] = arr[:, j]
+            return
+
+        for j, name in enumerate(arr.dtype.names):
+            dst[:, j] = arr[name]
+
+    def _evict_idle(
+        self,
+        need: int,
+    ) -> None:
+        """Drop idle datasets (LRU first) until `need` more bytes fit the cap."""
+
+        cap = self.config.memory_cap
+        if cap is None:
+            return
+
+        used = sum(d.nbytes for d in self.datasets.values())
+        used += sum(need for _, need in self._publishing.values())
+        idle = sorted(
+            (d for d in self.datasets.values() if d.refs == 0),
+            key=lambda d: d.last_used,
+        )
+        for d in idle:
+            if used + need <= cap:
+                break
+            used -= d.nbytes
+            self._drop(d.key, "memory cap")
+
+        if used + need > cap:
+            raise MemoryError(
+                f"Dataset needs {need / _MB:.1f} MB but only "
+                f"{(cap - used) / _MB:.1f} MB of the {cap / _MB:.1f} MB cap is free"
+            )
+
+    def _drop(
+        self,
+        key: str,
+        reason: str,
+    ) -> None:
+        d = self.datasets.pop(key)
+        d.release()
+        print(f"evicted {key} ({d.nbytes / _MB:.1f} MB, {reason})")
+
+    def _publish(
+        self,
+        key: str,
+        source: dict[str, Any],
+    ) -> _Published:
+        columns = [
+            ln.strip()
+            for ln in Path(source["columns"]["path"]).read_text(encoding="utf-8").splitlines()
+            if ln.strip()
+        ]
+
+        segments: dict[str, shared_memory.SharedMemory] = {}
+        shapes: dict[str, tuple[int, int]] = {}
+
+        try:
+            for side in ("A", "B"):
+                arr = np.load(source[side]["path"], mmap_mode="r")
+                n_cols = len(arr.dtype.names) if arr.dtype.names else arr.shape[1]
+                shape = (int(arr.shape[0]), int(n_cols))
+
+                shm = shared_memory.SharedMemory(
+                    name=f"nu_{key}_{side}",
+                    create=True,
+                    size=max(1, shape[0] * shape[1] * 4),
+                )
+                segments[side] = shm
+                dst = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+                self._load_into(source[side]["path"], dst)
+                shapes[side] = shape
+        except BaseException:
+            for shm in segments.values():
+                shm.close()
+                shm.unlink()
+            raise
+
+        return _Published(key, source, columns, segments, shapes)
+
+    def attach(
+        self,
+        request: dict[str, Any],
+    ) -> _Published:
+        source = self._source(request)
+        key = self._key(source)
+
+        # Loading runs outside the lock so other clients and the reaper are
+        # not blocked; concurrent attaches of the same split wait for it.
+        while True:
+            with self._lock:
+                d = self.datasets.get(key)
+                if d is not None:
+                    d.refs += 1
+                    d.last_used = time.monotonic()
+                    return d
+
+                pending = self._publishing.get(key)
+                if pending is None:
+                    need = sum(
+                        _npy_matrix_bytes(source[side]["path"]) for side in ("A", "B")
+                    )
+                    self._evict_idle(need)
+                    done = threading.Event()
+                    self._publishing[key] = (done, need)
+                    break
+
+            # Published meanwhile, or failed (then this client retries)
+            pending[0].wait()
+
+        try:
+            d = self._publish(key, source)
+        except BaseException:
+            with self._lock:
+                del self._publishing[key]
+            done.set()
+            raise
+
+        # Swap the placeholder for the dataset in one step, then wake waiters
+        with self._lock:
+            del self._publishing[key]
+            self.datasets[key] = d
+            d.refs += 1
+            d.last_used = time.monotonic()
+        done.set()
+
+        print(f"published {key} ({d.nbytes / _MB:.1f} MB) from {source['A']['path']}")
+        return d
+
+    def detach(
+        self,
+        key: str,
+    ) -> None:
+        with self._lock:
+            d = self.datasets.get(key)
+            if d is not None and d.refs > 0:
+                d.refs -= 1
+                d.last_used = time.monotonic()
+
+    def listing(self) -> dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "datasets": [
+                    {
+                        "dataset": d.key,
+                        "path": d.source["A"]["path"],
+                        "bytes": d.nbytes,
+                        "refs": d.refs,
+                        "idle_s": 0.0 if d.refs else now - d.last_used,
+                    }
+                    for d in self.datasets.values()
+                ],
+                "used_bytes": sum(d.nbytes for d in self.datasets.values()),
+                "memory_cap": self.config.memory_cap,
+            }
+
+    def _reap(self) -> None:
+        """Evict datasets that have had no clients for idle_timeout_s."""
+
+        timeout = self.config.idle_timeout_s
+        if timeout is None:
+            return
+
+        while not self._stop.wait(min(timeout, 30.0)):
+            with self._lock:
+                now = time.monotonic()
+                for d in list(self.datasets.values()):
+                    if d.refs == 0 and now - d.last_used > timeout:
+                        self._drop(d.key, "idle")
+
+    # ---------- server ----------
+    def serve_forever(self) -> None:
+        path = self.config.socket_path
+        Path(path).unlink(missing_ok=True)
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                held: list[str] = []  # this connection's attachments
+                try:
+                    for line in self.rfile:
+                        reply = daemon._dispatch(line, held)
+                        self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+                finally:
+                    for key in held:
+                        daemon.detach(key)
+
+        class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+        self._server = Server(str(path), Handler)
+        os.chmod(path, 0o600)
+        reaper = threading.Thread(target=self._reap, daemon=True)
+        reaper.start()
+
+        print(f"dataset daemon listening on {path}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self.close()
+
+    def _dispatch(
+        self,
+        line: bytes,
+        held: list[str],
+    ) -> dict[str, Any]:
+        try:
+            request: dict[str, Any] = json.loads(line)
+            op = request.get("op")
+
+            if op == "attach":
+                d = self.attach(request)
+                held.append(d.key)
+                return {"ok": True, **d.descriptor()}
+            if op == "detach":
+                key = str(request["dataset"])
+                if key in held:
+                    held.remove(key)
+                    self.detach(key)
+                return {"ok": True}
+            if op == "list":
+                return {"ok": True, **self.listing()}
+
+            return {"ok": False, "error": f"unknown op {op!r}"}
+        except (OSError, ValueError, KeyError, MemoryError) as exc:
+            return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+
+    def shutdown(self) -> None:
+        """Stop serve_forever (call from another thread)."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            Path(self.config.socket_path).unlink(missing_ok=True)
+
+        with self._lock:
+            for key in list(self.datasets):
+                self._drop(key, "shutdown")
+
+
+def _npy_matrix_bytes(path: str) -> int:
+    """float32 bytes of the (N, D) matrix a saved split becomes."""
+
+    arr = np.load(path, mmap_mode="r")
+    n_cols = len(arr.dtype.names) if arr.dtype.names else arr.shape[1]
+    return int(arr.shape[0]) * int(n_cols) * 4
+
+
+class SharedDataset:
+    """
+    A client's zero-copy view of one published split.
+
+    Keeps the daemon connection open while attached (that is what holds
+    the reference); `close` detaches.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path | str,
+        request: dict[str, Any],
+    ) -> None:
+
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.connect(str(socket_path))
+        self._file = self._sock.makefile("rwb")
+
+        reply = self._call({"op": "attach", **request})
+        self.key: str = reply["dataset"]
+        self.columns: list[str] = list(reply["columns"])
+
+        self._segments: dict[str, shared_memory.SharedMemory] = {}
+        self.arrays: dict[str, np.ndarray] = {}
+        for side, desc in reply["segments"].items():
+            shm = _attach_segment(desc["name"])
+            self._segments[side] = shm
+            self.arrays[side] = np.ndarray(
+                tuple(desc["shape"]), dtype=np.dtype(desc["dtype"]), buffer=shm.buf
+            )
+
+    def _call(
+        self,
+        request: dict[str, Any],
+    ) -> dict[str, Any]:
+        self._file.write((json.dumps(request) + "\n").encode("utf-8"))
+        self._file.flush()
+        reply: dict[str, Any] = json.loads(self._file.readline() or b"{}")
+        if not reply.get("ok"):
+            raise RuntimeError(f"dataset daemon: {reply.get('error', 'no reply')}")
+        return reply
+
+    def close(self) -> None:
+        """Detach; arrays (and tensors built on them) must not be used after."""
+
+        if self._sock is None:
+            return
+
+        self.arrays.clear()
+        for shm in self._segments.values():
+            try:
+                shm.close()
+            except BufferError:
+                pass  # a live view still exists; the OS unmaps at exit
+        self._segments.clear()
+
+        try:
+            self._call({"op": "detach", "dataset": self.key})
+        except (OSError, RuntimeError):
+            pass
+        self._file.close()
+        self._sock.close()
+        self._sock = None  # type: ignore[assignment]
+
+    def __enter__(self) -> "SharedDataset":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
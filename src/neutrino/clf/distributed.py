@@ -0,0 +1,425 @@
+# src/neutrino/clf/distributed.py
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
+import torch.nn as nn
+from torch.nn.parallel import DistributedDataParallel
+
+from neutrino.clf.bundle import ModelBundle, StandardScaler
+from neutrino.clf.config.dist_config import ClfDistConfig
+from neutrino.clf.config.model_config import ClfModelConfig
+from neutrino.clf.config.train_config import ClfTrainConfig
+from neutrino.clf.evaluate import RocEvaluator
+from neutrino.clf.model import MLPBCE
+from neutrino.clf.prepare import TensorPair
+from neutrino.clf.train import finite_rows, make_bundle
+from neutrino.prep.io.threads import ThreadBudget, apply_threads, worker_env
+
+RESULT_FILE = "rank0_result.pt"
+
+
+@dataclass
+class DistResult:
+    bundle: ModelBundle  # trained model (rank 0's copy) + feature order + scaler
+    world_size: int
+    partition: str  # "shards" or "index"
+    threads_per_rank: int
+    epoch_loss: List[float] = field(default_factory=list)  # mean BCE over all ranks
+    train_s: float = 0.0  # training loop only (data loading excluded)
+    n_train: int = 0  # distinct training rows over all ranks
+    samples: int = 0  # rows stepped over, all ranks and epochs (incl. wrap-around)
+    n_val: int = 0
+    auc: float = float("nan")
+
+    @property
+    def samples_per_s(self) -> float:
+        return self.samples / self.train_s if self.train_s > 0 else 0.0
+
+    def report(self) -> None:
+        print("---------- Distributed training ----------")
+        print(
+            f"{self.world_size} ranks x {self.threads_per_rank} threads, "
+            f"{self.partition} partition"
+        )
+        print(f"rows: {self.n_train} train, {self.n_val} validation")
+        print("loss per epoch: " + " ".join(f"{loss:.5f}" for loss in self.epoch_loss))
+        print(f"train time: {self.train_s:.2f} s ({self.samples_per_s:,.0f} samples/s)")
+        print(f"validation AUC: {self.auc:.4f}")
+
+
+def _holdout(
+    n_rows: int,
+    val_fraction: float,
+    seed: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """(train rows, validation rows): the same cut as TensorPair.train_val_split."""
+
+    gen = torch.Generator().manual_seed(seed)
+    perm = torch.randperm(n_rows, generator=gen).numpy()
+    n_val = max(1, int(round(n_rows * val_fraction)))
+    return perm[n_val:], perm[:n_val]
+
+
+class _RankData:
+    """
+    The rows one rank trains and validates on.
+
+    "shards": the rank loads only its own shards of an appended split
+    (every world_size-th one) and shuffles its rows locally.
+    "index": every rank loads the whole split, the train/validation cut
+    is the same everywhere, and each epoch one shared permutation of the
+    training rows is dealt out round-robin (as DistributedSampler does),
+    so ranks see different rows every epoch.
+    """
+
+    def __init__(
+        self,
+        rank: int,
+        world_size: int,
+        features: List[str],
+        dist_cfg: ClfDistConfig,
+        train_cfg: ClfTrainConfig,
+    ) -> None:
+
+        self.rank = rank
+        self.world_size = world_size
+
+        pair: TensorPair | None = None
+        if dist_cfg.partition in ("auto", "shards"):
+            pair = TensorPair.load_shards(rank, world_size)
+            if pair is None and dist_cfg.partition == "shards":
+                raise RuntimeError(
+                    f"partition 'shards' needs an appended split with at least "
+                    f"{world_size} shards"
+                )
+
+        if pair is not None:
+            self.partition = "shards"
+            # Rank-local cut: the rank's rows are its own
+            seed = train_cfg.seed + rank
+        else:
+            self.partition = "index"
+            pair = TensorPair.load_tensor()
+            seed = train_cfg.seed
+
+        self.X, self.y = pair.select(features).to_xy()
+        X_np = self.X.numpy()
+
+        train, val = _holdout(len(self.X), train_cfg.val_fraction, seed)
+        if self.partition == "index":
+            val = val[rank::world_size]
+
+        # NaN / inf rows would poison the scaler and the loss: skip them
+        self.train = finite_rows(X_np, np.sort(train))
+        self.val = finite_rows(X_np, np.sort(val))
+        if len(self.train) == 0:
+            raise RuntimeError(f"Rank {rank} has no finite training rows")
+
+        # Same generator state on every rank ("index") or one stream per rank
+        self.gen = torch.Generator().manual_seed(seed)
+
+    @property
+    def own_train(self) -> np.ndarray:
+        """Training rows only this rank counts (for the scaler fit)."""
+
+        if self.partition == "index":
+            return self.train[self.rank :: self.world_size]
+        return self.train
+
+    @property
+    def epoch_len(self) -> int:
+        """This rank's rows per epoch before ranks are evened out."""
+
+        if self.partition == "index":
+            return -(-len(self.train) // self.world_size)
+        return len(self.train)
+
+    def epoch_rows(
+        self,
+        n_rows: int,
+    ) -> torch.Tensor:
+        """Shuffled rows of the next epoch, wrapped around to `n_rows`."""
+
+        rows = torch.from_numpy(self.train)
+        order = rows[torch.randperm(len(rows), generator=self.gen)]
+
+        if self.partition == "index":
+            # Pad so every rank gets the same count, then deal round-robin
+            order = order.repeat(-(-n_rows * self.world_size // len(order)))
+            order = order[: n_rows * self.world_size][self.rank :: self.world_size]
+        else:
+            order = order.repeat(-(-n_rows // len(order)))[:n_rows]
+
+        return order
+
+
+def _all_sum(
+    values: np.ndarray,
+) -> np.ndarray:
+    t = torch.from_numpy(np.ascontiguousarray(values, dtype=np.float64))
+    dist.all_reduce(t, op=dist.ReduceOp.SUM)
+    return t.numpy()
+
+
+def _train_rank(
+    rank: int,
+    world_size: int,
+    features: List[str],
+    model_cfg: ClfModelConfig,
+    train_cfg: ClfTrainConfig,
+    dist_cfg: ClfDistConfig,
+    threads: int,
+    verbose: bool,
+) -> DistResult | None:
+
+    data = _RankData(rank, world_size, features, dist_cfg, train_cfg)
+    X, y = data.X, data.y
+
+    # Global scaler from every rank's partial sums
+    n, total, total_sq = StandardScaler.moments(X.numpy(), data.own_train)
+    dim = X.shape[1]
+    summed = _all_sum(np.concatenate([[n], total, total_sq]))
+    scaler = StandardScaler.from_moments(
+        int(summed[0]), summed[1 : 1 + dim], summed[1 + dim :]
+    )
+    mean = torch.from_numpy(scaler.mean)
+    scale = torch.from_numpy(scaler.scale)
+
+    # Identical initial weights everywhere (DDP also broadcasts rank 0's)
+    torch.manual_seed(train_cfg.seed)
+    model = MLPBCE.from_config(in_dim=dim, cfg=model_cfg)
+    ddp = DistributedDataParallel(model)
+    # Dropout masks differ between ranks, reproducibly
+    torch.manual_seed(train_cfg.seed + rank)
+
+    optimizer = torch.optim.Adam(
+        ddp.parameters(), lr=train_cfg.lr, weight_decay=train_cfg.weight_decay
+    )
+    loss_fn = nn.BCEWithLogitsLoss()
+
+    # batch_size is the global batch; gradients are averaged over ranks
+    batch_size = max(1, train_cfg.batch_size // world_size)
+    # Equal step counts on every rank, or the all-reduce would hang
+    lens = torch.tensor([data.epoch_len], dtype=torch.int64)
+    dist.all_reduce(lens, op=dist.ReduceOp.MAX)
+    n_rows = int(lens.item())
+    n_train = int(_all_sum(np.array([len(data.own_train)]))[0])
+
+    history: List[float] = []
+    samples = 0
+
+    dist.barrier()
+    t0 = time.perf_counter()
+
+    ddp.train()
+    for epoch in range(train_cfg.epochs):
+        order = data.epoch_rows(n_rows)
+        total_loss, seen = 0.0, 0
+
+        for start in range(0, len(order), batch_size):
+            batch = order[start : start + batch_size]
+            xb = (X[batch] - mean) / scale
+            yb = y[batch]
+
+            optimizer.zero_grad(set_to_none=True)
+            loss = loss_fn(ddp(xb), yb)
+            loss.backward()  # gradients all-reduced here
+            optimizer.step()
+
+            total_loss += loss.item() * len(batch)
+            seen += len(batch)
+
+        epoch_total = _all_sum(np.array([total_loss, seen]))
+        history.append(float(epoch_total[0] / max(epoch_total[1], 1)))
+        samples += int(epoch_total[1])
+        if verbose and rank == 0:
+            print(f"epoch {epoch + 1}/{train_cfg.epochs}  loss {history[-1]:.5f}")
+
+    train_s = time.perf_counter() - t0
+
+    model.eval()
+    bundle = make_bundle(model, features, scaler, model_cfg)
+
+    # Validate each rank's rows, then merge the evaluators on rank 0
+    evaluator = RocEvaluator()
+    batch = 65536
+    for start in range(0, len(data.val), batch):
+        rows = data.val[start : start + batch]
+        evaluator.update(bundle.score(X[rows].numpy()), y[rows].numpy())
+
+    gathered: list[RocEvaluator | None] | None = (
+        [None] * world_size if rank == 0 else None
+    )
+    dist.gather_object(evaluator, gathered, dst=0)
+    n_val = int(_all_sum(np.array([len(data.val)]))[0])
+
+    if rank != 0:
+        return None
+
+    merged = RocEvaluator()
+    for part in gathered or []:
+        if part is not None:
+            merged.merge(part)
+
+    return DistResult(
+        bundle=bundle,
+        world_size=world_size,
+        partition=data.partition,
+        threads_per_rank=threads,
+        epoch_loss=history,
+        train_s=train_s,
+        n_train=n_train,
+        samples=samples,
+        n_val=n_val,
+        auc=merged.auc(),
+    )
+
+
+def run_rank(
+    rank: int,
+    world_size: int,
+    features: List[str],
+    init_method: str,
+    threads: int,
+    model_cfg: ClfModelConfig | None = None,
+    train_cfg: ClfTrainConfig | None = None,
+    dist_cfg: ClfDistConfig | None = None,
+    verbose: bool = True,
+) -> DistResult | None:
+    """
+    Join the process group as `rank` and train; rank 0 returns the result.
+
+    Every rank must call this with the same configs and features.
+    """
+
+    model_cfg = model_cfg or ClfModelConfig.load_config()
+    train_cfg = train_cfg or ClfTrainConfig.load_config()
+    dist_cfg = dist_cfg or ClfDistConfig.load_config()
+
+    # torch intra-op and BLAS / OpenMP pools sized to this rank's share
+    apply_threads(threads)
+
+    dist.init_process_group(
+        dist_cfg.backend,
+        init_method=init_method,
+        rank=rank,
+        world_size=world_size,
+        timeout=timedelta(seconds=dist_cfg.timeout_s),
+    )
+    try:
+        return _train_rank(
+            rank,
+            world_size,
+            list(features),
+            model_cfg,
+            train_cfg,
+            dist_cfg,
+            threads,
+            verbose,
+        )
+    finally:
+        dist.destroy_process_group()
+
+
+def _spawned_rank(
+    rank: int,
+    world_size: int,
+    out_dir: str,
+    *args,
+) -> None:
+    """mp.spawn entry point: rank 0 leaves its result in `out_dir`."""
+
+    result = run_rank(rank, world_size, *args)
+    if result is not None:
+        torch.save(result, Path(out_dir) / RESULT_FILE)
+
+
+def train_local(
+    features: List[str],
+    world_size: int | None = None,
+    model_cfg: ClfModelConfig | None = None,
+    train_cfg: ClfTrainConfig | None = None,
+    dist_cfg: ClfDistConfig | None = None,
+    verbose: bool = True,
+) -> DistResult:
+    """
+    Data-parallel training on `world_size` local processes (stand-ins for
+    nodes), rendezvousing over TCP at dist_config's master address.
+
+    The core budget (train_config "threads", else resource_config) is split
+    evenly between the ranks.
+    """
+
+    model_cfg = model_cfg or ClfModelConfig.load_config()
+    train_cfg = train_cfg or ClfTrainConfig.load_config()
+    dist_cfg = dist_cfg or ClfDistConfig.load_config()
+    world_size = world_size or dist_cfg.world_size
+
+    budget = ThreadBudget.from_config(world_size, total_cores=train_cfg.threads)
+    threads = budget.threads_per_worker
+    init_method = f"tcp://{dist_cfg.master_addr}:{dist_cfg.master_port}"
+
+    with tempfile.TemporaryDirectory() as out_dir, worker_env(threads):
+        # Raises if any rank fails (and stops the others)
+        mp.spawn(
+            _spawned_rank,
+            args=(
+                world_size,
+                out_dir,
+                features,
+                init_method,
+                threads,
+                model_cfg,
+                train_cfg,
+                dist_cfg,
+                verbose,
+            ),
+            nprocs=world_size,
+            join=True,
+        )
+        return torch.load(Path(out_dir) / RESULT_FILE, weights_only=False)
+
+
+def train_from_env(
+    features: List[str],
+    model_cfg: ClfModelConfig | None = None,
+    train_cfg: ClfTrainConfig | None = None,
+    dist_cfg: ClfDistConfig | None = None,
+    verbose: bool = True,
+) -> DistResult | None:
+    """
+    One rank of a multi-node run started by a launcher such as torchrun,
+    which sets RANK, WORLD_SIZE, LOCAL_WORLD_SIZE, MASTER_ADDR and
+    MASTER_PORT. The node's core budget is split between its local ranks.
+    """
+
+    train_cfg = train_cfg or ClfTrainConfig.load_config()
+
+    rank = int(os.environ["RANK"])
+    world_size = int(os.environ["WORLD_SIZE"])
+    local_ranks = int(os.environ.get("LOCAL_WORLD_SIZE", world_size))
+
+    budget = ThreadBudget.from_config(local_ranks, total_cores=train_cfg.threads)
+
+    return run_rank(
+        rank,
+        world_size,
+        features,
+        "env://",
+        budget.threads_per_worker,
+        model_cfg,
+        train_cfg,
+        dist_cfg,
+        verbose,
+    )
@@ -0,0 +1,290 @@
+# src/neutrino/clf/evaluate.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class RocCurve:
+    """
+    ROC points ordered by decreasing threshold, from (0, 0) to (1, 1).
+
+    A row passes threshold t when score >= t. Label 1 (B) is the signal:
+    `tpr` is the signal efficiency, `fpr` the background efficiency.
+    """
+
+    thresholds: np.ndarray  # first entry is +inf (nothing passes)
+    tpr: np.ndarray
+    fpr: np.ndarray
+    signal: np.ndarray  # (weighted) signal rows passing
+    background: np.ndarray  # (weighted) background rows passing
+
+    @property
+    def purity(self) -> np.ndarray:
+        """S / (S + B) among passing rows (NaN where nothing passes)."""
+        passed = self.signal + self.background
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(passed > 0, self.signal / passed, np.nan)
+
+    @property
+    def auc(self) -> float:
+        # Trapezoids count rows tied within a bin as half right, half wrong
+        return float(np.sum(np.diff(self.fpr) * (self.tpr[1:] + self.tpr[:-1]) / 2.0))
+
+
+@dataclass
+class CutPoint:
+    """One threshold choice and what it gives."""
+
+    criterion: str
+    threshold: float
+    efficiency: float  # signal efficiency
+    background_eff: float
+    purity: float
+    value: float  # the criterion's value at this threshold
+
+
+class RocEvaluator:
+    """
+    Streaming ROC / AUC / threshold-scan evaluator for binary scores.
+
+    By default per-class score histograms with `n_bins` fixed bins on
+    [lo, hi] are accumulated batch by batch, so memory is O(n_bins) no
+    matter how many rows are seen, and evaluators filled on different
+    shards or workers can be `merge`d. Thresholds are the bin edges, so
+    the AUC is exact up to rows that share a bin.
+
+    With `exact=True` every score is kept instead and every distinct score
+    is a threshold (for small validation sets).
+    """
+
+    def __init__(
+        self,
+        n_bins: int = 4096,
+        lo: float = 0.0,
+        hi: float = 1.0,
+        exact: bool = False,
+    ) -> None:
+
+        if n_bins < 1 or not hi > lo:
+            raise ValueError(f"Need n_bins >= 1 and hi > lo, got {n_bins}, [{lo}, {hi}]")
+
+        self.n_bins = n_bins
+        self.lo = lo
+        self.hi = hi
+        self.exact = exact
+
+        # Binned mode: weighted counts per bin and class (0 = A, 1 = B)
+        self.counts = np.zeros((2, n_bins), dtype=np.float64)
+
+        # Exact mode: every (score, label, weight) seen
+        self._scores: list[np.ndarray] = []
+        self._labels: list[np.ndarray] = []
+        self._weights: list[np.ndarray] = []
+
+    # ---------- accumulation ----------
+    def update(
+        self,
+        scores: np.ndarray,
+        labels: np.ndarray,
+        weights: np.ndarray | None = None,
+    ) -> None:
+        """Add one batch of scores with 0/1 labels (optionally weighted)."""
+
+        scores = np.asarray(scores, dtype=np.float64).reshape(-1)
+        labels = np.asarray(labels).reshape(-1).astype(bool)
+        if weights is None:
+            weights = np.ones(len(scores), dtype=np.float64)
+        else:
+            weights = np.asarray(weights, dtype=np.float64).reshape(-1)
+
+        if not len(scores) == len(labels) == len(weights):
+            raise ValueError("scores, labels and weights must have equal length")
+        if np.isnan(scores).any():
+            raise ValueError("NaN scores cannot be ranked")
+
+        if self.exact:
+            self._scores.append(scores)
+            self._labels.append(labels)
+            self._weights.append(weights)
+            return
+
+        # Out-of-range scores land in the first / last bin
+        width = (self.hi - self.lo) / self.n_bins
+        idx = np.clip(((scores - self.lo) / width).astype(np.int64), 0, self.n_bins - 1)
+
+        self.counts[0] += np.bincount(
+            idx[~labels], weights=weights[~labels], minlength=self.n_bins
+        )
+        self.counts[1] += np.bincount(
+            idx[labels], weights=weights[labels], minlength=self.n_bins
+        )
+
+    def merge(
+        self,
+        other: "RocEvaluator",
+    ) -> "RocEvaluator":
+        """Fold in an evaluator filled elsewhere (same binning/mode)."""
+
+        if (self.n_bins, self.lo, self.hi, self.exact) != (
+            other.n_bins,
+            other.lo,
+            other.hi,
+            other.exact,
+        ):
+            raise ValueError("Cannot merge evaluators with different binning")
+
+        self.counts += other.counts
+        self._scores.extend(other._scores)
+        self._labels.extend(other._labels)
+        self._weights.extend(other._weights)
+        return self
+
+    # ---------- results ----------
+    def _per_threshold(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(ascending thresholds, background weight, signal weight) per bin."""
+
+        if not self.exact:
+            edges = self.lo + np.arange(self.n_bins) * (self.hi - self.lo) / self.n_bins
+            return edges, self.counts[0], self.counts[1]
+
+        if not self._scores:
+            empty = np.zeros(0)
+            return empty, empty, empty
+
+        scores = np.concatenate(self._scores)
+        labels = np.concatenate(self._labels)
+        weights = np.concatenate(self._weights)
+
+        values, inverse = np.unique(scores, return_inverse=True)
+        bkg = np.bincount(inverse[~labels], weights=weights[~labels], minlength=len(values))
+        sig = np.bincount(inverse[labels], weights=weights[labels], minlength=len(values))
+        return values, bkg, sig
+
+    def curve(self) -> RocCurve:
+        thresholds, bkg, sig = self._per_threshold()
+
+        # Rows passing each threshold: everything at or above it
+        sig_pass = np.concatenate([[0.0], np.cumsum(sig[::-1])])
+        bkg_pass = np.concatenate([[0.0], np.cumsum(bkg[::-1])])
+        thresholds = np.concatenate([[np.inf], thresholds[::-1]])
+
+        n_sig = sig_pass[-1]
+        n_bkg = bkg_pass[-1]
+        if n_sig <= 0 or n_bkg <= 0:
+            raise ValueError("ROC needs rows of both classes")
+
+        return RocCurve(
+            thresholds=thresholds,
+            tpr=sig_pass / n_sig,
+            fpr=bkg_pass / n_bkg,
+            signal=sig_pass,
+            background=bkg_pass,
+        )
+
+    def auc(self) -> float:
+        return self.curve().auc
+
+    def scan(
+        self,
+        thresholds: np.ndarray,
+    ) -> RocCurve:
+        """Efficiency / purity at chosen thresholds (nearest curve point)."""
+
+        full = self.curve()
+        thresholds = np.asarray(thresholds, dtype=np.float64)
+
+        # Curve thresholds descend (from +inf): pick the last one >= t
+        n_at_or_above = len(full.thresholds) - np.searchsorted(
+            full.thresholds[::-1], thresholds, side="left"
+        )
+        pick = n_at_or_above - 1
+
+        return RocCurve(
+            thresholds=thresholds,
+            tpr=full.tpr[pick],
+            fpr=full.fpr[pick],
+            signal=full.signal[pick],
+            background=full.background[pick],
+        )
+
+    def best_cuts(self) -> dict[str, CutPoint]:
+        """
+        Optimal thresholds for common criteria:
+        - "youden"       : max(signal eff - background eff)
+        - "eff_x_purity" : max(signal eff * purity)
+        - "significance" : max(S / sqrt(S + B)) with the (weighted) counts
+        """
+
+        c = self.curve()
+        purity = np.nan_to_num(c.purity, nan=0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            signif = np.where(
+                c.signal + c.background > 0,
+                c.signal / np.sqrt(c.signal + c.background),
+                0.0,
+            )
+
+        criteria = {
+            "youden": c.tpr - c.fpr,
+            "eff_x_purity": c.tpr * purity,
+            "significance": signif,
+        }
+
+        out: dict[str, CutPoint] = {}
+        for name, values in criteria.items():
+            # Skip the +inf point (nothing passes)
+            i = 1 + int(np.argmax(values[1:]))
+            out[name] = CutPoint(
+                criterion=name,
+                threshold=float(c.thresholds[i]),
+                efficiency=float(c.tpr[i]),
+                background_eff=float(c.fpr[i]),
+                purity=float(purity[i]),
+                value=float(values[i]),
+            )
+
+        return out
+
+    def report(
+        self,
+        scan_at: np.ndarray | None = None,
+    ) -> None:
+        c = self.curve()
+        mode = "exact" if self.exact else f"{self.n_bins} bins"
+
+        print(f"---------- ROC ({mode}) ----------")
+        print(f"signal (B): {c.signal[-1]:.0f}  background (A): {c.background[-1]:.0f}")
+        print(f"AUC: {c.auc:.5f}")
+
+        if scan_at is None:
+            scan_at = np.linspace(0.1, 0.9, 9)
+        s = self.scan(scan_at)
+        print(f"{'threshold':>10} {'sig eff':>9} {'bkg eff':>9} {'purity':>8}")
+        for t, e, b, p in zip(s.thresholds, s.tpr, s.fpr, s.purity):
+            print(f"{t:>10.3f} {e:>9.4f} {b:>9.4f} {p:>8.4f}")
+
+        print("---------- Optimal cuts ----------")
+        for cut in self.best_cuts().values():
+            print(
+                f"{cut.criterion:<13} t={cut.threshold:.4f}  eff={cut.efficiency:.4f}  "
+                f"bkg={cut.background_eff:.4f}  purity={cut.purity:.4f}  "
+                f"value={cut.value:.4g}"
+            )
+
+    @classmethod
+    def exact_auc(
+        cls,
+        scores: np.ndarray,
+        labels: np.ndarray,
+    ) -> float:
+        """AUC of one in-memory set of scores (NaN if a class is missing)."""
+
+        ev = cls(exact=True)
+        ev.update(scores, labels)
+        try:
+            return ev.auc()
+        except ValueError:
+            return float("nan")
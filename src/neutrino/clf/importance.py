@@ -0,0 +1,209 @@
+# src/neutrino/clf/importance.py
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+import numpy as np
+import torch
+
+from neutrino.clf.bundle import ModelBundle
+from neutrino.clf.evaluate import RocEvaluator
+from neutrino.clf.train import finite_rows
+from neutrino.prep.io.threads import ThreadBudget
+
+ScoreFn = Callable[[np.ndarray], np.ndarray]
+
+
+class SklearnScorer:
+    """Adapt a fitted sklearn classifier (anything with predict_proba)."""
+
+    def __init__(
+        self,
+        model: Any,
+    ) -> None:
+        self.model = model
+
+    def __call__(self, X: np.ndarray) -> np.ndarray:
+        return np.asarray(self.model.predict_proba(X))[:, 1]
+
+
+@dataclass
+class ImportanceResult:
+    """AUC drop per feature and repeat when that feature is permuted."""
+
+    feature_order: list[str]
+    baseline_auc: float
+    drops: np.ndarray  # shape: [D, n_repeats], baseline AUC - permuted AUC
+    feature_s: np.ndarray  # shape: [D], compute time per feature
+    wall_s: float
+    workers: int
+
+    @property
+    def mean(self) -> np.ndarray:
+        return self.drops.mean(axis=1)
+
+    @property
+    def std(self) -> np.ndarray:
+        return self.drops.std(axis=1)
+
+    def ranking(self) -> list[str]:
+        """Features from most to least important."""
+        return [self.feature_order[i] for i in np.argsort(-self.mean, kind="stable")]
+
+    def report(self) -> None:
+        print("---------- Permutation importance ----------")
+        print(f"baseline AUC: {self.baseline_auc:.5f}")
+        print(
+            f"{'feature':<32} {'mean ΔAUC':>10} {'std':>9} "
+            f"{'min':>9} {'max':>9} {'time':>7}"
+        )
+        for i in np.argsort(-self.mean, kind="stable"):
+            d = self.drops[i]
+            print(
+                f"{self.feature_order[i][:32]:<32} {d.mean():>10.5f} {d.std():>9.5f} "
+                f"{d.min():>9.5f} {d.max():>9.5f} {self.feature_s[i]:>6.2f}s"
+            )
+        print(
+            f"wall time: {self.wall_s:.2f} s with {self.workers} workers "
+            f"(feature time summed: {self.feature_s.sum():.2f} s)"
+        )
+
+
+class PermutationImportance:
+    """
+    Permutation feature importance for any batch scorer.
+
+    Features are spread over a pool of worker threads. Each worker owns
+    one copy of the validation matrix; for each of its features it
+    overwrites that single column in place with a permutation, scores
+    the buffer in large batches, and restores the column afterwards, so
+    no per-feature or per-repeat copies are made. Torch's intra-op
+    threads are split between the workers for the duration of the run.
+    """
+
+    def __init__(
+        self,
+        score_fn: ScoreFn,
+        feature_order: Sequence[str],
+        n_repeats: int = 5,
+        batch_rows: int = 65536,
+        workers: int | None = None,
+        seed: int = 0,
+        exact_auc: bool = True,
+    ) -> None:
+
+        self.score_fn = score_fn
+        self.feature_order = list(feature_order)
+        self.n_repeats = n_repeats
+        self.batch_rows = batch_rows
+        self.workers = workers or min(
+            len(self.feature_order), ThreadBudget.from_config().total_cores
+        )
+        self.seed = seed
+        self.exact_auc = exact_auc
+
+    @classmethod
+    def from_bundle(
+        cls,
+        bundle: ModelBundle,
+        **kwargs: Any,
+    ) -> "PermutationImportance":
+        """MLPBCE bundle: raw rows in the bundle's feature order."""
+        return cls(bundle.score, bundle.feature_order, **kwargs)
+
+    # ---------- scoring ----------
+    def _auc(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+    ) -> float:
+        ev = RocEvaluator(exact=self.exact_auc)
+        for i in range(0, len(X), self.batch_rows):
+            ev.update(self.score_fn(X[i : i + self.batch_rows]), y[i : i + self.batch_rows])
+        return ev.auc()
+
+    def _feature(
+        self,
+        j: int,
+        X: np.ndarray,
+        y: np.ndarray,
+        baseline: float,
+        buffers: threading.local,
+    ) -> tuple[int, np.ndarray, float]:
+
+        # One reusable copy of X per worker thread
+        buf: np.ndarray | None = getattr(buffers, "X", None)
+        if buf is None:
+            buf = buffers.X = X.copy()
+
+        t0 = time.perf_counter()
+        rng = np.random.default_rng([self.seed, j])
+        drops = np.empty(self.n_repeats, dtype=np.float64)
+
+        try:
+            for r in range(self.n_repeats):
+                buf[:, j] = X[rng.permutation(len(X)), j]
+                drops[r] = baseline - self._auc(buf, y)
+        finally:
+            buf[:, j] = X[:, j]
+
+        return j, drops, time.perf_counter() - t0
+
+    def run(
+        self,
+        X_val: np.ndarray,
+        y_val: np.ndarray,
+    ) -> ImportanceResult:
+        """
+        Importance of every feature on raw validation rows (N, D).
+
+        Rows with a non-finite feature score NaN and cannot be ranked, so
+        they are dropped before the baseline is computed.
+        """
+
+        X = np.asarray(X_val, dtype=np.float32)
+        y = np.asarray(y_val)
+        if X.ndim != 2 or X.shape[1] != len(self.feature_order):
+            raise ValueError(
+                f"Expected shape (N, {len(self.feature_order)}), got {X.shape}"
+            )
+
+        rows = finite_rows(X)
+        X = np.ascontiguousarray(X[rows])
+        y = y[rows]
+
+        t0 = time.perf_counter()
+        baseline = self._auc(X, y)
+
+        drops = np.zeros((len(self.feature_order), self.n_repeats))
+        feature_s = np.zeros(len(self.feature_order))
+        buffers = threading.local()
+
+        # Split the core budget's torch intra-op threads between the workers
+        prev_threads = torch.get_num_threads()
+        torch.set_num_threads(ThreadBudget.from_config(self.workers).threads_per_worker)
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                futures = [
+                    pool.submit(self._feature, j, X, y, baseline, buffers)
+                    for j in range(len(self.feature_order))
+                ]
+                for fut in futures:
+                    j, d, dt = fut.result()
+                    drops[j] = d
+                    feature_s[j] = dt
+        finally:
+            torch.set_num_threads(prev_threads)
+
+        return ImportanceResult(
+            feature_order=self.feature_order,
+            baseline_auc=baseline,
+            drops=drops,
+            feature_s=feature_s,
+            wall_s=time.perf_counter() - t0,
+            workers=self.workers,
+        )
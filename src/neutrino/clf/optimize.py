@@ -0,0 +1,223 @@
+# src/neutrino/clf/optimize.py
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from neutrino.clf.bundle import ModelBundle
+from neutrino.clf.evaluate import RocEvaluator
+from neutrino.clf.train import finite_rows
+
+
+@dataclass
+class VariantReport:
+    """Accuracy and speed of one inference variant against the float model."""
+
+    name: str
+    rows_per_s: float
+    speedup: float  # relative to the float model
+    max_score_delta: float  # max |score - float score| on the validation rows
+    auc: float
+    auc_delta: float  # auc - float auc
+    passed: bool  # within the accuracy tolerances
+    exportable: bool  # can be saved as TorchScript next to the bundle
+
+
+class ModelOptimizer:
+    """
+    Build faster CPU inference variants of a bundle's MLPBCE and check them.
+
+    Variants:
+    - "float"    : the model as trained (reference)
+    - "script"   : frozen TorchScript, optimized for inference
+    - "int8"     : dynamic int8 quantization of every nn.Linear, scripted
+    - "compiled" : torch.compile (benchmark only; skipped if unavailable)
+
+    Every variant is scored on a validation split and compared with the
+    float model (max score delta, AUC delta); passing TorchScript variants
+    can be exported as `model.<variant>.ts` for ModelBundle.load.
+    """
+
+    def __init__(
+        self,
+        bundle: ModelBundle,
+    ) -> None:
+
+        if bundle.variant != "float":
+            raise ValueError("Optimize from the float model, not an export")
+
+        self.bundle = bundle
+        self.model = bundle.model.eval()
+        self.variants: dict[str, nn.Module | Callable[[torch.Tensor], torch.Tensor]] = {}
+
+    # ---------- variants ----------
+    def _script(
+        self,
+        model: nn.Module,
+        example: torch.Tensor,
+    ) -> torch.jit.ScriptModule:
+        traced = torch.jit.trace(model, example)
+        return torch.jit.freeze(traced)
+
+    def build(
+        self,
+        example: torch.Tensor,
+        use_compile: bool = True,
+    ) -> list[str]:
+        """Create every variant; `example` is one scaled input batch."""
+
+        with torch.inference_mode():
+            self.variants["float"] = self.model
+            self.variants["script"] = torch.jit.optimize_for_inference(
+                self._script(self.model, example)
+            )
+
+            quantized = torch.ao.quantization.quantize_dynamic(
+                self.model, {nn.Linear}, dtype=torch.qint8
+            )
+            self.variants["int8"] = self._script(quantized, example)
+
+        if use_compile:
+            try:
+                compiled = torch.compile(self.model)
+                with torch.inference_mode():
+                    compiled(example)  # compile now, not inside the benchmark
+                self.variants["compiled"] = compiled
+            except Exception as exc:  # no compiler toolchain on this node
+                print(f"torch.compile unavailable, skipping: {exc}")
+
+        return list(self.variants)
+
+    # ---------- evaluation ----------
+    @staticmethod
+    def _predict(
+        fn: Callable[[torch.Tensor], torch.Tensor],
+        X: torch.Tensor,
+        batch_size: int,
+    ) -> np.ndarray:
+        with torch.inference_mode():
+            return np.concatenate(
+                [
+                    torch.sigmoid(fn(X[i : i + batch_size])).numpy()
+                    for i in range(0, len(X), batch_size)
+                ]
+            )
+
+    @classmethod
+    def _throughput(
+        cls,
+        fn: Callable[[torch.Tensor], torch.Tensor],
+        X: torch.Tensor,
+        batch_size: int,
+        repeats: int,
+    ) -> float:
+        """Best-of-`repeats` rows per second (after one warm-up pass)."""
+
+        cls._predict(fn, X[:batch_size], batch_size)
+
+        best = float("inf")
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            cls._predict(fn, X, batch_size)
+            best = min(best, time.perf_counter() - t0)
+
+        return len(X) / best if best > 0 else float("inf")
+
+    def compare(
+        self,
+        X_val: np.ndarray | torch.Tensor,
+        y_val: np.ndarray | torch.Tensor,
+        batch_size: int = 4096,
+        repeats: int = 5,
+        max_score_delta: float = 0.1,
+        max_auc_delta: float = 1e-3,
+    ) -> list[VariantReport]:
+        """
+        Score the raw validation rows with every variant and compare each
+        with the float model. Builds the variants first if needed. Rows
+        with a non-finite feature score NaN, so they are dropped first.
+        """
+
+        X_np = np.asarray(X_val)
+        rows = finite_rows(X_np)
+        X = torch.from_numpy(self.bundle.scaler.transform(X_np[rows]))
+        y = np.asarray(y_val)[rows]
+
+        if not self.variants:
+            self.build(X[:batch_size])
+
+        ref = self._predict(self.variants["float"], X, batch_size)
+        ref_auc = RocEvaluator.exact_auc(ref, y)
+        ref_speed = self._throughput(self.variants["float"], X, batch_size, repeats)
+
+        reports: list[VariantReport] = []
+
+        for name, fn in self.variants.items():
+            scores = ref if name == "float" else self._predict(fn, X, batch_size)
+            speed = (
+                ref_speed
+                if name == "float"
+                else self._throughput(fn, X, batch_size, repeats)
+            )
+
+            delta = float(np.max(np.abs(scores - ref))) if len(ref) else 0.0
+            auc = RocEvaluator.exact_auc(scores, y)
+            auc_delta = auc - ref_auc
+
+            reports.append(
+                VariantReport(
+                    name=name,
+                    rows_per_s=speed,
+                    speedup=speed / ref_speed,
+                    max_score_delta=delta,
+                    auc=auc,
+                    auc_delta=auc_delta,
+                    passed=delta <= max_score_delta
+                    and not abs(auc_delta) > max_auc_delta,
+                    exportable=isinstance(fn, torch.jit.ScriptModule),
+                )
+            )
+
+        return reports
+
+    @staticmethod
+    def report(
+        reports: list[VariantReport],
+    ) -> None:
+        print("---------- Inference variants ----------")
+        print(
+            f"{'variant':<10} {'rows/s':>12} {'speedup':>8} "
+            f"{'max Δscore':>11} {'AUC':>8} {'ΔAUC':>9}  ok"
+        )
+        for r in reports:
+            print(
+                f"{r.name:<10} {r.rows_per_s:>12.0f} {r.speedup:>7.2f}x "
+                f"{r.max_score_delta:>11.2e} {r.auc:>8.4f} {r.auc_delta:>+9.1e}  "
+                f"{'yes' if r.passed else 'NO'}"
+            )
+
+    # ---------- export ----------
+    def export(
+        self,
+        bundle_dir: Path | str,
+        reports: list[VariantReport],
+    ) -> list[Path]:
+        """Save every passing TorchScript variant next to the bundle."""
+
+        paths: list[Path] = []
+
+        for r in reports:
+            if r.name == "float" or not (r.passed and r.exportable):
+                continue
+
+            path = ModelBundle.variant_path(bundle_dir, r.name)
+            torch.jit.save(self.variants[r.name], str(path))
+            paths.append(path)
+
+        return paths
@@ -1,10 +1,12 @@
 from __future__ import annotations
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import Any, List
 
 import numpy as np
 import torch
+from numpy.lib.recfunctions import structured_to_unstructured
 
 from neutrino.clf.config.io_config import ClfIoConfig
 
@@ -14,6 +16,14 @@ class TensorPair:
     A: torch.Tensor  # shape: [NA, D_all], dtype: float32
     B: torch.Tensor  # shape: [NB, D_all], dtype: float32
     columns: List[str]  # length D_all
+    source: Any = field(default=None, repr=False)  # keeps shared memory mapped
+
+    @staticmethod
+    def _as_matrix(arr: np.ndarray) -> np.ndarray:
+        """Unpack a record array into an (N, D) float32 matrix; no-op otherwise."""
+        if arr.dtype.names is None:
+            return arr
+        return structured_to_unstructured(arr, dtype=np.float32)
 
     @classmethod
     def load_tensor(cls) -> "TensorPair":
@@ -25,15 +35,66 @@ class TensorPair:
         b_path: Path = split_dir / f"{cfg.split_prefix}{cfg.b_suffix}"
         cols_path: Path = split_dir / cfg.columns_filename
 
-        # numpy → tensors
-        A_np = np.load(a_path)
-        B_np = np.load(b_path)
+        # numpy → tensors (an appended dataset is the concatenation of its shards)
+        shards_path: Path = split_dir / f"{cfg.split_prefix}_shards.json"
+        if not a_path.exists() and shards_path.exists():
+            shards = json.loads(shards_path.read_text(encoding="utf-8"))["shards"]
+            A_np = np.concatenate([np.load(s["A"]["path"]) for s in shards])
+            B_np = np.concatenate([np.load(s["B"]["path"]) for s in shards])
+        else:
+            A_np = np.load(a_path)
+            B_np = np.load(b_path)
+
+        return cls._from_arrays(A_np, B_np, cols_path)
+
+    @classmethod
+    def load_shards(
+        cls,
+        rank: int,
+        world_size: int,
+    ) -> "TensorPair | None":
+        """
+        Only the shards of an appended split that belong to `rank` (every
+        `world_size`-th shard), or None if the split is not sharded or has
+        fewer shards than ranks.
+        """
+
+        cfg: ClfIoConfig = ClfIoConfig.load_config()
+        split_dir: Path = cfg.split_dir
+        a_path: Path = split_dir / f"{cfg.split_prefix}{cfg.a_suffix}"
+        shards_path: Path = split_dir / f"{cfg.split_prefix}_shards.json"
+
+        if a_path.exists() or not shards_path.exists():
+            return None
+
+        shards = json.loads(shards_path.read_text(encoding="utf-8"))["shards"]
+        if len(shards) < world_size:
+            return None
+
+        mine = shards[rank::world_size]
+        A_np = np.concatenate([np.load(s["A"]["path"]) for s in mine])
+        B_np = np.concatenate([np.load(s["B"]["path"]) for s in mine])
+
+        return cls._from_arrays(A_np, B_np, split_dir / cfg.columns_filename)
+
+    @classmethod
+    def _from_arrays(
+        cls,
+        A_np: np.ndarray,
+        B_np: np.ndarray,
+        cols_path: Path,
+    ) -> "TensorPair":
+
         columns = [
             ln.strip()
             for ln in cols_path.read_text(encoding="utf-8").splitlines()
             if ln.strip()
         ]
 
+        # Structured (per-column dtype) splits → plain float32 matrices
+        A_np = cls._as_matrix(A_np)
+        B_np = cls._as_matrix(B_np)
+
         A_t = torch.from_numpy(A_np).float()
         B_t = torch.from_numpy(B_np).float()
 
@@ -43,7 +104,93 @@ class TensorPair:
             columns=columns,
         )
 
+    @classmethod
+    def attach(
+        cls,
+        socket_path: Path | str | None = None,
+    ) -> "TensorPair":
+        """
+        Zero-copy TensorPair over the split published by the dataset daemon.
+
+        The configured split is loaded by the daemon once and shared by
+        every attached process; call `detach` when done with the tensors.
+        """
+
+        from neutrino.clf.config.daemon_config import ClfDaemonConfig
+        from neutrino.clf.dataset_daemon import SharedDataset
+
+        cfg: ClfIoConfig = ClfIoConfig.load_config()
+        if socket_path is None:
+            socket_path = ClfDaemonConfig.load_config().socket_path
+
+        shared = SharedDataset(
+            socket_path,
+            {
+                "split_dir": str(cfg.split_dir.resolve()),
+                "prefix": cfg.split_prefix,
+                "a_suffix": cfg.a_suffix,
+                "b_suffix": cfg.b_suffix,
+                "columns_filename": cfg.columns_filename,
+            },
+        )
+
+        return cls(
+            A=torch.from_numpy(shared.arrays["A"]),
+            B=torch.from_numpy(shared.arrays["B"]),
+            columns=shared.columns,
+            source=shared,
+        )
+
+    def detach(self) -> None:
+        """Release a daemon-attached split (no-op for loaded ones)."""
+        if self.source is not None:
+            self.A = self.B = torch.empty(0, len(self.columns))
+            self.source.close()
+            self.source = None
+
     @property
     def shapes(self) -> tuple[torch.Size, torch.Size]:
         """Return (A.shape, B.shape)"""
         return self.A.shape, self.B.shape
+
+    def select(
+        self,
+        features: List[str],
+    ) -> "TensorPair":
+        """Keep only `features`, in that order (e.g. a model's feature order)."""
+
+        missing = [name for name in features if name not in self.columns]
+        if missing:
+            raise ValueError(f"Columns missing from split: {missing}")
+
+        idx = torch.tensor([self.columns.index(name) for name in features])
+        return TensorPair(
+            A=self.A.index_select(1, idx),
+            B=self.B.index_select(1, idx),
+            columns=list(features),
+        )
+
+    def to_xy(self) -> tuple[torch.Tensor, torch.Tensor]:
+        """Stack A and B into (X, y) with label 0 for A and 1 for B."""
+
+        X = torch.cat([self.A, self.B], dim=0)
+        y = torch.cat([torch.zeros(len(self.A)), torch.ones(len(self.B))])
+        return X, y
+
+    def train_val_split(
+        self,
+        val_fraction: float = 0.2,
+        seed: int = 0,
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Shuffled (X_train, y_train, X_val, y_val), reproducible via `seed`."""
+
+        if not 0.0 < val_fraction < 1.0:
+            raise ValueError(f"val_fraction must be in (0, 1), got {val_fraction}")
+
+        X, y = self.to_xy()
+        gen = torch.Generator().manual_seed(seed)
+        perm = torch.randperm(len(X), generator=gen)
+        n_val = max(1, int(round(len(X) * val_fraction)))
+
+        val, train = perm[:n_val], perm[n_val:]
+        return X[train], y[train], X[val], y[val]
@@ -0,0 +1,374 @@
+# src/neutrino/clf/serve.py
+from __future__ import annotations
+
+import json
+import os
+import queue
+import socketserver
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from neutrino.clf.bundle import ModelBundle
+from neutrino.clf.config.serve_config import ClfServeConfig
+
+
+@dataclass
+class _Request:
+    X: np.ndarray
+    future: Future
+    t_submit: float = field(default_factory=time.perf_counter)
+
+
+class _Stop:
+    """Sentinel that shuts the batching thread down."""
+
+
+class ServeStats:
+    """
+    Thread-safe counters for the scoring server.
+
+    Latencies are end-to-end per request (queueing + batching + forward)
+    over the most recent `window` requests.
+    """
+
+    def __init__(
+        self,
+        window: int = 10_000,
+    ) -> None:
+
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.forward_s = 0.0
+        self._latency_ms: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record_batch(
+        self,
+        rows: int,
+        forward_s: float,
+        latencies_ms: list[float],
+    ) -> None:
+        with self._lock:
+            self.batches += 1
+            self.rows += rows
+            self.requests += len(latencies_ms)
+            self.forward_s += forward_s
+            self._latency_ms.extend(latencies_ms)
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            uptime = time.perf_counter() - self.started
+            lat = np.asarray(self._latency_ms, dtype=np.float64)
+            p50, p90, p99 = (
+                np.percentile(lat, [50, 90, 99]) if lat.size else (np.nan,) * 3
+            )
+            return {
+                "uptime_s": uptime,
+                "requests": self.requests,
+                "rows": self.rows,
+                "batches": self.batches,
+                "rows_per_s": self.rows / uptime if uptime > 0 else 0.0,
+                "requests_per_s": self.requests / uptime if uptime > 0 else 0.0,
+                "mean_batch_rows": self.rows / self.batches if self.batches else 0.0,
+                "forward_s": self.forward_s,
+                "latency_p50_ms": float(p50),
+                "latency_p90_ms": float(p90),
+                "latency_p99_ms": float(p99),
+            }
+
+    def report(self) -> None:
+        s = self.snapshot()
+        print("---------- Scoring server ----------")
+        print(f"requests: {s['requests']}  rows: {s['rows']}  batches: {s['batches']}")
+        print(f"throughput: {s['rows_per_s']:.0f} rows/s, {s['requests_per_s']:.1f} req/s")
+        print(f"mean batch: {s['mean_batch_rows']:.1f} rows")
+        print(
+            f"latency p50/p90/p99: {s['latency_p50_ms']:.2f} / "
+            f"{s['latency_p90_ms']:.2f} / {s['latency_p99_ms']:.2f} ms"
+        )
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent small scoring requests into large forward passes.
+
+    A single thread owns the model. It takes the oldest waiting request,
+    then keeps adding requests until `max_batch_rows` are collected or the
+    oldest request has waited `max_latency_s`, runs `fn` once on the
+    stacked rows and hands every caller its own slice of the result.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[np.ndarray], np.ndarray],
+        max_batch_rows: int = 8192,
+        max_latency_s: float = 0.005,
+    ) -> None:
+
+        self.fn = fn
+        self.max_batch_rows = max_batch_rows
+        self.max_latency_s = max_latency_s
+        self.stats = ServeStats()
+
+        self._queue: queue.Queue[_Request | _Stop] = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    # ---------- client side ----------
+    def submit(
+        self,
+        X: np.ndarray,
+    ) -> Future:
+        future: Future = Future()
+        self._queue.put(_Request(X=np.asarray(X, dtype=np.float32), future=future))
+        return future
+
+    def score(
+        self,
+        X: np.ndarray,
+        timeout: float | None = None,
+    ) -> np.ndarray:
+        return self.submit(X).result(timeout)
+
+    def close(self) -> None:
+        self._queue.put(_Stop())
+        self._thread.join()
+
+    # ---------- batching thread ----------
+    def _collect(
+        self,
+        first: _Request,
+    ) -> tuple[list[_Request], _Request | _Stop | None]:
+        """Gather a batch behind `first`; also return a held-over item."""
+
+        batch = [first]
+        rows = len(first.X)
+        deadline = first.t_submit + self.max_latency_s
+
+        while rows < self.max_batch_rows:
+            timeout = deadline - time.perf_counter()
+            try:
+                if timeout > 0:
+                    item = self._queue.get(timeout=timeout)
+                else:
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if isinstance(item, _Stop) or rows + len(item.X) > self.max_batch_rows:
+                # Does not fit (or shutdown): it goes first next time
+                return batch, item
+
+            batch.append(item)
+            rows += len(item.X)
+
+        return batch, None
+
+    def _run(
+        self,
+        batch: list[_Request],
+    ) -> None:
+
+        X = batch[0].X if len(batch) == 1 else np.concatenate([r.X for r in batch])
+
+        t0 = time.perf_counter()
+        try:
+            # An oversized single request is still split into bounded passes
+            scores = np.concatenate(
+                [
+                    self.fn(X[i : i + self.max_batch_rows])
+                    for i in range(0, max(len(X), 1), self.max_batch_rows)
+                ]
+            )
+        except Exception as exc:  # hand the failure to every caller
+            for req in batch:
+                req.future.set_exception(exc)
+            return
+        t1 = time.perf_counter()
+
+        offsets = np.cumsum([len(r.X) for r in batch])[:-1]
+        for req, part in zip(batch, np.split(scores, offsets)):
+            req.future.set_result(part)
+
+        self.stats.record_batch(
+            rows=len(X),
+            forward_s=t1 - t0,
+            latencies_ms=[(t1 - r.t_submit) * 1e3 for r in batch],
+        )
+
+    def _loop(self) -> None:
+        held: _Request | _Stop | None = None
+
+        while True:
+            item = held if held is not None else self._queue.get()
+            held = None
+
+            if isinstance(item, _Stop):
+                return
+
+            batch, held = self._collect(item)
+            self._run(batch)
+
+
+class _ScoreHandler(BaseHTTPRequestHandler):
+    """
+    POST /score  {"features": [[...], ...]}   (rows in bundle feature order)
+             or  {"events": [{"name": value, ...}, ...]}
+                 → {"scores": [...]}
+    GET  /stats  → throughput and latency percentiles
+    GET  /health → {"status": "ok", "feature_order": [...]}
+    """
+
+    server: "_ScoringHTTPServer | _ScoringUnixServer"
+
+    def _send_json(
+        self,
+        status: int,
+        payload: dict[str, Any],
+    ) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            self._send_json(200, self.server.batcher.stats.snapshot())
+        elif self.path == "/health":
+            self._send_json(
+                200, {"status": "ok", "feature_order": self.server.bundle.feature_order}
+            )
+        else:
+            self._send_json(404, {"error": f"unknown path {self.path!r}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/score":
+            self._send_json(404, {"error": f"unknown path {self.path!r}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            raw: dict[str, Any] = json.loads(self.rfile.read(length) or b"{}")
+
+            if "events" in raw:
+                X = self.server.bundle.features_from_records(raw["events"])
+            else:
+                X = np.asarray(raw["features"], dtype=np.float32)
+                X = X.reshape(-1, len(self.server.bundle.feature_order))
+
+            scores = self.server.batcher.score(X)
+        except (KeyError, ValueError, TypeError) as exc:
+            self._send_json(400, {"error": str(exc)})
+            return
+        except Exception as exc:
+            # Anything else is the server's fault; the client still gets JSON
+            self._send_json(500, {"error": f"{type(exc).__name__}: {exc}"})
+            return
+
+        self._send_json(200, {"scores": scores.tolist()})
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port)
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # one line per request would dominate the server's cost
+
+
+class _ScoringHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    bundle: ModelBundle
+    batcher: MicroBatcher
+
+
+class _ScoringUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    bundle: ModelBundle
+    batcher: MicroBatcher
+
+
+class ScoringServer:
+    """
+    Long-lived local scoring service for a trained MLPBCE bundle.
+
+    Torch and the model are loaded once; every request thread hands its
+    rows to one MicroBatcher, which runs the batched forward passes.
+    Listens on localhost HTTP, or on a Unix socket if one is configured.
+    """
+
+    def __init__(
+        self,
+        bundle: ModelBundle,
+        config: ClfServeConfig,
+    ) -> None:
+
+        self.bundle = bundle
+        self.config = config
+        self.batcher = MicroBatcher(
+            bundle.score,
+            max_batch_rows=config.max_batch_rows,
+            max_latency_s=config.max_latency_ms / 1e3,
+        )
+
+        if config.socket_path is not None:
+            Path(config.socket_path).unlink(missing_ok=True)
+            self.httpd: socketserver.BaseServer = _ScoringUnixServer(
+                str(config.socket_path), _ScoreHandler
+            )
+            self.address = str(config.socket_path)
+        else:
+            self.httpd = _ScoringHTTPServer((config.host, config.port), _ScoreHandler)
+            host, port = self.httpd.server_address[:2]
+            self.address = f"http://{host}:{port}"
+
+        self.httpd.bundle = bundle  # type: ignore[attr-defined]
+        self.httpd.batcher = self.batcher  # type: ignore[attr-defined]
+        self._closed = False
+
+    @classmethod
+    def from_config(
+        cls,
+        config: ClfServeConfig | None = None,
+    ) -> "ScoringServer":
+        config = config or ClfServeConfig.load_config()
+        bundle = ModelBundle.load(
+            config.bundle_dir, device=config.device, variant=config.variant
+        )
+        return cls(bundle, config)
+
+    def serve_forever(self) -> None:
+        print(
+            f"Scoring {len(self.bundle.feature_order)} features "
+            f"({self.bundle.variant} model) at {self.address}"
+        )
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.close()
+
+    def shutdown(self) -> None:
+        """Stop serve_forever (call from another thread)."""
+        self.httpd.shutdown()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+
+        self.httpd.server_close()
+        self.batcher.close()
+        if self.config.socket_path is not None and os.path.exists(self.config.socket_path):
+            os.unlink(self.config.socket_path)
+        self.batcher.stats.report()
@@ -0,0 +1,133 @@
+# src/neutrino/clf/train.py
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from neutrino.clf.bundle import ModelBundle, StandardScaler
+from neutrino.clf.config.model_config import ClfModelConfig
+from neutrino.clf.config.train_config import ClfTrainConfig
+from neutrino.clf.model import MLPBCE
+
+
+@dataclass
+class TrainResult:
+    bundle: ModelBundle  # trained model + feature order + scaler
+    epoch_loss: List[float] = field(default_factory=list)  # mean BCE per epoch
+    train_s: float = 0.0
+    n_train: int = 0  # rows actually trained on
+
+
+def finite_rows(
+    X: np.ndarray,
+    index: np.ndarray | None = None,
+    chunk_rows: int = 65536,
+) -> np.ndarray:
+    """Row numbers (from `index`, or all rows) whose features are all finite."""
+
+    idx = np.arange(len(X)) if index is None else np.asarray(index)
+    keep = np.empty(len(idx), dtype=bool)
+
+    for start in range(0, len(idx), chunk_rows):
+        rows = idx[start : start + chunk_rows]
+        keep[start : start + len(rows)] = np.isfinite(X[rows]).all(axis=1)
+
+    return idx[keep]
+
+
+def make_bundle(
+    model: MLPBCE,
+    feature_order: List[str],
+    scaler: StandardScaler,
+    model_cfg: ClfModelConfig,
+) -> ModelBundle:
+    """Package a trained network with its feature order and scaler."""
+
+    return ModelBundle(
+        model=model,
+        feature_order=list(feature_order),
+        scaler=scaler,
+        hidden_sizes=[int(h) for h in model_cfg.params.get("hidden_sizes", [64, 32])],
+        dropout=float(model_cfg.params.get("dropout", 0.0)),
+    )
+
+
+def train_mlp(
+    X: torch.Tensor,
+    y: torch.Tensor,
+    feature_order: List[str],
+    model_cfg: ClfModelConfig,
+    train_cfg: ClfTrainConfig,
+    train_idx: np.ndarray | None = None,
+    verbose: bool = True,
+) -> TrainResult:
+    """
+    Train an MLPBCE on the rows `train_idx` of (X, y) (all rows if None).
+
+    Minibatches are gathered from X by index, and the scaler is fitted in
+    row chunks, so only batch-sized copies of X are ever made. This lets
+    cross-validation folds train straight from one shared X. Rows with
+    non-finite features are skipped (see SplitConfig "cuts" to drop them
+    at split time instead).
+    """
+
+    t0 = time.perf_counter()
+
+    X_np = X.numpy()  # view, no copy
+
+    # NaN / inf rows would poison the scaler and the loss: skip them
+    idx = finite_rows(X_np, train_idx)
+    n_requested = len(X) if train_idx is None else len(train_idx)
+    if verbose and len(idx) < n_requested:
+        print(f"skipping {n_requested - len(idx)} training rows with non-finite features")
+
+    scaler = StandardScaler.fit(X_np, idx)
+    mean = torch.from_numpy(scaler.mean)
+    scale = torch.from_numpy(scaler.scale)
+
+    torch.manual_seed(train_cfg.seed)
+    model = MLPBCE.from_config(in_dim=X.shape[1], cfg=model_cfg)
+    optimizer = torch.optim.Adam(
+        model.parameters(), lr=train_cfg.lr, weight_decay=train_cfg.weight_decay
+    )
+    loss_fn = nn.BCEWithLogitsLoss()
+
+    gen = torch.Generator().manual_seed(train_cfg.seed)
+    idx_t = torch.from_numpy(idx)
+    history: List[float] = []
+
+    model.train()
+    for epoch in range(train_cfg.epochs):
+        order = idx_t[torch.randperm(len(idx_t), generator=gen)]
+        total, seen = 0.0, 0
+
+        for start in range(0, len(order), train_cfg.batch_size):
+            batch = order[start : start + train_cfg.batch_size]
+            xb = (X[batch] - mean) / scale
+            yb = y[batch]
+
+            optimizer.zero_grad(set_to_none=True)
+            loss = loss_fn(model(xb), yb)
+            loss.backward()
+            optimizer.step()
+
+            total += loss.item() * len(batch)
+            seen += len(batch)
+
+        history.append(total / max(seen, 1))
+        if verbose:
+            print(f"epoch {epoch + 1}/{train_cfg.epochs}  loss {history[-1]:.5f}")
+
+    model.eval()
+
+    return TrainResult(
+        bundle=make_bundle(model, feature_order, scaler, model_cfg),
+        epoch_loss=history,
+        train_s=time.perf_counter() - t0,
+        n_train=len(idx),
+    )
@@ -0,0 +1,95 @@
+# src/neutrino/prep/config/read_config.py
+import json
+from pathlib import Path
+from typing import Any, ClassVar
+from dataclasses import dataclass
+
+from neutrino.prep.io.memory import parse_bytes
+
+
+@dataclass
+class ReadConfig:
+    """
+    Dataclass wrapper for read-side configuration.
+
+    This loader handles JSON that controls how branches are pulled out of the
+    tree: how many entries are read per chunk, how many chunks may be
+    prefetched in the background while the current one is being processed,
+    how many worker processes share the reading of one file, the memory
+    budget from which chunk sizes are derived when no step size is given,
+    and how much decompressed data RootIO keeps cached between reads.
+    """
+
+    # -------------------------------------------------------------------------
+    # Instance attributes (unique per config object)
+    # -------------------------------------------------------------------------
+    step_size: int | None  # Entries per chunk (None → from memory_budget, else all)
+    prefetch_depth: int  # Chunks buffered ahead of the consumer (0 → no thread)
+    workers: int  # Reader processes for one file (1 → read in-process)
+    memory_budget: int | None  # Bytes a stage may hold (None → unlimited)
+    cache_size: int  # Bytes of decompressed arrays kept on RootIO (0 → off)
+    config_path: Path  # Path to the JSON file actually used
+
+    # -------------------------------------------------------------------------
+    # Class attributes (shared across all instances)
+    # -------------------------------------------------------------------------
+    DEFAULT_CONFIG_PATH: ClassVar[Path] = Path("configs") / "data" / "read_config.json"
+
+    # -------------------------------------------------------------------------
+    # Config loader
+    # -------------------------------------------------------------------------
+    @classmethod
+    def load_config(
+        cls,
+        path: Path | str | None = None,
+    ) -> "ReadConfig":
+        """
+        Load a ReadConfig instance from JSON.
+
+        Parameters
+        ----------
+        path : Path | str | None, optional
+            Path to a config JSON file. If None, uses DEFAULT_CONFIG_PATH.
+
+        Returns
+        -------
+        ReadConfig
+            Dataclass instance populated with config values.
+        """
+
+        # 1. Resolve path (either user-specified or default)
+        path = Path(path) if path else cls.DEFAULT_CONFIG_PATH
+
+        # 2. Load raw JSON dict
+        with open(path, "r", encoding="utf-8") as f:
+            raw: dict[str, Any] = json.load(f)
+
+        # 3. Parse fields explicitly
+
+        # Optional int: null in JSON means "no chunking"
+        raw_step = raw.get("step_size")
+        step_size: int | None = None if raw_step is None else int(raw_step)
+
+        prefetch_depth: int = int(raw.get("prefetch_depth", 0))
+        workers: int = int(raw.get("workers", 1))
+
+        # Human-readable size ("2 GB", "512 MiB") or null
+        memory_budget: int | None = parse_bytes(raw.get("memory_budget"))
+        cache_size: int = parse_bytes(raw.get("cache_size")) or 0
+
+        if step_size is not None and step_size <= 0:
+            raise ValueError(f"step_size must be positive, got {step_size}")
+        if prefetch_depth < 0:
+            raise ValueError(f"prefetch_depth must be >= 0, got {prefetch_depth}")
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+
+        # 4. Construct dataclass and return
+        return cls(
+            step_size=step_size,
+            prefetch_depth=prefetch_depth,
+            workers=workers,
+            memory_budget=memory_budget,
+            cache_size=cache_size,
+            config_path=path,
+        )
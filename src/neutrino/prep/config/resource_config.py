@@ -0,0 +1,78 @@
+# src/neutrino/prep/config/resource_config.py
+import json
+from pathlib import Path
+from typing import Any, ClassVar
+from dataclasses import dataclass
+
+
+@dataclass
+class ResourceConfig:
+    """
+    Dataclass wrapper for the CPU thread budget shared by the whole package.
+
+    This loader handles JSON that says how many cores the package may use
+    in total and how they are shared: each worker process (reader pool,
+    cross-validation fold) gets `threads_per_worker` threads for BLAS /
+    OpenMP and torch, and each open ROOT file may decompress baskets on
+    `decompression_threads` threads taken from its process's share.
+    """
+
+    # -------------------------------------------------------------------------
+    # Instance attributes (unique per config object)
+    # -------------------------------------------------------------------------
+    total_cores: int | None  # Cores for everything (None → cores usable by this process)
+    threads_per_worker: int | None  # Threads per worker process (None → even share)
+    decompression_threads: int | None  # uproot decompression threads (None → process share)
+    config_path: Path  # Path to the JSON file actually used
+
+    # -------------------------------------------------------------------------
+    # Class attributes (shared across all instances)
+    # -------------------------------------------------------------------------
+    DEFAULT_CONFIG_PATH: ClassVar[Path] = Path("configs") / "data" / "resource_config.json"
+
+    # -------------------------------------------------------------------------
+    # Config loader
+    # -------------------------------------------------------------------------
+    @classmethod
+    def load_config(
+        cls,
+        path: Path | str | None = None,
+    ) -> "ResourceConfig":
+        """
+        Load a ResourceConfig instance from JSON.
+
+        Parameters
+        ----------
+        path : Path | str | None, optional
+            Path to a config JSON file. If None, uses DEFAULT_CONFIG_PATH.
+
+        Returns
+        -------
+        ResourceConfig
+            Dataclass instance populated with config values.
+        """
+
+        # 1. Resolve path (either user-specified or default)
+        path = Path(path) if path else cls.DEFAULT_CONFIG_PATH
+
+        # 2. Load raw JSON dict
+        with open(path, "r", encoding="utf-8") as f:
+            raw: dict[str, Any] = json.load(f)
+
+        # 3. Parse fields explicitly
+
+        # Optional ints: null in JSON means "derive from the machine"
+        parsed: dict[str, int | None] = {}
+        for key in ("total_cores", "threads_per_worker", "decompression_threads"):
+            value = raw.get(key)
+            parsed[key] = None if value is None else int(value)
+            if parsed[key] is not None and parsed[key] < 1:
+                raise ValueError(f"{key} must be >= 1, got {parsed[key]}")
+
+        # 4. Construct dataclass and return
+        return cls(
+            total_cores=parsed["total_cores"],
+            threads_per_worker=parsed["threads_per_worker"],
+            decompression_threads=parsed["decompression_threads"],
+            config_path=path,
+        )
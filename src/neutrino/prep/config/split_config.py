@@ -25,6 +25,13 @@ class SplitConfig:
     target_branches: list[str]  # Features to extract from the tree
     type_group: dict[str, list[str]]  # Grouping of categories into A/B
     type_map: dict[str, int]  # Mapping of interaction types → numeric codes
+    output_dtypes: dict[str, str]  # Per-branch output dtype overrides
+    dtype_tolerance: float  # Max relative error allowed when downcasting floats
+    structured_output: bool  # Save record arrays (native dtypes) instead of a matrix
+    splits: list[dict[str, Any]]  # Extra split definitions run in one pass
+    cuts: list[dict[str, Any]]  # Preselection applied before every split
+    root_compression: str  # ROOT output compression, e.g. "ZLIB:1", "ZSTD:5", "none"
+    root_basket_entries: int  # Entries per basket (one extend call) in ROOT output
     config_path: Path  # Path to the JSON file actually used
 
     # -------------------------------------------------------------------------
@@ -90,6 +97,31 @@ class SplitConfig:
             str(lbl): int(code) for lbl, code in raw_type_map.items()
         }
 
+        # Optional output layout keys (absent → lossless, plain matrix)
+        raw_out_dtypes: dict[str, Any] = raw.get("output_dtypes", {})
+        output_dtypes: dict[str, str] = {
+            str(name): str(dt) for name, dt in raw_out_dtypes.items()
+        }
+        dtype_tolerance: float = float(raw.get("dtype_tolerance", 0.0))
+        structured_output: bool = bool(raw.get("structured_output", False))
+
+        # List of split definitions (see SplitSpec.from_dict)
+        raw_splits: list[Any] = raw.get("splits", [])
+        splits: list[dict[str, Any]] = [
+            {str(k): v for k, v in entry.items()} for entry in raw_splits
+        ]
+
+        # List of cut definitions (see Cut.from_dict), ANDed in order
+        raw_cuts: list[Any] = raw.get("cuts", [])
+        cuts: list[dict[str, Any]] = [
+            {str(k): v for k, v in entry.items()} for entry in raw_cuts
+        ]
+
+        # ROOT output settings (see SplitPair.save_root)
+        raw_root: dict[str, Any] = raw.get("root_output", {})
+        root_compression: str = str(raw_root.get("compression", "ZLIB:1"))
+        root_basket_entries: int = int(raw_root.get("basket_entries", 100_000))
+
         # 4. Construct dataclass and return
         return cls(
             flag_branch=flag_branch,
@@ -98,5 +130,12 @@ class SplitConfig:
             target_branches=target_branches,
             type_group=type_group,
             type_map=type_map,
+            output_dtypes=output_dtypes,
+            dtype_tolerance=dtype_tolerance,
+            structured_output=structured_output,
+            splits=splits,
+            cuts=cuts,
+            root_compression=root_compression,
+            root_basket_entries=root_basket_entries,
             config_path=path,
         )
@@ -11,14 +11,17 @@ class TreeConfig:
     Dataclass wrapper for tree-level configuration.
 
     This loader handles a JSON file that specifies the name of the tree to be read
-    from a ROOT file (or other tree-structured data source). The loader provides a
-    clean API for accessing config values inside Python code.
+    from a ROOT file (or other tree-structured data source), plus optional friend
+    trees: entry-aligned trees in the same or another file whose branches are read
+    alongside the main tree's. The loader provides a clean API for accessing config
+    values inside Python code.
     """
 
     # -------------------------------------------------------------------------
     # Instance attributes (unique per config object)
     # -------------------------------------------------------------------------
     tree_name: str  # Name of the tree to load
+    friends: list[dict[str, Any]]  # {"alias", "tree_name", "file_path" (None → same file)}
     config_path: Path  # Path to the JSON file actually used
 
     # -------------------------------------------------------------------------
@@ -57,8 +60,22 @@ class TreeConfig:
         # 3. Extract fields from dict
         tree_name = raw["tree_name"]
 
+        # Friend trees: alias defaults to the tree name, file to the main file
+        friends: list[dict[str, Any]] = []
+        for entry in raw.get("friends", []):
+            friend_tree = str(entry["tree_name"])
+            file_path = entry.get("file_path")
+            friends.append(
+                {
+                    "alias": str(entry.get("alias", friend_tree)),
+                    "tree_name": friend_tree,
+                    "file_path": None if file_path is None else Path(file_path),
+                }
+            )
+
         # 4. Construct dataclass and return
         return cls(
             tree_name=tree_name,
+            friends=friends,
             config_path=path,
         )
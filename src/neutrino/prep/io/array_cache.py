@@ -0,0 +1,177 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+# (file, tree, branch, entry_start, entry_stop)
+CacheKey = tuple[str, str, str, int, int]
+
+
+@dataclass
+class CacheStats:
+    """Counters for one ArrayCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    bytes: int = 0  # currently held
+    entries: int = 0  # currently held
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def report(self) -> None:
+        print("---------- Array cache ----------")
+        print(f"hits: {self.hits}  misses: {self.misses}  hit rate: {self.hit_rate:.1%}")
+        print(f"evictions: {self.evictions}")
+        print(f"held: {self.entries} arrays, {self.bytes / 1024**2:.1f} MB")
+
+
+class ArrayCache:
+    """
+    Size-bounded LRU cache of decompressed branch arrays.
+
+    Arrays are keyed by (file, tree, branch, entry_start, entry_stop). A
+    request for a sub-range of a cached range is served as a view. Cached
+    arrays are made read-only, since every later reader shares them;
+    callers that modify a result in place should copy it first.
+    Branches can be pinned so they are never evicted. Thread-safe: the
+    prefetch and summary threads share one cache.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+    ) -> None:
+
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+        self._data: OrderedDict[CacheKey, np.ndarray] = OrderedDict()
+        self._pinned: set[tuple[str, str, str]] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    # ---------- lookup / insert ----------
+    def get(
+        self,
+        key: CacheKey,
+    ) -> np.ndarray | None:
+
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            arr = self._data.get(key)
+
+            if arr is None:
+                # Any cached range covering the request serves it as a view
+                file, tree, branch, start, stop = key
+                for (f, t, b, s, e), cached in self._data.items():
+                    if (f, t, b) == (file, tree, branch) and s <= start and stop <= e:
+                        key = (f, t, b, s, e)
+                        arr = cached[start - s : stop - s]
+                        break
+
+            if arr is None:
+                self.stats.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.stats.hits += 1
+            return arr
+
+    def put(
+        self,
+        key: CacheKey,
+        arr: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Cache `arr` and return it (or the copy already cached).
+
+        Only arrays the cache keeps are made read-only, since later readers
+        share them; arrays it does not keep (cache disabled or larger than
+        max_bytes) are returned untouched and stay writeable.
+        """
+
+        if not self.enabled or arr.nbytes > self.max_bytes:
+            return arr
+
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+
+            arr.flags.writeable = False
+            self._data[key] = arr
+            self.stats.bytes += arr.nbytes
+            self.stats.entries += 1
+            self._shrink()
+
+        return arr
+
+    def _shrink(self) -> None:
+        """Evict least-recently-used, unpinned arrays until within budget."""
+
+        for key in list(self._data):
+            if self.stats.bytes <= self.max_bytes:
+                break
+            if key[:3] in self._pinned:
+                continue
+            self._drop(key)
+            self.stats.evictions += 1
+
+    def _drop(
+        self,
+        key: CacheKey,
+    ) -> None:
+
+        arr = self._data.pop(key)
+        self.stats.bytes -= arr.nbytes
+        self.stats.entries -= 1
+
+    # ---------- explicit control ----------
+    def pin(
+        self,
+        file: str,
+        tree: str,
+        branch: str,
+    ) -> None:
+        """Never evict arrays of this branch (until unpinned)."""
+
+        with self._lock:
+            self._pinned.add((file, tree, branch))
+
+    def unpin(
+        self,
+        file: str,
+        tree: str,
+        branch: str,
+    ) -> None:
+
+        with self._lock:
+            self._pinned.discard((file, tree, branch))
+            self._shrink()
+
+    def evict(
+        self,
+        branch: str | None = None,
+    ) -> int:
+        """Drop every array (or every array of `branch`), pinned or not."""
+
+        with self._lock:
+            keys = [k for k in self._data if branch is None or k[2] == branch]
+            for key in keys:
+                self._drop(key)
+            self.stats.evictions += len(keys)
+
+        return len(keys)
+
+    def clear(self) -> None:
+        self.evict()
@@ -0,0 +1,448 @@
+import math
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    Mergeable approximate-quantile sketch (KLL-style compactors).
+
+    Level i holds items that each stand for 2**i original values. When a
+    level grows past `k` items it is sorted and every other item (random
+    offset) is promoted to the next level, so memory stays O(k log(n/k))
+    while two sketches can be merged level by level.
+    """
+
+    def __init__(
+        self,
+        k: int = 256,
+        seed: int | None = None,
+    ) -> None:
+
+        self.k = k
+        self.n = 0
+        self.levels: list[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    def _compress(self) -> None:
+
+        lvl = 0
+        while lvl < len(self.levels):
+            items = self.levels[lvl]
+
+            if items.size > self.k:
+                items = np.sort(items)
+
+                # An odd leftover stays behind so no weight is lost
+                keep = items[-1:] if items.size % 2 else items[:0]
+                pairs = items[: items.size - keep.size]
+
+                promoted = pairs[int(self._rng.integers(2)) :: 2]
+
+                self.levels[lvl] = keep
+                if lvl + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                self.levels[lvl + 1] = np.concatenate([self.levels[lvl + 1], promoted])
+
+            lvl += 1
+
+    def update(
+        self,
+        values: np.ndarray,
+    ) -> None:
+
+        values = np.asarray(values, dtype=np.float64).reshape(-1)
+        if values.size == 0:
+            return
+
+        self.n += int(values.size)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(
+        self,
+        other: "QuantileSketch",
+    ) -> None:
+
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+
+        for lvl, items in enumerate(other.levels):
+            self.levels[lvl] = np.concatenate([self.levels[lvl], items])
+
+        self.n += other.n
+        self._compress()
+
+    def quantiles(
+        self,
+        probs: Iterable[float],
+    ) -> list[float]:
+
+        probs = list(probs)
+        if self.n == 0:
+            return [math.nan for _ in probs]
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(lvl_items.size, 2**lvl, dtype=np.float64)
+             for lvl, lvl_items in enumerate(self.levels)]
+        )
+
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cum = np.cumsum(weights[order])
+
+        ranks = np.asarray(probs, dtype=np.float64) * cum[-1]
+        pos = np.searchsorted(cum, ranks, side="left").clip(0, items.size - 1)
+
+        return [float(v) for v in items[pos]]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "k": self.k,
+            "n": self.n,
+            "levels": [lvl.tolist() for lvl in self.levels],
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        raw: dict[str, Any],
+    ) -> "QuantileSketch":
+
+        sketch = cls(k=int(raw["k"]))
+        sketch.n = int(raw["n"])
+        sketch.levels = [np.asarray(lvl, dtype=np.float64) for lvl in raw["levels"]]
+        return sketch
+
+
+class AdaptiveHistogram:
+    """
+    Mergeable histogram on a power-of-two grid.
+
+    Bins have width 2**exp and edges at integer multiples of that width, so
+    any two histograms can be aligned exactly: the finer one is coarsened
+    (adjacent bins summed) until widths match. The range grows as data
+    arrives and never exceeds `max_bins` bins.
+    """
+
+    def __init__(
+        self,
+        max_bins: int = 64,
+    ) -> None:
+
+        if max_bins < 2:
+            raise ValueError(f"max_bins must be >= 2, got {max_bins}")
+
+        self.max_bins = max_bins
+        self.exp: int | None = None  # bin width = 2**exp
+        self.start: int = 0  # grid index of the first bin
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    @property
+    def width(self) -> float:
+        return 0.0 if self.exp is None else 2.0**self.exp
+
+    @property
+    def edges(self) -> np.ndarray:
+        idx = self.start + np.arange(self.counts.size + 1, dtype=np.float64)
+        return idx * self.width
+
+    def _coarsen(self) -> None:
+        """Double the bin width, summing pairs of adjacent bins."""
+
+        assert self.exp is not None
+
+        new_start = self.start // 2
+        offset = self.start - 2 * new_start  # 0 or 1
+
+        padded = np.concatenate(
+            [np.zeros(offset, dtype=np.int64), self.counts]
+        )
+        if padded.size % 2:
+            padded = np.concatenate([padded, np.zeros(1, dtype=np.int64)])
+
+        self.counts = padded.reshape(-1, 2).sum(axis=1)
+        self.start = new_start
+        self.exp += 1
+
+    def _cover(
+        self,
+        lo: float,
+        hi: float,
+    ) -> None:
+        """Grow (and coarsen as needed) so that [lo, hi] lies on the grid."""
+
+        if self.exp is None:
+            span = hi - lo
+            if span == 0:
+                span = max(abs(lo), 1.0)
+            self.exp = math.ceil(math.log2(span / self.max_bins))
+            # Finer bins than float64 resolution are meaningless (and would
+            # overflow the int64 grid index)
+            magnitude = max(abs(lo), abs(hi), 1e-300)
+            self.exp = max(self.exp, math.frexp(magnitude)[1] - 52)
+            self.start = math.floor(lo / self.width)
+
+        while True:
+            i_lo = min(self.start, math.floor(lo / self.width))
+            i_hi = max(
+                self.start + self.counts.size - 1,
+                math.floor(hi / self.width),
+            )
+            if i_hi - i_lo + 1 <= self.max_bins:
+                break
+            self._coarsen()
+
+        grown = np.zeros(i_hi - i_lo + 1, dtype=np.int64)
+        at = self.start - i_lo
+        grown[at : at + self.counts.size] = self.counts
+
+        self.counts = grown
+        self.start = i_lo
+
+    def update(
+        self,
+        values: np.ndarray,
+    ) -> None:
+
+        values = np.asarray(values, dtype=np.float64).reshape(-1)
+        if values.size == 0:
+            return
+
+        self._cover(float(values.min()), float(values.max()))
+
+        idx = np.floor(values / self.width).astype(np.int64) - self.start
+        np.clip(idx, 0, self.counts.size - 1, out=idx)
+
+        self.counts += np.bincount(idx, minlength=self.counts.size)
+
+    def merge(
+        self,
+        other: "AdaptiveHistogram",
+    ) -> None:
+
+        if other.exp is None:
+            return
+        if self.exp is None:
+            self.exp = other.exp
+            self.start = other.start
+            self.counts = other.counts.copy()
+            return
+
+        other = other.copy()
+
+        # Align widths by coarsening the finer histogram
+        while self.exp < other.exp:
+            self._coarsen()
+        while other.exp < self.exp:
+            other._coarsen()
+
+        lo = other.start * other.width
+        hi = (other.start + other.counts.size - 1) * other.width
+        self._cover(lo, hi)
+
+        # _cover may have coarsened self again
+        while other.exp < self.exp:
+            other._coarsen()
+
+        at = other.start - self.start
+        self.counts[at : at + other.counts.size] += other.counts
+
+    def copy(self) -> "AdaptiveHistogram":
+        h = AdaptiveHistogram(self.max_bins)
+        h.exp = self.exp
+        h.start = self.start
+        h.counts = self.counts.copy()
+        return h
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "max_bins": self.max_bins,
+            "exp": self.exp,
+            "start": self.start,
+            "counts": self.counts.tolist(),
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        raw: dict[str, Any],
+    ) -> "AdaptiveHistogram":
+
+        h = cls(int(raw["max_bins"]))
+        h.exp = None if raw["exp"] is None else int(raw["exp"])
+        h.start = int(raw["start"])
+        h.counts = np.asarray(raw["counts"], dtype=np.int64)
+        return h
+
+
+@dataclass
+class BranchSummary:
+    """
+    One-pass, mergeable summary of a numeric branch.
+
+    Moments use Chan's parallel update so per-chunk (or per-worker) partial
+    summaries combine exactly; the histogram and quantile sketch are
+    mergeable as well.
+    """
+
+    name: str
+    count: int = 0  # finite values
+    nan_count: int = 0
+    inf_count: int = 0
+    min: float = math.inf
+    max: float = -math.inf
+    mean: float = 0.0
+    m2: float = 0.0  # sum of squared deviations from the mean
+    integral: bool = True  # every finite value is a whole number
+    hist: AdaptiveHistogram = field(default_factory=AdaptiveHistogram)
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    DEFAULT_PROBS = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+    @classmethod
+    def empty(
+        cls,
+        name: str,
+        max_bins: int = 64,
+        sketch_k: int = 256,
+    ) -> "BranchSummary":
+
+        return cls(
+            name=name,
+            hist=AdaptiveHistogram(max_bins),
+            sketch=QuantileSketch(sketch_k),
+        )
+
+    # ---------- accumulation ----------
+    def _merge_moments(
+        self,
+        n_b: int,
+        mean_b: float,
+        m2_b: float,
+    ) -> None:
+
+        n_a = self.count
+        n = n_a + n_b
+        if n_b == 0:
+            return
+
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * n_a * n_b / n
+        self.count = n
+
+    def update(
+        self,
+        arr: np.ndarray,
+    ) -> None:
+
+        arr = np.asarray(arr)
+
+        # Jagged branches come back as object arrays of sub-arrays
+        if arr.dtype == object:
+            arr = np.concatenate(list(arr)) if arr.size else np.empty(0)
+
+        arr = arr.reshape(-1)
+
+        if arr.dtype.kind in "biu":
+            finite = arr.astype(np.float64)
+        else:
+            arr = arr.astype(np.float64, copy=False)
+            nan = np.isnan(arr)
+            ok = np.isfinite(arr)
+            self.nan_count += int(nan.sum())
+            self.inf_count += int(arr.size - ok.sum() - nan.sum())
+            finite = arr[ok]
+            if finite.size:
+                self.integral = self.integral and bool(
+                    np.all(finite == np.floor(finite))
+                )
+
+        if finite.size == 0:
+            return
+
+        self.min = min(self.min, float(finite.min()))
+        self.max = max(self.max, float(finite.max()))
+
+        mean_b = float(finite.mean())
+        m2_b = float(np.sum((finite - mean_b) ** 2))
+        self._merge_moments(int(finite.size), mean_b, m2_b)
+
+        self.hist.update(finite)
+        self.sketch.update(finite)
+
+    def merge(
+        self,
+        other: "BranchSummary",
+    ) -> None:
+
+        self.nan_count += other.nan_count
+        self.inf_count += other.inf_count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.integral = self.integral and other.integral
+        self._merge_moments(other.count, other.mean, other.m2)
+        self.hist.merge(other.hist)
+        self.sketch.merge(other.sketch)
+
+    # ---------- results ----------
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / self.count) if self.count else math.nan
+
+    def quantiles(
+        self,
+        probs: Iterable[float] = DEFAULT_PROBS,
+    ) -> dict[float, float]:
+
+        probs = list(probs)
+        return dict(zip(probs, self.sketch.quantiles(probs)))
+
+    def report(self) -> None:
+        print(f"---------- {self.name} ----------")
+        print(f"count: {self.count}  nan: {self.nan_count}  inf: {self.inf_count}")
+        print(f"min: {self.min:.6g}  max: {self.max:.6g}")
+        print(f"mean: {self.mean:.6g}  std: {self.std:.6g}")
+        qs = "  ".join(f"q{p:g}: {v:.6g}" for p, v in self.quantiles().items())
+        print(qs)
+
+    # ---------- (de)serialization for the metadata sidecar ----------
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "nan_count": self.nan_count,
+            "inf_count": self.inf_count,
+            # JSON has no infinities; None marks "no finite value seen"
+            "min": None if self.count == 0 else self.min,
+            "max": None if self.count == 0 else self.max,
+            "mean": self.mean,
+            "m2": self.m2,
+            "integral": self.integral,
+            "hist": self.hist.to_dict(),
+            "sketch": self.sketch.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        raw: dict[str, Any],
+    ) -> "BranchSummary":
+
+        return cls(
+            name=str(raw["name"]),
+            count=int(raw["count"]),
+            nan_count=int(raw["nan_count"]),
+            inf_count=int(raw["inf_count"]),
+            min=math.inf if raw["min"] is None else float(raw["min"]),
+            max=-math.inf if raw["max"] is None else float(raw["max"]),
+            mean=float(raw["mean"]),
+            m2=float(raw["m2"]),
+            integral=bool(raw["integral"]),
+            hist=AdaptiveHistogram.from_dict(raw["hist"]),
+            sketch=QuantileSketch.from_dict(raw["sketch"]),
+        )
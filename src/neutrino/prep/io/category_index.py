@@ -0,0 +1,333 @@
+import json
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from neutrino.prep.io.tree_ref import TreeRef
+from neutrino.prep.io.tree_reader import TreeReader
+from neutrino.prep.io.sidecar import identity_matches
+
+# Number of set bits in every possible byte (popcount lookup)
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class EntrySet:
+    """
+    A set of entry numbers of one tree, stored as a packed bitmap.
+
+    Sets over the same tree combine with `&`, `|` and `~` using bitwise
+    operations on the packed bytes, so predicates such as
+    "Interaction_Type in {QE, RES, DIS} and Sample_Flag == 1" never touch
+    per-entry Python objects.
+    """
+
+    def __init__(
+        self,
+        bits: np.ndarray,
+        num_entries: int,
+    ) -> None:
+
+        self.bits = bits  # uint8, np.packbits layout (big bit order)
+        self.num_entries = num_entries
+
+    @classmethod
+    def from_indices(
+        cls,
+        indices: np.ndarray,
+        num_entries: int,
+    ) -> "EntrySet":
+
+        mask = np.zeros(num_entries, dtype=bool)
+        mask[indices] = True
+        return cls(np.packbits(mask), num_entries)
+
+    @classmethod
+    def from_mask(
+        cls,
+        mask: np.ndarray,
+    ) -> "EntrySet":
+
+        mask = np.asarray(mask, dtype=bool)
+        return cls(np.packbits(mask), int(mask.size))
+
+    @classmethod
+    def empty(
+        cls,
+        num_entries: int,
+    ) -> "EntrySet":
+
+        return cls(np.zeros((num_entries + 7) // 8, dtype=np.uint8), num_entries)
+
+    # ---------- set algebra ----------
+    def _check(
+        self,
+        other: "EntrySet",
+    ) -> None:
+
+        if other.num_entries != self.num_entries:
+            raise ValueError(
+                f"EntrySets cover different trees: {self.num_entries} vs "
+                f"{other.num_entries} entries"
+            )
+
+    def __and__(self, other: "EntrySet") -> "EntrySet":
+        self._check(other)
+        return EntrySet(np.bitwise_and(self.bits, other.bits), self.num_entries)
+
+    def __or__(self, other: "EntrySet") -> "EntrySet":
+        self._check(other)
+        return EntrySet(np.bitwise_or(self.bits, other.bits), self.num_entries)
+
+    def __invert__(self) -> "EntrySet":
+        bits = np.bitwise_not(self.bits)
+        # Clear the padding bits past the last entry
+        tail = self.num_entries % 8
+        if tail:
+            bits[-1] &= np.uint8((0xFF << (8 - tail)) & 0xFF)
+        return EntrySet(bits, self.num_entries)
+
+    def __len__(self) -> int:
+        return int(_POPCOUNT[self.bits].sum(dtype=np.int64))
+
+    # ---------- views ----------
+    def mask(
+        self,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> np.ndarray:
+        """Boolean mask for entries [start, stop)."""
+
+        if stop is None:
+            stop = self.num_entries
+
+        # Unpack only the bytes covering the requested range
+        first = start // 8
+        last = (stop + 7) // 8
+        unpacked = np.unpackbits(self.bits[first:last]).view(bool)
+
+        offset = start - first * 8
+        return unpacked[offset : offset + (stop - start)]
+
+    def indices(self) -> np.ndarray:
+        """Sorted entry numbers in the set."""
+
+        return np.flatnonzero(self.mask())
+
+
+class CategoryIndex:
+    """
+    Persistent index of a low-cardinality branch (e.g. Sample_Flag).
+
+    For every distinct code the index stores the entries holding it,
+    either as a sorted entry list or as a packed bitmap, whichever is
+    smaller. Bitmaps stay packed after loading (as EntrySets), so queries
+    over dense codes are bitwise operations on uint8 bytes. The index is
+    built in one chunked pass, saved next to the ROOT file as
+    `<file>.<tree>.<branch>.index.npz`, and only reused while the recorded
+    file identity still matches.
+    """
+
+    SUFFIX = ".index.npz"
+    MAX_CODES = 256  # refuse to index branches that are not categorical
+
+    def __init__(
+        self,
+        ref: TreeRef,
+        branch: str,
+        num_entries: int,
+        entries: dict[int, np.ndarray],
+        sets: dict[int, EntrySet] | None = None,
+    ) -> None:
+
+        self.ref = ref
+        self.branch = branch
+        self.num_entries = num_entries
+
+        # code → sorted int entry list; codes loaded packed are only in _sets
+        self._entries = entries
+        # code → packed bitmap (loaded, or packed from _entries on first use)
+        self._sets: dict[int, EntrySet] = dict(sets or {})
+
+    # ---------- paths ----------
+    @classmethod
+    def path_for(
+        cls,
+        ref: TreeRef,
+        branch: str,
+    ) -> Path:
+
+        root = ref.io.root_path
+        return root.with_name(f"{root.name}.{ref.tree_name}.{branch}{cls.SUFFIX}")
+
+    # ---------- build / persist ----------
+    @classmethod
+    def build(
+        cls,
+        ref: TreeRef,
+        branch: str,
+        step_size: int | None = None,
+    ) -> "CategoryIndex":
+
+        reader = TreeReader(ref)
+        pieces: dict[int, list[np.ndarray]] = {}
+        offset = 0
+
+        for chunk in reader.iter_chunks([branch], step_size=step_size):
+            values = chunk[branch]
+
+            if values.dtype.kind == "f":
+                if not np.all(values == np.floor(values)):
+                    raise ValueError(f"Branch {branch!r} holds non-integer values.")
+            values = values.astype(np.int64, copy=False)
+
+            codes = np.unique(values)
+            for code in codes.tolist():
+                pieces.setdefault(code, []).append(
+                    np.flatnonzero(values == code) + offset
+                )
+
+            if len(pieces) > cls.MAX_CODES:
+                raise ValueError(
+                    f"Branch {branch!r} has more than {cls.MAX_CODES} distinct "
+                    "values; it is not categorical."
+                )
+
+            offset += int(values.size)
+
+        entry_dtype = np.uint32 if offset < 2**32 else np.uint64
+        entries = {
+            code: np.concatenate(parts).astype(entry_dtype)
+            for code, parts in sorted(pieces.items())
+        }
+
+        return cls(ref, branch, offset, entries)
+
+    def save(self) -> Path:
+
+        path = self.path_for(self.ref, self.branch)
+        bitmap_bytes = (self.num_entries + 7) // 8
+
+        arrays: dict[str, np.ndarray] = {}
+
+        for code in self.codes:
+            entries = self._entries.get(code)
+            # Dense codes are cheaper as bitmaps, rare ones as entry lists
+            if entries is None:
+                arrays[f"bits_{code}"] = self._sets[code].bits
+            elif entries.nbytes > bitmap_bytes:
+                arrays[f"bits_{code}"] = np.packbits(self._mask_for(code))
+            else:
+                arrays[f"list_{code}"] = entries
+
+        meta = {
+            "identity": self.ref.io.file_identity(),
+            "tree_name": self.ref.tree_name,
+            "branch": self.branch,
+            "num_entries": self.num_entries,
+        }
+        arrays["meta"] = np.array(json.dumps(meta))
+
+        np.savez_compressed(path, **arrays)
+        return path
+
+    @classmethod
+    def load(
+        cls,
+        ref: TreeRef,
+        branch: str,
+    ) -> "CategoryIndex | None":
+        """Load the sidecar index, or None if missing or out of date."""
+
+        path = cls.path_for(ref, branch)
+        if not path.is_file():
+            return None
+
+        with np.load(path) as npz:
+            meta = json.loads(str(npz["meta"]))
+
+            if not identity_matches(meta["identity"], ref.io.file_identity()):
+                return None
+            if meta["tree_name"] != ref.tree_name or meta["branch"] != branch:
+                return None
+
+            num_entries = int(meta["num_entries"])
+            entries: dict[int, np.ndarray] = {}
+            sets: dict[int, EntrySet] = {}
+
+            for key in npz.files:
+                kind, _, code = key.partition("_")
+                if kind == "list":
+                    entries[int(code)] = npz[key]
+                elif kind == "bits":
+                    # Kept packed: 1 bit per entry instead of 8 bytes per hit
+                    sets[int(code)] = EntrySet(npz[key], num_entries)
+
+        return cls(ref, branch, num_entries, entries, sets)
+
+    @classmethod
+    def open(
+        cls,
+        ref: TreeRef,
+        branch: str,
+        rebuild: bool = False,
+    ) -> "CategoryIndex":
+        """Load a valid sidecar index, building (and saving) it if needed."""
+
+        index = None if rebuild else cls.load(ref, branch)
+
+        if index is None:
+            index = cls.build(ref, branch)
+            index.save()
+
+        return index
+
+    # ---------- queries ----------
+    def _mask_for(
+        self,
+        code: int,
+    ) -> np.ndarray:
+
+        if code not in self._entries:
+            return self._sets[code].mask()
+
+        mask = np.zeros(self.num_entries, dtype=bool)
+        mask[self._entries[code]] = True
+        return mask
+
+    @property
+    def codes(self) -> list[int]:
+        return sorted({*self._entries, *self._sets})
+
+    @property
+    def counts(self) -> dict[int, int]:
+        return {
+            code: (
+                int(self._entries[code].size)
+                if code in self._entries
+                else len(self._sets[code])
+            )
+            for code in self.codes
+        }
+
+    def where(
+        self,
+        codes: int | Iterable[int],
+    ) -> EntrySet:
+        """Entries whose value is `codes` (or any of them)."""
+
+        if isinstance(codes, (int, np.integer)):
+            codes = [int(codes)]
+
+        result = EntrySet.empty(self.num_entries)
+
+        for code in codes:
+            if code not in self._entries and code not in self._sets:
+                continue  # code never occurs → contributes nothing
+            if code not in self._sets:
+                self._sets[code] = EntrySet(
+                    np.packbits(self._mask_for(code)), self.num_entries
+                )
+            result = result | self._sets[code]
+
+        return result
@@ -0,0 +1,120 @@
+import re
+import sys
+from dataclasses import dataclass
+
+_UNITS: dict[str, int] = {
+    "": 1,
+    "b": 1,
+    "kb": 1000,
+    "mb": 1000**2,
+    "gb": 1000**3,
+    "tb": 1000**4,
+    "kib": 1024,
+    "mib": 1024**2,
+    "gib": 1024**3,
+    "tib": 1024**4,
+}
+
+
+def parse_bytes(
+    value: str | int | float | None,
+) -> int | None:
+    """Parse sizes like "2 GB", "512MiB" or 1e9 into a byte count."""
+
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+
+    m = re.fullmatch(r"\s*([0-9]*\.?[0-9]+)\s*([A-Za-z]*)\s*", value)
+    if m is None or m.group(2).lower() not in _UNITS:
+        raise ValueError(f"Cannot parse memory size: {value!r}")
+
+    return int(float(m.group(1)) * _UNITS[m.group(2).lower()])
+
+
+def peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process so far (None if unknown)."""
+
+    try:
+        import resource
+    except ImportError:  # Windows
+        resource = None  # type: ignore[assignment]
+
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KiB, macOS reports bytes
+        return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+    try:
+        import psutil  # optional
+    except ImportError:
+        return None
+
+    info = psutil.Process().memory_info()
+    return int(getattr(info, "peak_wset", info.rss))
+
+
+@dataclass(frozen=True)
+class MemoryBudget:
+    """
+    A per-process memory budget in bytes (None → unlimited).
+
+    Stages turn the budget into a chunk size from the bytes each entry
+    occupies and the number of live copies of a chunk they hold at once,
+    and report the actual peak RSS against it afterwards.
+    """
+
+    limit: int | None
+
+    @classmethod
+    def parse(
+        cls,
+        value: str | int | float | None,
+    ) -> "MemoryBudget":
+        return cls(parse_bytes(value))
+
+    def entries_per_chunk(
+        self,
+        bytes_per_entry: float,
+        live_copies: float,
+    ) -> int | None:
+        """Largest chunk whose `live_copies` copies fit in the budget."""
+
+        if self.limit is None:
+            return None
+
+        per_entry = max(bytes_per_entry, 1.0) * max(live_copies, 1.0)
+        return max(1, int(self.limit // per_entry))
+
+    def fits(
+        self,
+        need_bytes: float,
+    ) -> bool:
+        """True if a stage holding `need_bytes` stays within the budget."""
+        return self.limit is None or need_bytes <= self.limit
+
+    def check(
+        self,
+        stage: str,
+    ) -> bool:
+        """Print peak RSS against the budget; False if it was exceeded."""
+
+        peak = peak_rss_bytes()
+
+        if peak is None:
+            print(f"[{stage}] peak RSS unavailable on this platform")
+            return True
+
+        mb = 1024**2
+        if self.limit is None:
+            print(f"[{stage}] peak RSS: {peak / mb:.1f} MB (no budget)")
+            return True
+
+        ok = peak <= self.limit
+        status = "within" if ok else "OVER"
+        print(
+            f"[{stage}] peak RSS: {peak / mb:.1f} MB, "
+            f"{status} budget of {self.limit / mb:.1f} MB"
+        )
+        return ok
@@ -0,0 +1,120 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from neutrino.prep.io.root_io import RootIO
+from neutrino.prep.io.tree_meta import TreeMeta
+
+
+@dataclass(frozen=True)
+class EntryRange:
+    """Half-open entry range [start, stop) of one tree."""
+
+    start: int
+    stop: int
+
+    @property
+    def size(self) -> int:
+        return self.stop - self.start
+
+
+class PartitionPlanner:
+    """
+    Cut a tree into balanced, basket-aligned entry ranges.
+
+    Candidate cut points are the cluster boundaries shared by all requested
+    branches (TreeMeta.get_cluster_boundaries), so no basket is ever read by
+    two workers. Each cluster is weighted by the compressed bytes of the
+    baskets it contains, and ranges are cut where the cumulative weight is
+    closest to an even share.
+    """
+
+    def __init__(
+        self,
+        meta: TreeMeta,
+    ) -> None:
+
+        self.meta = meta
+
+    def cluster_weights(
+        self,
+        branches: list[str],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(cluster boundaries, compressed bytes per cluster)."""
+
+        bounds = np.asarray(self.meta.get_cluster_boundaries(branches), dtype=np.int64)
+        weights = np.zeros(max(bounds.size - 1, 0), dtype=np.int64)
+
+        for name in branches:
+            starts, sizes = self.meta.get_basket_bytes(name)
+            # Attribute each basket to the cluster its first entry falls in
+            cluster = np.searchsorted(bounds, starts, side="right") - 1
+            np.add.at(weights, cluster.clip(0, weights.size - 1), sizes)
+
+        return bounds, weights
+
+    def plan(
+        self,
+        branches: Iterable[str],
+        n_parts: int,
+    ) -> list[EntryRange]:
+
+        cols = list(dict.fromkeys(branches))
+        if n_parts < 1:
+            raise ValueError(f"n_parts must be >= 1, got {n_parts}")
+
+        bounds, weights = self.cluster_weights(cols)
+
+        if weights.size == 0:
+            return []
+
+        # Fall back to entry counts if the basket sizes are unavailable
+        if weights.sum() == 0:
+            weights = np.diff(bounds)
+
+        cum = np.concatenate([[0], np.cumsum(weights)])
+        targets = cum[-1] * np.arange(1, n_parts) / n_parts
+
+        # Boundary index closest to each even share, kept strictly increasing
+        cuts = [0]
+        for t in targets:
+            i = int(np.argmin(np.abs(cum - t)))
+            if i > cuts[-1] and i < bounds.size - 1:
+                cuts.append(i)
+        cuts.append(bounds.size - 1)
+
+        return [
+            EntryRange(int(bounds[i]), int(bounds[j]))
+            for i, j in zip(cuts[:-1], cuts[1:])
+        ]
+
+
+def read_range(
+    root_path: str,
+    tree_name: str,
+    branches: list[str],
+    start: int,
+    stop: int,
+) -> dict[str, np.ndarray]:
+    """Process-pool entry point: read one entry range with a private handle."""
+
+    with RootIO(Path(root_path)) as rio:
+        tree = rio._handle[tree_name]
+        arrs = tree.arrays(branches, entry_start=start, entry_stop=stop, library="np")
+        return {name: arrs[name] for name in branches}
+
+
+def read_joined_range(
+    trees: list[tuple[str, str, list[str]]],
+    start: int,
+    stop: int,
+) -> list[dict[str, np.ndarray]]:
+    """Process-pool entry point: one entry range of several aligned trees,
+    given as (root_path, tree_name, branches)."""
+
+    return [
+        read_range(root_path, tree_name, branches, start, stop)
+        for root_path, tree_name, branches in trees
+    ]
@@ -0,0 +1,152 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Generic, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class PrefetchStats:
+    """Timing book-keeping for one pass through a Prefetcher."""
+
+    depth: int = 0
+    items: int = 0
+    read_s: float = 0.0  # producer time spent pulling items from the source
+    producer_stall_s: float = 0.0  # producer blocked on a full queue
+    consumer_stall_s: float = 0.0  # consumer blocked on an empty queue
+
+    def report(self) -> None:
+        print("---------- Prefetch ----------")
+        print(f"depth: {self.depth}")
+        print(f"chunks: {self.items}")
+        print(f"read time: {self.read_s:.3f} s")
+        print(f"producer stall: {self.producer_stall_s:.3f} s")
+        print(f"consumer stall: {self.consumer_stall_s:.3f} s")
+
+
+class _Done:
+    """Sentinel pushed by the producer once the source is exhausted."""
+
+
+class _Failure:
+    """Carries an exception from the producer thread to the consumer."""
+
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+class Prefetcher(Generic[T]):
+    """
+    Double-buffered wrapper around an iterator.
+
+    A background thread pulls items from `source` into a bounded queue of
+    size `depth`, so item k+1 is read (and decompressed) while the caller
+    is still working on item k. With depth == 0 no thread is started and
+    the source is iterated inline.
+    """
+
+    def __init__(
+        self,
+        source: Iterable[T],
+        depth: int = 2,
+    ) -> None:
+
+        if depth < 0:
+            raise ValueError(f"depth must be >= 0, got {depth}")
+
+        self.source = source
+        self.depth = depth
+        self.stats = PrefetchStats(depth=depth)
+
+        self._stop = threading.Event()
+
+    def _produce(
+        self,
+        q: "queue.Queue[object]",
+    ) -> None:
+
+        it = iter(self.source)
+
+        try:
+            while not self._stop.is_set():
+                t0 = time.perf_counter()
+                try:
+                    item = next(it)
+                except StopIteration:
+                    break
+                self.stats.read_s += time.perf_counter() - t0
+
+                # Block until there is room, but wake up regularly so that a
+                # consumer which stopped early can shut us down.
+                t0 = time.perf_counter()
+                while not self._stop.is_set():
+                    try:
+                        q.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                self.stats.producer_stall_s += time.perf_counter() - t0
+
+        except BaseException as exc:  # forwarded to the consumer
+            q.put(_Failure(exc))
+            return
+
+        q.put(_Done())
+
+    def _iter_inline(self) -> Iterator[T]:
+
+        it = iter(self.source)
+
+        while True:
+            # Without a producer thread every read is a consumer stall.
+            t0 = time.perf_counter()
+            try:
+                item = next(it)
+            except StopIteration:
+                return
+            dt = time.perf_counter() - t0
+            self.stats.read_s += dt
+            self.stats.consumer_stall_s += dt
+            self.stats.items += 1
+            yield item
+
+    def _iter_threaded(self) -> Iterator[T]:
+
+        q: "queue.Queue[object]" = queue.Queue(maxsize=self.depth)
+        worker = threading.Thread(
+            target=self._produce,
+            args=(q,),
+            name="neutrino-prefetch",
+            daemon=True,
+        )
+        worker.start()
+
+        try:
+            while True:
+                t0 = time.perf_counter()
+                item = q.get()
+                self.stats.consumer_stall_s += time.perf_counter() - t0
+
+                if isinstance(item, _Done):
+                    return
+                if isinstance(item, _Failure):
+                    raise item.exc
+
+                self.stats.items += 1
+                yield item  # type: ignore[misc]
+        finally:
+            # Unblock and retire the producer if the consumer stopped early.
+            self._stop.set()
+            while worker.is_alive():
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    worker.join(timeout=0.1)
+
+    def __iter__(self) -> Iterator[T]:
+        self._stop.clear()
+        if self.depth == 0:
+            return self._iter_inline()
+        return self._iter_threaded()
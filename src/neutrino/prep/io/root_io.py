@@ -3,12 +3,42 @@ from typing import Any, Optional
 
 import uproot
 from neutrino.prep.config.file_config import FileConfig
+from neutrino.prep.config.read_config import ReadConfig
+from neutrino.prep.io.array_cache import ArrayCache, CacheKey
+from neutrino.prep.io.memory import parse_bytes
+from neutrino.prep.io.threads import ThreadBudget
+
+# Compression settings by name, as written in configs ("ZSTD:5")
+_COMPRESSION: dict[str, Any] = {
+    "zlib": uproot.ZLIB,
+    "lzma": uproot.LZMA,
+    "lz4": uproot.LZ4,
+    "zstd": uproot.ZSTD,
+}
+
+
+def parse_compression(
+    code: str | None,
+) -> Any:
+    """uproot compression object for e.g. "ZLIB:4" ("none"/None → uncompressed)."""
+
+    if code is None or code.strip().lower() in ("", "none"):
+        return None
+
+    algorithm, _, level = code.strip().partition(":")
+    if algorithm.lower() not in _COMPRESSION:
+        raise ValueError(
+            f"Unknown compression {code!r}; expected one of {sorted(_COMPRESSION)}"
+        )
+
+    return _COMPRESSION[algorithm.lower()](int(level) if level else 1)
 
 
 class RootIO:
     def __init__(
         self,
         input_path: Path | str | None = None,
+        cache_size: int | str | None = None,
     ) -> None:
         self.config: FileConfig = FileConfig.load_config()
 
@@ -19,6 +49,12 @@ class RootIO:
         self.root_path: Path = Path(input_path) if input_path else self.config.file_path
 
         self._handle: Optional[Any] = None  # uproot file/dir handle when open
+        self._executor: Optional[Any] = None  # basket decompression threads
+
+        # Decompressed arrays shared by every reader of this file
+        if cache_size is None:
+            cache_size = ReadConfig.load_config().cache_size
+        self.cache: ArrayCache = ArrayCache(parse_bytes(cache_size) or 0)
 
     # ---------- context manager methods ----------
     def __enter__(self) -> "RootIO":
@@ -36,7 +72,14 @@ class RootIO:
     # ---------- explicit open/close (still available) ----------
     def open_root(self) -> None:
         if not self.is_open:
-            self._handle = uproot.open(self.root_path)
+            # Decompression threads come out of this process's thread share
+            threads = ThreadBudget.from_config().decompression_threads
+            if threads > 1:
+                self._executor = uproot.ThreadPoolExecutor(max_workers=threads)
+
+            self._handle = uproot.open(
+                self.root_path, decompression_executor=self._executor
+            )
 
     def close_root(self) -> None:
         if self._handle is not None:
@@ -44,7 +87,60 @@ class RootIO:
                 self._handle.close()
             finally:
                 self._handle = None
+                if self._executor is not None:
+                    self._executor.shutdown()
+                    self._executor = None
+                # The file may change before it is reopened
+                self.cache.clear()
 
     @property
     def is_open(self) -> bool:
         return self._handle is not None
+
+    # ---------- array cache ----------
+    def cache_key(
+        self,
+        tree_name: str,
+        branch: str,
+        entry_start: int,
+        entry_stop: int,
+    ) -> CacheKey:
+        return (str(self.root_path), tree_name, branch, entry_start, entry_stop)
+
+    def pin_branch(
+        self,
+        tree_name: str,
+        branch: str,
+    ) -> None:
+        """Keep this branch's cached arrays resident (never evicted)."""
+        self.cache.pin(str(self.root_path), tree_name, branch)
+
+    def unpin_branch(
+        self,
+        tree_name: str,
+        branch: str,
+    ) -> None:
+        self.cache.unpin(str(self.root_path), tree_name, branch)
+
+    # ---------- file identity ----------
+    def file_identity(self) -> dict[str, Any]:
+        """
+        Describe *which* file this is, cheaply and without reading any data.
+
+        Combines the resolved path, size and modification time with the ROOT
+        file UUID (only available while the file is open). Used to validate
+        caches, sidecars and manifests that were derived from this file.
+        """
+        stat = self.root_path.stat()
+
+        identity: dict[str, Any] = {
+            "path": str(self.root_path.resolve()),
+            "size": int(stat.st_size),
+            "mtime_ns": int(stat.st_mtime_ns),
+            "uuid": None,
+        }
+
+        if self._handle is not None:
+            identity["uuid"] = str(self._handle.file.uuid)
+
+        return identity
@@ -0,0 +1,232 @@
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+
+from neutrino.prep.io.partition import EntryRange, PartitionPlanner
+from neutrino.prep.io.tree_meta import TreeMeta
+
+if TYPE_CHECKING:
+    from neutrino.prep.io.category_index import CategoryIndex
+    from neutrino.prep.io.tree_reader import TreeReader
+
+
+@dataclass
+class SampleResult:
+    """A random subsample and what it cost to read."""
+
+    data: dict[str, np.ndarray]
+    entries: np.ndarray  # tree entry number of every sampled row
+    ranges: list[EntryRange]  # entry ranges actually read
+    num_entries: int
+    entries_read: int
+    clusters_read: int
+    clusters_total: int
+    bytes_read: int  # compressed bytes of the baskets read
+    bytes_total: int
+    read_s: float
+    strata: dict[int, int] | None = None  # rows per category code
+
+    @property
+    def fraction(self) -> float:
+        """Sampled rows / entries in the tree."""
+        return len(self.entries) / self.num_entries if self.num_entries else 0.0
+
+    @property
+    def io_fraction(self) -> float:
+        """Compressed bytes read / compressed bytes of the requested branches."""
+        return self.bytes_read / self.bytes_total if self.bytes_total else 0.0
+
+    def report(self) -> None:
+        mb = 1024**2
+        print("---------- Sample ----------")
+        print(
+            f"rows: {len(self.entries)} of {self.num_entries} "
+            f"(fraction {self.fraction:.4%})"
+        )
+        print(
+            f"read: {self.entries_read} entries in {self.clusters_read} of "
+            f"{self.clusters_total} clusters, {len(self.ranges)} ranges"
+        )
+        print(
+            f"I/O: {self.bytes_read / mb:.2f} of {self.bytes_total / mb:.2f} MB "
+            f"compressed (fraction {self.io_fraction:.4%}) in {self.read_s:.3f} s"
+        )
+        if self.strata is not None:
+            print(
+                "per category: "
+                + "  ".join(f"{code}: {n}" for code, n in self.strata.items())
+            )
+
+
+class ClusterSampler:
+    """
+    Random subsample of a tree that reads only the clusters it picks.
+
+    Clusters (entry ranges where every requested branch starts a new
+    basket, see PartitionPlanner) are drawn in random order until the
+    target size is covered, so only their baskets are decompressed and
+    the I/O cost scales with the sample size. Rows of the clusters read
+    are then thinned to the exact target.
+
+    With a CategoryIndex, the draw is stratified: clusters are taken
+    until every category reaches its own share, and each category is
+    thinned to that share, so the sample keeps the tree's category mix.
+    Rare categories can force extra clusters; `report` shows the cost.
+    """
+
+    def __init__(
+        self,
+        reader: "TreeReader",
+    ) -> None:
+
+        self.reader = reader
+        self.meta = TreeMeta(reader.ref)
+        self.planner = PartitionPlanner(self.meta)
+
+    @staticmethod
+    def _target(
+        total: int,
+        fraction: float | None,
+        n_events: int | None,
+    ) -> int:
+        if (fraction is None) == (n_events is None):
+            raise ValueError("Give exactly one of fraction or n_events")
+        if fraction is not None:
+            if not 0.0 < fraction <= 1.0:
+                raise ValueError(f"fraction must be in (0, 1], got {fraction}")
+            return max(1, int(round(total * fraction)))
+        if n_events is None or n_events < 1:
+            raise ValueError(f"n_events must be >= 1, got {n_events}")
+        return min(int(n_events), total)
+
+    @staticmethod
+    def _merge(
+        bounds: np.ndarray,
+        picked: np.ndarray,
+    ) -> list[EntryRange]:
+        """Adjacent picked clusters → one read range each."""
+
+        ranges: list[EntryRange] = []
+        for i in np.sort(picked):
+            start, stop = int(bounds[i]), int(bounds[i + 1])
+            if ranges and ranges[-1].stop == start:
+                ranges[-1] = EntryRange(ranges[-1].start, stop)
+            else:
+                ranges.append(EntryRange(start, stop))
+        return ranges
+
+    def sample(
+        self,
+        branches: Iterable[str],
+        fraction: float | None = None,
+        n_events: int | None = None,
+        seed: int = 0,
+        strata: "CategoryIndex | None" = None,
+        trim: bool = True,
+    ) -> SampleResult:
+        """
+        Sample `fraction` of the entries (or `n_events` of them).
+
+        `trim=False` keeps every row of the clusters read instead of
+        thinning them to the target.
+        """
+
+        cols = list(dict.fromkeys(branches))
+        if not cols:
+            raise ValueError("No branches to sample")
+
+        # Clusters of the main tree; friend branches are read on the same ranges
+        main = self.reader.main_branches(cols) or self.meta.get_branch_names()
+        bounds, weights = self.planner.cluster_weights(main)
+        num_entries = int(bounds[-1]) if bounds.size else 0
+        if num_entries == 0:
+            raise ValueError("Cannot sample an empty tree")
+        n_clusters = bounds.size - 1
+        target = self._target(num_entries, fraction, n_events)
+
+        rng = np.random.default_rng(seed)
+        order = rng.permutation(n_clusters)
+        sizes = np.diff(bounds)
+
+        # Per-category targets and per-cluster counts (from the index only)
+        codes: list[int] = []
+        code_masks: list[np.ndarray] = []
+        if strata is not None:
+            codes = strata.codes
+            code_masks = [strata.where(code).mask() for code in codes]
+            per_cluster = np.stack(
+                [np.add.reduceat(m, bounds[:-1], dtype=np.int64) for m in code_masks]
+            )
+            share = target / num_entries
+            need = np.array(
+                [max(1, int(round(int(m.sum()) * share))) for m in code_masks],
+                dtype=np.int64,
+            )
+            code_target = need.copy()
+
+        picked: list[int] = []
+        got = 0
+        for i in order:
+            if strata is not None:
+                if not np.any((need > 0) & (per_cluster[:, i] > 0)):
+                    continue
+                need -= per_cluster[:, i]
+                picked.append(int(i))
+                if np.all(need <= 0):
+                    break
+            else:
+                picked.append(int(i))
+                got += int(sizes[i])
+                if got >= target:
+                    break
+
+        ranges = self._merge(bounds, np.asarray(picked, dtype=np.int64))
+
+        t0 = time.perf_counter()
+        parts = [self.reader._read_range(cols, r.start, r.stop) for r in ranges]
+        read_s = time.perf_counter() - t0
+
+        entries = np.concatenate(
+            [np.arange(r.start, r.stop, dtype=np.int64) for r in ranges]
+        )
+
+        # Thin the rows read down to the target (sorted, so still in entry order)
+        keep: np.ndarray | None = None
+        counts: dict[int, int] | None = None
+        if strata is not None:
+            chosen: list[np.ndarray] = []
+            counts = {}
+            for code, m, t in zip(codes, code_masks, code_target):
+                rows = np.flatnonzero(m[entries])
+                if trim and len(rows) > t:
+                    rows = rng.choice(rows, size=int(t), replace=False)
+                chosen.append(rows)
+                counts[code] = len(rows)
+            keep = np.sort(np.concatenate(chosen))
+        elif trim and len(entries) > target:
+            keep = np.sort(rng.choice(len(entries), size=target, replace=False))
+
+        data: dict[str, np.ndarray] = {}
+        for name in cols:
+            # A single range needs no extra copy
+            if len(parts) == 1:
+                col = parts[0][name]
+            else:
+                col = np.concatenate([p[name] for p in parts])
+            data[name] = col if keep is None else col[keep]
+
+        return SampleResult(
+            data=data,
+            entries=entries if keep is None else entries[keep],
+            ranges=ranges,
+            num_entries=num_entries,
+            entries_read=len(entries),
+            clusters_read=len(picked),
+            clusters_total=n_clusters,
+            bytes_read=int(weights[picked].sum()) if picked else 0,
+            bytes_total=int(weights.sum()),
+            read_s=read_s,
+            strata=counts,
+        )
@@ -0,0 +1,84 @@
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from neutrino.prep.io.root_io import RootIO
+
+IDENTITY_KEYS = ("size", "mtime_ns", "uuid")
+
+
+def identity_matches(
+    recorded: dict[str, Any],
+    current: dict[str, Any],
+) -> bool:
+    """True if a recorded RootIO.file_identity() still describes `current`."""
+
+    for key in IDENTITY_KEYS:
+        # An identity taken while the file was closed has no UUID
+        if key == "uuid" and None in (recorded.get(key), current.get(key)):
+            continue
+        if recorded.get(key) != current.get(key):
+            return False
+
+    return True
+
+
+class MetaSidecar:
+    """
+    JSON metadata file stored next to a ROOT file (`<file>.meta.json`).
+
+    The sidecar records the identity of the file it was computed from and
+    holds named sections of cached results. On load, a sidecar whose
+    identity no longer matches the ROOT file on disk is discarded, so stale
+    results are never served.
+    """
+
+    SUFFIX = ".meta.json"
+
+    def __init__(
+        self,
+        io: RootIO,
+    ) -> None:
+
+        self.io = io
+        self.path: Path = io.root_path.with_name(io.root_path.name + self.SUFFIX)
+        self._identity = io.file_identity()
+        self._sections: dict[str, dict[str, Any]] = {}
+
+        self._load()
+
+    def _load(self) -> None:
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw: dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if identity_matches(raw.get("identity", {}), self._identity):
+            self._sections = dict(raw.get("sections", {}))
+
+    def section(
+        self,
+        name: str,
+    ) -> dict[str, Any]:
+        """Mutable dict for one section (created empty if missing)."""
+
+        return self._sections.setdefault(name, {})
+
+    def save(self) -> bool:
+        """Write atomically; returns False if the location is not writable."""
+
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        payload = {"identity": self._identity, "sections": self._sections}
+
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp, self.path)
+        except OSError as exc:
+            print(f"Could not write metadata sidecar {self.path}: {exc}")
+            return False
+
+        return True
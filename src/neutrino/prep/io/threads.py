@@ -0,0 +1,207 @@
+import multiprocessing as mp
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from neutrino.prep.config.resource_config import ResourceConfig
+
+# Read by OpenMP / the BLAS libraries behind NumPy when they start up
+BLAS_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+# This process's share, inherited by (and read back in) worker processes
+SHARE_ENV_VAR = "NEUTRINO_THREADS"
+
+
+def usable_cores() -> int:
+    """Cores this process may run on (affinity / cgroup aware where possible)."""
+
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def apply_threads(
+    threads: int,
+) -> dict[str, Any]:
+    """
+    Limit this process to `threads` compute threads.
+
+    Sets the BLAS / OpenMP variables (for pools started later and for
+    child processes), resizes already-loaded BLAS pools through
+    threadpoolctl when it is installed, and calls torch.set_num_threads
+    if torch is loaded. Returns what was applied.
+    """
+
+    threads = max(1, int(threads))
+    for var in (*BLAS_ENV_VARS, SHARE_ENV_VAR):
+        os.environ[var] = str(threads)
+
+    applied: dict[str, Any] = {"threads": threads, "blas": "env", "torch": None}
+
+    try:
+        from threadpoolctl import threadpool_limits  # optional
+
+        threadpool_limits(limits=threads)
+        applied["blas"] = "threadpoolctl"
+    except ImportError:
+        pass  # pools already running keep their size
+
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(threads)
+        applied["torch"] = threads
+
+    return applied
+
+
+@dataclass(frozen=True)
+class ThreadBudget:
+    """
+    One core budget split between worker processes.
+
+    Each of `workers` processes gets `threads_per_worker` threads, and
+    every thread pool inside it (BLAS / OpenMP, torch intra-op, uproot
+    decompression) is sized from that share instead of from the machine's
+    core count, so parallel stages never oversubscribe the node.
+    """
+
+    total_cores: int
+    workers: int
+    threads_per_worker: int
+    decompression_threads: int
+
+    @classmethod
+    def from_config(
+        cls,
+        workers: int = 1,
+        config: ResourceConfig | None = None,
+        total_cores: int | None = None,
+    ) -> "ThreadBudget":
+        """Split the configured cores between `workers` processes."""
+
+        config = config or ResourceConfig.load_config()
+        workers = max(1, int(workers))
+
+        # Inside a worker, the budget is that worker's share
+        share = os.environ.get(SHARE_ENV_VAR)
+        total = (
+            total_cores
+            or (int(share) if share is not None else None)
+            or config.total_cores
+            or usable_cores()
+        )
+        per_worker = min(config.threads_per_worker or max(1, total // workers), total)
+        decompression = min(config.decompression_threads or per_worker, per_worker)
+
+        return cls(
+            total_cores=total,
+            workers=workers,
+            threads_per_worker=per_worker,
+            decompression_threads=decompression,
+        )
+
+    @property
+    def oversubscribed(self) -> bool:
+        return self.workers * self.threads_per_worker > self.total_cores
+
+    def apply(self) -> dict[str, Any]:
+        """Limit the current process to one worker's share."""
+        return apply_threads(self.threads_per_worker)
+
+    def report(self) -> None:
+        print("---------- Thread budget ----------")
+        print(
+            f"{self.total_cores} cores: {self.workers} workers x "
+            f"{self.threads_per_worker} threads "
+            f"(decompression: {self.decompression_threads})"
+        )
+        if self.oversubscribed:
+            print("warning: workers x threads exceeds the core budget")
+
+
+def init_worker(
+    threads: int,
+    ready: Any = None,
+) -> None:
+    """
+    Process-pool initializer: apply the worker's thread share.
+
+    With `ready` (a barrier shared by the pool), the worker waits until
+    every worker of the pool has started.
+    """
+
+    apply_threads(threads)
+    if ready is not None:
+        ready.wait()
+
+
+@contextmanager
+def worker_env(
+    threads: int,
+) -> Iterator[None]:
+    """
+    Export a worker's thread share while a process pool starts workers.
+
+    Spawned workers (the default on macOS / Windows, and for torch pools)
+    load NumPy's BLAS before any initializer runs, so the limit has to be
+    in the environment they inherit. The parent's variables are restored
+    afterwards.
+    """
+
+    saved = {var: os.environ.get(var) for var in (*BLAS_ENV_VARS, SHARE_ENV_VAR)}
+    for var in saved:
+        os.environ[var] = str(max(1, int(threads)))
+    try:
+        yield
+    finally:
+        for var, value in saved.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+
+def start_process_pool(
+    workers: int,
+    threads: int,
+) -> ProcessPoolExecutor:
+    """
+    Start `workers` spawned processes limited to `threads` threads each.
+
+    Forked workers inherit a BLAS pool that is already sized, and without
+    threadpoolctl nothing can shrink it, so the workers are spawned: they
+    load NumPy under the limit exported by `worker_env`. All workers are
+    started before this returns and the parent's environment is restored,
+    so the pool can be used inside a generator without leaking the limit.
+    """
+
+    workers = max(1, int(workers))
+    ctx = mp.get_context("spawn")
+
+    with worker_env(threads):
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=ctx,
+            initializer=init_worker,
+            initargs=(threads, ctx.Barrier(workers)),
+        )
+        try:
+            # Spawned workers start on demand; each blocks in init_worker
+            # until the last one is up, so every task starts a new process
+            for f in [pool.submit(os.getpid) for _ in range(workers)]:
+                f.result()
+        except BaseException:
+            pool.shutdown(cancel_futures=True)
+            raise
+
+    return pool
@@ -1,4 +1,70 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from neutrino.prep.io.root_io import RootIO
 from neutrino.prep.io.tree_ref import TreeRef
+from neutrino.prep.io.tree_reader import TreeReader
+from neutrino.prep.io.branch_stats import BranchSummary
+from neutrino.prep.io.sidecar import MetaSidecar
+from neutrino.prep.io.threads import ThreadBudget, start_process_pool
+
+
+@dataclass
+class ValueRange:
+    """Observed value range of one branch."""
+
+    min: float
+    max: float
+    integral: bool  # every finite value is a whole number
+    has_nan: bool  # at least one NaN/inf present
+
+    def merge(
+        self,
+        other: "ValueRange",
+    ) -> "ValueRange":
+
+        return ValueRange(
+            min=min(self.min, other.min),
+            max=max(self.max, other.max),
+            integral=self.integral and other.integral,
+            has_nan=self.has_nan or other.has_nan,
+        )
+
+    @classmethod
+    def from_array(
+        cls,
+        arr: np.ndarray,
+    ) -> "ValueRange":
+
+        arr = np.asarray(arr)
+
+        if arr.dtype.kind in "biu":
+            if arr.size == 0:
+                return cls(min=np.inf, max=-np.inf, integral=True, has_nan=False)
+            return cls(
+                min=float(arr.min()),
+                max=float(arr.max()),
+                integral=True,
+                has_nan=False,
+            )
+
+        finite = arr[np.isfinite(arr)]
+
+        if finite.size == 0:
+            lo, hi = np.inf, -np.inf
+        else:
+            lo, hi = float(finite.min()), float(finite.max())
+
+        return cls(
+            min=lo,
+            max=hi,
+            integral=bool(np.all(finite == np.floor(finite))),
+            has_nan=finite.size != arr.size,
+        )
 
 
 class TreeMeta:
@@ -30,3 +96,208 @@ class TreeMeta:
     ) -> bool:
 
         return name in self._get_tree().keys()
+
+    def get_branch_dtypes(
+        self,
+        branches: Iterable[str] | None = None,
+    ) -> dict[str, np.dtype]:
+        """Native (in-memory) NumPy dtype of each branch; object if not flat."""
+
+        tree = self._get_tree()
+        names = self.get_branch_names() if branches is None else list(branches)
+
+        dtypes: dict[str, np.dtype] = {}
+
+        for name in names:
+            interp = tree[name].interpretation
+            # Flat numeric branches are AsDtype; everything else is jagged/object
+            dtypes[name] = np.dtype(getattr(interp, "to_dtype", object))
+
+        return dtypes
+
+    # ---------- basket / cluster layout ----------
+    def get_cluster_boundaries(
+        self,
+        branches: Iterable[str] | None = None,
+    ) -> list[int]:
+        """
+        Entry numbers at which every selected branch starts a new basket
+        (first entry 0, last entry num_entries). Cutting the tree only at
+        these points never splits a basket between two readers.
+        """
+
+        tree = self._get_tree()
+
+        if branches is None:
+            return [int(x) for x in tree.common_entry_offsets()]
+
+        return [
+            int(x) for x in tree.common_entry_offsets(filter_name=list(branches))
+        ]
+
+    def get_basket_bytes(
+        self,
+        branch: str,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(first entry of each basket, compressed bytes of each basket)."""
+
+        b = self._get_tree()[branch]
+
+        n = int(b.num_baskets)
+        starts = np.asarray(b.entry_offsets[:n], dtype=np.int64)
+        sizes = np.asarray(
+            [b.basket_compressed_bytes(i) for i in range(n)], dtype=np.int64
+        )
+
+        return starts, sizes
+
+    def get_value_ranges(
+        self,
+        branches: Iterable[str],
+        step_size: int | None = None,
+    ) -> dict[str, ValueRange]:
+        """Min/max/integrality of each branch (from the cached summaries)."""
+
+        summaries = self.summarize(branches, step_size=step_size)
+
+        return {
+            name: ValueRange(
+                min=s.min,
+                max=s.max,
+                integral=s.integral,
+                has_nan=(s.nan_count + s.inf_count) > 0,
+            )
+            for name, s in summaries.items()
+        }
+
+    # ---------- branch summaries ----------
+    def _summarize_serial(
+        self,
+        branches: list[str],
+        max_bins: int,
+        step_size: int | None,
+    ) -> dict[str, BranchSummary]:
+        """One streaming pass over `branches` on the calling thread."""
+
+        summaries = {name: BranchSummary.empty(name, max_bins) for name in branches}
+        reader = TreeReader(self.ref)
+
+        for chunk in reader.iter_chunks(branches, step_size=step_size):
+            for name, arr in chunk.items():
+                summaries[name].update(arr)
+
+        return summaries
+
+    def _balance(
+        self,
+        branches: list[str],
+        workers: int,
+    ) -> list[list[str]]:
+        """Spread branches over workers by uncompressed size (largest first)."""
+
+        tree = self._get_tree()
+        sizes = {name: int(tree[name].uncompressed_bytes) for name in branches}
+
+        groups: list[list[str]] = [[] for _ in range(workers)]
+        loads = [0] * workers
+
+        for name in sorted(branches, key=sizes.__getitem__, reverse=True):
+            i = loads.index(min(loads))
+            groups[i].append(name)
+            loads[i] += sizes[name]
+
+        return [g for g in groups if g]
+
+    def summarize(
+        self,
+        branches: Iterable[str] | None = None,
+        max_bins: int = 64,
+        step_size: int | None = None,
+        workers: int | None = None,
+        use_processes: bool = False,
+        refresh: bool = False,
+    ) -> dict[str, BranchSummary]:
+        """
+        Histogram, min/max, mean/std, NaN/inf counts and approximate
+        quantiles for each branch, computed in one streaming pass.
+
+        Branches are spread over `workers` threads (or processes, each with
+        its own RootIO handle). Results are cached in the metadata sidecar
+        next to the ROOT file and reused until the file changes or
+        `refresh=True`.
+        """
+
+        names = self.get_branch_names() if branches is None else list(branches)
+        names = list(dict.fromkeys(names))
+
+        sidecar = MetaSidecar(self.io)
+        cached = sidecar.section("summaries")
+
+        results: dict[str, BranchSummary] = {}
+        todo: list[str] = []
+
+        # One file can hold several trees (e.g. friends) with equal branch names
+        def key(name: str) -> str:
+            return f"{self.tree_name}/{name}"
+
+        for name in names:
+            hit = cached.get(key(name))
+            if not refresh and hit is not None and hit["hist"]["max_bins"] == max_bins:
+                results[name] = BranchSummary.from_dict(hit)
+            else:
+                todo.append(name)
+
+        if todo:
+            if workers is None:
+                workers = ThreadBudget.from_config().total_cores
+            groups = self._balance(todo, max(1, min(workers, len(todo))))
+
+            futures: list[Future[dict[str, BranchSummary]]] = []
+
+            if len(groups) == 1:
+                computed = self._summarize_serial(groups[0], max_bins, step_size)
+            elif use_processes:
+                threads = ThreadBudget.from_config(len(groups)).threads_per_worker
+                with start_process_pool(len(groups), threads) as pool:
+                    for g in groups:
+                        futures.append(
+                            pool.submit(
+                                _summarize_in_process,
+                                str(self.io.root_path),
+                                self.tree_name,
+                                g,
+                                max_bins,
+                                step_size,
+                            )
+                        )
+                    computed = {k: v for f in futures for k, v in f.result().items()}
+            else:
+                with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+                    for g in groups:
+                        futures.append(
+                            pool.submit(self._summarize_serial, g, max_bins, step_size)
+                        )
+                    computed = {k: v for f in futures for k, v in f.result().items()}
+
+            for name, summary in computed.items():
+                cached[key(name)] = summary.to_dict()
+            sidecar.save()
+
+            results.update(computed)
+
+        # Preserve the requested order
+        return {name: results[name] for name in names}
+
+
+def _summarize_in_process(
+    root_path: str,
+    tree_name: str,
+    branches: list[str],
+    max_bins: int,
+    step_size: int | None,
+) -> dict[str, BranchSummary]:
+    """Process-pool entry point: open a private handle and summarize."""
+
+    with RootIO(Path(root_path)) as rio:
+        meta = TreeMeta(TreeRef(io=rio, tree_name=tree_name))
+        return meta._summarize_serial(branches, max_bins, step_size)
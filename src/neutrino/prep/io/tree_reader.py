@@ -1,34 +1,322 @@
+from neutrino.prep.io.root_io import RootIO
 from neutrino.prep.io.tree_ref import TreeRef
-from typing import Iterable
+from neutrino.prep.io.prefetch import Prefetcher
+from neutrino.prep.io.memory import MemoryBudget
+from neutrino.prep.io.threads import ThreadBudget, start_process_pool
+from neutrino.prep.config.read_config import ReadConfig
+from neutrino.prep.config.tree_config import TreeConfig
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping
 
+import math
 import numpy as np
 
+if TYPE_CHECKING:
+    from neutrino.prep.io.category_index import CategoryIndex
+    from neutrino.prep.io.partition import EntryRange
+    from neutrino.prep.io.sampler import SampleResult
+
 
 class TreeReader:
+    """
+    Chunked reads of one tree, optionally joined with friend trees.
+
+    Friends are entry-aligned trees (in the same file or another one)
+    registered under an alias. Their branches are requested as
+    "alias.branch", or by plain name when the main tree does not have it
+    and exactly one friend does; chunks are keyed by the names requested.
+    Entry counts are checked against the main tree up front, and each
+    chunk reads every tree concurrently, straight into the chunk.
+    """
 
     def __init__(
         self,
         ref: TreeRef,
+        friends: Mapping[str, TreeRef] | None = None,
     ) -> None:
 
         self.ref = ref
         self.io = ref.io
         self.tree_name = ref.tree_name
+        self.config = ReadConfig.load_config()
+        self.budget = MemoryBudget(self.config.memory_budget)
+
+        self.friends: dict[str, TreeRef] = dict(friends or {})
+        self._owned: list[RootIO] = []  # friend files opened by from_config
+        self._names: dict[str, set[str]] = {}  # branch names per tree, lazily
+        self._pool: ThreadPoolExecutor | None = None  # one thread per tree, lazily
+        if self.friends:
+            self._check_friends()
+
+    @classmethod
+    def from_config(
+        cls,
+        ref: TreeRef,
+        config: TreeConfig | None = None,
+    ) -> "TreeReader":
+        """Reader joined with the friend trees listed in TreeConfig."""
+
+        config = config or TreeConfig.load_config()
+        friends: dict[str, TreeRef] = {}
+        owned: list[RootIO] = []
+
+        try:
+            for entry in config.friends:
+                io = ref.io
+                if entry["file_path"] is not None:
+                    io = RootIO(entry["file_path"])
+                    io.open_root()
+                    owned.append(io)
+                friends[entry["alias"]] = TreeRef(io=io, tree_name=entry["tree_name"])
+
+            reader = cls(ref, friends)
+        except Exception:
+            for io in owned:
+                io.close_root()
+            raise
+
+        reader._owned = owned
+        return reader
+
+    def close(self) -> None:
+        """Stop the friend-read threads and close the friend files this
+        reader opened itself."""
+
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+        for io in self._owned:
+            io.close_root()
+        self._owned.clear()
+
+    def __enter__(self) -> "TreeReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        """Close when leaving the with-block (exceptions propagate)."""
+        self.close()
+        return False
+
+    def _check_friends(self) -> None:
+        """Raise ValueError unless every friend has the main tree's entries."""
+
+        # Local import: tree_meta imports this module
+        from neutrino.prep.io.tree_meta import TreeMeta
+
+        n = TreeMeta(self.ref).get_num_entries()
+        for alias, friend in self.friends.items():
+            if not alias or "." in alias:
+                raise ValueError(f"Invalid friend alias {alias!r}")
+            m = TreeMeta(friend).get_num_entries()
+            if m != n:
+                raise ValueError(
+                    f"Friend tree {alias!r} ({friend.io.root_path}:"
+                    f"{friend.tree_name}) has {m} entries, "
+                    f"{self.tree_name!r} has {n}"
+                )
 
-    def _get_tree(self):
+    def _get_tree(
+        self,
+        ref: TreeRef | None = None,
+    ):
 
-        if self.io._handle is None:
+        ref = ref or self.ref
+        if ref.io._handle is None:
             raise RuntimeError("RootIO is not open.")
 
-        return self.io._handle[self.tree_name]
+        return ref.io._handle[ref.tree_name]
+
+    # ---------- friend trees ----------
+    def _trees(self) -> dict[str, TreeRef]:
+        """Every tree by alias; the main tree is ""."""
+        return {"": self.ref, **self.friends}
+
+    def _tree_names(
+        self,
+        alias: str,
+    ) -> set[str]:
+
+        if alias not in self._names:
+            self._names[alias] = set(self._get_tree(self._trees()[alias]).keys())
+        return self._names[alias]
+
+    def _resolve(
+        self,
+        cols: list[str],
+    ) -> dict[str, list[tuple[str, str]]]:
+        """Requested names → {tree alias: [(name, branch in that tree)]}."""
+
+        if not self.friends:
+            return {"": [(name, name) for name in cols]}
+
+        groups: dict[str, list[tuple[str, str]]] = {}
+
+        for name in cols:
+            alias, _, branch = name.partition(".")
+            if not (alias in self.friends and branch):
+                # Plain name: the main tree wins, else the one friend having it
+                if name in self._tree_names(""):
+                    alias, branch = "", name
+                else:
+                    hits = [a for a in self.friends if name in self._tree_names(a)]
+                    if len(hits) != 1:
+                        where = f"friends {hits}" if hits else "no tree"
+                        raise KeyError(
+                            f"Branch {name!r} is in {where}; "
+                            "qualify it as 'alias.branch'"
+                        )
+                    alias, branch = hits[0], name
+
+            groups.setdefault(alias, []).append((name, branch))
+
+        return groups
+
+    def main_branches(
+        self,
+        branches: Iterable[str],
+    ) -> list[str]:
+        """The main-tree branches among `branches` (friend ones dropped)."""
+
+        return [branch for _, branch in self._resolve(list(branches)).get("", [])]
+
+    def branch_names(self) -> list[str]:
+        """Every readable name: main branches, then "alias.branch" and
+        unshadowed plain names of the friends."""
+
+        names = list(self._get_tree().keys())
+        seen = set(names)
+
+        for alias, friend in self.friends.items():
+            for branch in self._get_tree(friend).keys():
+                names.append(f"{alias}.{branch}")
+                if branch not in seen:
+                    names.append(branch)
+                    seen.add(branch)
+
+        return names
+
+    def branch_dtypes(
+        self,
+        branches: Iterable[str],
+    ) -> dict[str, np.dtype]:
+        """Native dtype of each requested name, friends included."""
+
+        # Local import: tree_meta imports this module
+        from neutrino.prep.io.tree_meta import TreeMeta
+
+        trees = self._trees()
+        dtypes: dict[str, np.dtype] = {}
+
+        for alias, pairs in self._resolve(list(dict.fromkeys(branches))).items():
+            native = TreeMeta(trees[alias]).get_branch_dtypes(b for _, b in pairs)
+            dtypes.update({name: native[branch] for name, branch in pairs})
+
+        return dtypes
+
+    # ---------- reading ----------
+    def _cached(
+        self,
+        cols: list[str],
+        start: int,
+        stop: int,
+        ref: TreeRef | None = None,
+    ) -> tuple[dict[str, np.ndarray], list[str]]:
+        """Split `cols` into arrays already in the RootIO cache and misses."""
+
+        ref = ref or self.ref
+        found: dict[str, np.ndarray] = {}
+        missing: list[str] = []
+
+        for name in cols:
+            arr = ref.io.cache.get(ref.io.cache_key(ref.tree_name, name, start, stop))
+            if arr is None:
+                missing.append(name)
+            else:
+                found[name] = arr
+
+        return found, missing
+
+    def _store(
+        self,
+        arrs: dict[str, np.ndarray],
+        start: int,
+        stop: int,
+        ref: TreeRef | None = None,
+    ) -> dict[str, np.ndarray]:
+
+        ref = ref or self.ref
+        return {
+            name: ref.io.cache.put(
+                ref.io.cache_key(ref.tree_name, name, start, stop), arr
+            )
+            for name, arr in arrs.items()
+        }
+
+    def _read_tree(
+        self,
+        ref: TreeRef,
+        cols: list[str],
+        start: int,
+        stop: int,
+    ) -> dict[str, np.ndarray]:
+        """Entries [start, stop) of one tree, decompressing only uncached branches."""
+
+        results, missing = self._cached(cols, start, stop, ref)
+
+        if missing:
+            arrs = self._get_tree(ref).arrays(
+                missing, entry_start=start, entry_stop=stop, library="np"
+            )
+            arrs = {n: arrs[n] for n in missing}
+            results.update(self._store(arrs, start, stop, ref))
+
+        return {name: results[name] for name in cols}
+
+    def _read_range(
+        self,
+        cols: list[str],
+        start: int,
+        stop: int,
+    ) -> dict[str, np.ndarray]:
+        """Read entries [start, stop) of every tree `cols` touch."""
+
+        groups = self._resolve(cols)
+        if list(groups) == [""]:
+            return self._read_tree(self.ref, cols, start, stop)
+
+        trees = self._trees()
+        out: dict[str, np.ndarray] = {}
+
+        # One thread per tree, kept across chunks: uproot releases the GIL
+        # while decompressing
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=len(trees))
+
+        futures = {
+            alias: self._pool.submit(
+                self._read_tree,
+                trees[alias],
+                [branch for _, branch in pairs],
+                start,
+                stop,
+            )
+            for alias, pairs in groups.items()
+        }
+        for alias, pairs in groups.items():
+            arrs = futures[alias].result()
+            out.update({name: arrs[branch] for name, branch in pairs})
+
+        return {name: out[name] for name in cols}
 
     def read_one(
         self,
         branch: str,
     ) -> np.ndarray:
 
-        arrs = self._get_tree().arrays([branch], library="np")
-        return arrs[branch]
+        n = int(self._get_tree().num_entries)
+        return self._read_range([branch], 0, n)[branch]
 
     def read_multiple(
         self,
@@ -41,11 +329,272 @@ class TreeReader:
         if not cols:
             return {}
 
-        arrs = self._get_tree().arrays(cols, library="np")
+        n = int(self._get_tree().num_entries)
+        return self._read_range(cols, 0, n)
 
-        results: dict[str, np.ndarray] = {}
+    def _iter_whole(
+        self,
+        cols: list[str],
+    ) -> Iterator[dict[str, np.ndarray]]:
 
-        for name in cols:
-            results[name] = arrs[name]
+        yield self.read_multiple(cols)
+
+    def _iter_raw_chunks(
+        self,
+        cols: list[str],
+        step_size: int,
+    ) -> Iterator[dict[str, np.ndarray]]:
+
+        n = int(self._get_tree().num_entries)
+
+        for start in range(0, n, step_size):
+            yield self._read_range(cols, start, min(start + step_size, n))
+
+    def plan_partitions(
+        self,
+        branches: Iterable[str],
+        n_parts: int,
+    ) -> list["EntryRange"]:
+        """Basket-aligned, byte-balanced entry ranges (see PartitionPlanner)."""
+
+        # Local imports: tree_meta imports this module
+        from neutrino.prep.io.tree_meta import TreeMeta
+        from neutrino.prep.io.partition import PartitionPlanner
+
+        # Cut on the main tree's clusters (all of them if only friends are read)
+        main = self.main_branches(branches) or list(self._get_tree().keys())
+        return PartitionPlanner(TreeMeta(self.ref)).plan(main, n_parts)
+
+    def sample(
+        self,
+        branches: Iterable[str],
+        fraction: float | None = None,
+        n_events: int | None = None,
+        seed: int = 0,
+        strata: "CategoryIndex | None" = None,
+        trim: bool = True,
+    ) -> "SampleResult":
+        """Random subsample reading only the clusters drawn (see ClusterSampler)."""
+
+        # Local import: sampler imports tree_meta, which imports this module
+        from neutrino.prep.io.sampler import ClusterSampler
+
+        return ClusterSampler(self).sample(
+            branches,
+            fraction=fraction,
+            n_events=n_events,
+            seed=seed,
+            strata=strata,
+            trim=trim,
+        )
+
+    def _iter_parallel_chunks(
+        self,
+        cols: list[str],
+        step_size: int | None,
+        workers: int,
+    ) -> Iterator[dict[str, np.ndarray]]:
+        """
+        Read basket-aligned entry ranges on `workers` processes (each with its
+        own RootIO handle) and yield them back in entry order.
+        """
+
+        from neutrino.prep.io.partition import EntryRange, read_joined_range
+
+        num_entries = int(self._get_tree().num_entries)
+
+        # At least one range per worker; more if chunks must stay small
+        n_parts = workers
+        if step_size is not None:
+            n_parts = max(n_parts, math.ceil(num_entries / step_size))
+
+        ranges = self.plan_partitions(cols, n_parts)
+
+        trees = self._trees()
+        groups = self._resolve(cols)
+        specs = [
+            (
+                str(trees[alias].io.root_path),
+                trees[alias].tree_name,
+                [branch for _, branch in pairs],
+            )
+            for alias, pairs in groups.items()
+        ]
+
+        def assemble(
+            r: EntryRange,
+            parts: list[dict[str, np.ndarray]],
+        ) -> dict[str, np.ndarray]:
+            chunk: dict[str, np.ndarray] = {}
+            for (alias, pairs), arrs in zip(groups.items(), parts):
+                arrs = self._store(arrs, r.start, r.stop, trees[alias])
+                chunk.update({name: arrs[branch] for name, branch in pairs})
+            return {name: chunk[name] for name in cols}
+
+        # Each reader process decompresses / computes on its share of cores
+        threads = ThreadBudget.from_config(workers).threads_per_worker
+
+        # The workers' limit is exported only while they start, not per yield
+        with start_process_pool(workers, threads) as pool:
+            # Each slot holds a range, the arrays found in cache (per tree)
+            # and an in-flight read of only the misses, with their tree indices
+            pending: deque[
+                tuple[
+                    EntryRange,
+                    list[dict[str, np.ndarray]],
+                    Future[list[dict[str, np.ndarray]]] | None,
+                    list[int],
+                ]
+            ] = deque()
+            todo = iter(ranges)
+
+            def submit(r: EntryRange) -> None:
+                parts: list[dict[str, np.ndarray]] = []
+                reads: list[tuple[str, str, list[str]]] = []
+                read_idx: list[int] = []
+
+                for i, (alias, spec) in enumerate(zip(groups, specs)):
+                    path, tree, branches = spec
+                    ref = trees[alias]
+                    found, missing = self._cached(branches, r.start, r.stop, ref)
+                    parts.append(found)
+                    if missing:
+                        reads.append((path, tree, missing))
+                        read_idx.append(i)
+
+                future = None
+                if reads:
+                    future = pool.submit(read_joined_range, reads, r.start, r.stop)
+                pending.append((r, parts, future, read_idx))
+
+            # Keep every worker busy, one range queued behind each
+            for r in todo:
+                submit(r)
+                if len(pending) >= 2 * workers:
+                    break
+
+            while pending:
+                r, parts, future, read_idx = pending.popleft()
+                if future is not None:
+                    for i, arrs in zip(read_idx, future.result()):
+                        parts[i].update(arrs)
+                chunk = assemble(r, parts)
+                nxt = next(todo, None)
+                if nxt is not None:
+                    submit(nxt)
+                yield chunk
+
+    def read_parallel(
+        self,
+        branches: Iterable[str],
+        workers: int | None = None,
+    ) -> dict[str, np.ndarray]:
+        """read_multiple, but split across processes and stitched in order."""
+
+        cols: list[str] = list(dict.fromkeys(branches))
+        if not cols:
+            return {}
+
+        workers = workers or self.config.workers
+        chunks = list(self._iter_parallel_chunks(cols, None, workers))
+
+        return {name: np.concatenate([c[name] for c in chunks]) for name in cols}
+
+    # ---------- memory-budgeted chunk sizing ----------
+    def bytes_per_entry(
+        self,
+        branches: Iterable[str],
+    ) -> float:
+        """Decompressed bytes one entry occupies across `branches`."""
+
+        n = max(int(self._get_tree().num_entries), 1)
+        trees = self._trees()
+        total = 0
+
+        for alias, pairs in self._resolve(list(dict.fromkeys(branches))).items():
+            tree = self._get_tree(trees[alias])
+            total += sum(int(tree[branch].uncompressed_bytes) for _, branch in pairs)
+
+        return total / n
+
+    @staticmethod
+    def live_copies(
+        prefetch: int,
+        workers: int,
+    ) -> int:
+        """Chunks alive at once inside the reader itself."""
+
+        if workers > 1:
+            # 2 ranges in flight per worker + their unpickled results
+            return 2 * workers + prefetch + 1
+
+        # queued chunks + the one being decompressed + the one handed out
+        return prefetch + 2
+
+    def step_for_budget(
+        self,
+        branches: Iterable[str],
+        extra_copies: float = 0,
+        prefetch: int | None = None,
+        workers: int | None = None,
+    ) -> int | None:
+        """
+        Entries per chunk so that the reader's own buffers plus
+        `extra_copies` chunk-sized copies made by the caller fit the budget.
+        """
+
+        if prefetch is None:
+            prefetch = self.config.prefetch_depth
+        if workers is None:
+            workers = self.config.workers
+
+        copies = self.live_copies(prefetch, workers) + extra_copies
+        return self.budget.entries_per_chunk(self.bytes_per_entry(branches), copies)
+
+    def iter_chunks(
+        self,
+        branches: Iterable[str],
+        step_size: int | None = None,
+        prefetch: int | None = None,
+        workers: int | None = None,
+        extra_copies: float = 0,
+    ) -> Prefetcher[dict[str, np.ndarray]]:
+        """
+        Iterate over the tree in chunks of `step_size` entries.
+
+        Each chunk is a dict {branch: array} in the requested order. Chunks are
+        read `prefetch` steps ahead on a background thread (defaults from
+        ReadConfig); the returned Prefetcher exposes the stall timings via
+        `.stats` once iteration is done. With `workers` > 1 the chunks are
+        basket-aligned ranges read concurrently by a process pool, so chunk
+        sizes follow the cluster layout rather than `step_size` exactly.
+
+        Without an explicit `step_size`, the chunk size is capped by the
+        memory budget, counting the reader's buffers plus `extra_copies`
+        chunk-sized copies the caller holds while processing a chunk.
+        """
+
+        cols: list[str] = list(dict.fromkeys(branches))
+
+        if prefetch is None:
+            prefetch = self.config.prefetch_depth
+        if workers is None:
+            workers = self.config.workers
+
+        if step_size is None and cols:
+            step_size = self.config.step_size
+            fitted = self.step_for_budget(cols, extra_copies, prefetch, workers)
+            if fitted is not None:
+                step_size = fitted if step_size is None else min(step_size, fitted)
+
+        if not cols:
+            source: Iterable[dict[str, np.ndarray]] = iter(())
+        elif workers > 1:
+            source = self._iter_parallel_chunks(cols, step_size, workers)
+        elif step_size is None:
+            # No chunking requested → a single chunk covering the full tree
+            source = self._iter_whole(cols)
+        else:
+            source = self._iter_raw_chunks(cols, step_size)
 
-        return results
+        return Prefetcher(source, depth=prefetch)
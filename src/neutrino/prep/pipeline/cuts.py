@@ -0,0 +1,239 @@
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+import numpy as np
+
+from neutrino.prep.config.split_config import SplitConfig
+
+
+@dataclass(frozen=True)
+class Cut:
+    """
+    One declarative selection, compiled from a SplitConfig "cuts" entry.
+
+    kind:
+      "range"  : min <= branch <= max (either bound may be left out)
+      "finite" : every listed branch is finite (no NaN / ±inf)
+      "in"     : branch value is one of `values` (or type_map `labels`)
+      "and"/"or": combination of the child cuts
+      "not"    : negation of the single child cut
+    NaN never passes a "range" or "in" cut.
+    """
+
+    name: str
+    kind: str
+    branches: tuple[str, ...] = ()
+    lo: float | None = None
+    hi: float | None = None
+    values: tuple[int | float, ...] = ()
+    children: tuple["Cut", ...] = ()
+
+    KINDS = ("range", "finite", "in", "and", "or", "not")
+
+    # ---------- parsing ----------
+    @classmethod
+    def from_dict(
+        cls,
+        raw: dict[str, Any],
+        config: SplitConfig,
+    ) -> "Cut":
+        """
+        e.g. {"kind": "range", "branch": "Init_Nu_Energy", "min": 0, "max": 20}
+             {"kind": "finite", "branches": ["Bjorken_x", "Inelasticity_y"]}
+             {"kind": "in", "branch": "Interaction_Type", "labels": ["QE", "RES"]}
+             {"kind": "or", "cuts": [{...}, {...}]}
+        """
+
+        kind = str(raw["kind"])
+
+        if kind == "range":
+            branch = str(raw["branch"])
+            lo = raw.get("min")
+            hi = raw.get("max")
+            if lo is None and hi is None:
+                raise ValueError(f"Range cut on {branch!r} needs 'min' and/or 'max'")
+            default = branch
+            if lo is not None:
+                default = f"{lo} <= {default}"
+            if hi is not None:
+                default = f"{default} <= {hi}"
+            return cls(
+                name=str(raw.get("name", default)),
+                kind=kind,
+                branches=(branch,),
+                lo=None if lo is None else float(lo),
+                hi=None if hi is None else float(hi),
+            )
+
+        if kind == "finite":
+            # No branch list → every target branch
+            branches = tuple(str(b) for b in raw.get("branches", config.target_branches))
+            return cls(
+                name=str(raw.get("name", f"finite({len(branches)} branches)")),
+                kind=kind,
+                branches=branches,
+            )
+
+        if kind == "in":
+            branch = str(raw["branch"])
+            if "labels" in raw:
+                unknown = [lbl for lbl in raw["labels"] if lbl not in config.type_map]
+                if unknown:
+                    raise ValueError(f"Labels missing from type_map: {unknown}")
+                values = tuple(config.type_map[lbl] for lbl in raw["labels"])
+                default = f"{branch} in {list(raw['labels'])}"
+            else:
+                values = tuple(raw["values"])
+                default = f"{branch} in {list(values)}"
+            return cls(
+                name=str(raw.get("name", default)),
+                kind=kind,
+                branches=(branch,),
+                values=values,
+            )
+
+        if kind in ("and", "or"):
+            children = tuple(cls.from_dict(c, config) for c in raw["cuts"])
+            if not children:
+                raise ValueError(f"'{kind}' cut needs at least one child cut")
+            joiner = f" {kind} "
+            return cls(
+                name=str(raw.get("name", "(" + joiner.join(c.name for c in children) + ")")),
+                kind=kind,
+                children=children,
+            )
+
+        if kind == "not":
+            child = cls.from_dict(raw["cut"], config)
+            return cls(
+                name=str(raw.get("name", f"not {child.name}")),
+                kind=kind,
+                children=(child,),
+            )
+
+        raise ValueError(f"Unknown cut kind: {kind!r} (expected one of {cls.KINDS})")
+
+    # ---------- evaluation ----------
+    @property
+    def read_branches(self) -> list[str]:
+        """Every branch this cut (and its children) looks at."""
+
+        names = list(self.branches)
+        for child in self.children:
+            names.extend(child.read_branches)
+        return list(dict.fromkeys(names))
+
+    def mask(
+        self,
+        data: dict[str, np.ndarray],
+    ) -> np.ndarray:
+        """Boolean mask of the rows of `data` that pass this cut."""
+
+        if self.kind == "range":
+            values = data[self.branches[0]]
+            out = np.ones(len(values), dtype=bool)
+            if self.lo is not None:
+                np.greater_equal(values, self.lo, out=out)
+            if self.hi is not None:
+                out &= values <= self.hi
+            return out
+
+        if self.kind == "finite":
+            out = np.ones(len(data[self.branches[0]]), dtype=bool)
+            for name in self.branches:
+                values = data[name]
+                # Integer branches cannot hold NaN / inf
+                if values.dtype.kind in "fc":
+                    out &= np.isfinite(values)
+            return out
+
+        if self.kind == "in":
+            values = data[self.branches[0]]
+            if len(self.values) == 1:
+                return values == self.values[0]
+            return np.isin(values, self.values)
+
+        if self.kind == "not":
+            return ~self.children[0].mask(data)
+
+        # "and" / "or": accumulate in place into the first child's mask
+        out = self.children[0].mask(data)
+        for child in self.children[1:]:
+            if self.kind == "and":
+                out &= child.mask(data)
+            else:
+                out |= child.mask(data)
+        return out
+
+
+@dataclass
+class Cutflow:
+    """Rows remaining after each cut in order (summed over chunks)."""
+
+    names: list[str]
+    total: int = 0
+    passed: list[int] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.passed:
+            self.passed = [0] * len(self.names)
+
+    def report(self) -> None:
+        print("---------- Cutflow ----------")
+        print(f"{'all entries':<48} {self.total:>12}")
+
+        for name, count in zip(self.names, self.passed):
+            frac = count / self.total if self.total else 0.0
+            print(f"{name[:48]:<48} {count:>12} {frac:>8.1%}")
+
+
+class CutSet:
+    """
+    The top-level cuts of a SplitConfig, ANDed in order.
+
+    `apply` evaluates every cut on one chunk into a single boolean mask
+    (in place, no per-branch copies) and updates the cutflow as it goes.
+    An empty CutSet passes everything.
+    """
+
+    def __init__(
+        self,
+        cuts: Iterable[Cut] = (),
+    ) -> None:
+
+        self.cuts: list[Cut] = list(cuts)
+        self.cutflow = Cutflow([cut.name for cut in self.cuts])
+
+    def __bool__(self) -> bool:
+        return bool(self.cuts)
+
+    @classmethod
+    def from_config(
+        cls,
+        config: SplitConfig,
+    ) -> "CutSet":
+        return cls(Cut.from_dict(raw, config) for raw in config.cuts)
+
+    @property
+    def read_branches(self) -> list[str]:
+        return list(dict.fromkeys(b for cut in self.cuts for b in cut.read_branches))
+
+    def apply(
+        self,
+        data: dict[str, np.ndarray],
+        num_rows: int,
+    ) -> np.ndarray | None:
+        """Combined mask for one chunk (None when there are no cuts)."""
+
+        self.cutflow.total += num_rows
+
+        if not self.cuts:
+            return None
+
+        mask = np.ones(num_rows, dtype=bool)
+
+        for i, cut in enumerate(self.cuts):
+            mask &= cut.mask(data)
+            self.cutflow.passed[i] += int(np.count_nonzero(mask))
+
+        return mask
@@ -1,20 +1,169 @@
 from dataclasses import dataclass
-from typing import Iterable, Tuple
+from typing import Any, Callable, Iterable, Iterator, Mapping, Tuple
 import numpy as np
+import uproot
 from pathlib import Path
 
+from neutrino.prep.io.memory import MemoryBudget
+from neutrino.prep.io.root_io import parse_compression
+from neutrino.prep.pipeline.dtype_plan import DtypePlan
+
+
+class LazyColumns(Mapping[str, np.ndarray]):
+    """
+    One side of a split as (source columns, selected row indices).
+
+    Nothing is copied until a column is asked for: `d[name]` gathers that
+    column alone, `rows` gathers a block of rows for the writer, and
+    `shapes` / `dtype` / `num_rows` are answered from the source.
+    Several splits can share one `source`.
+    """
+
+    def __init__(
+        self,
+        source: Mapping[str, np.ndarray],
+        index: np.ndarray,
+        columns: Iterable[str] | None = None,
+    ) -> None:
+
+        self.source = source
+        self.index = np.asarray(index, dtype=np.int64)
+        self.columns: list[str] = list(source if columns is None else columns)
+
+        missing = [name for name in self.columns if name not in source]
+        if missing:
+            raise KeyError(f"Columns missing from source: {missing}")
+
+    def __contains__(self, name: object) -> bool:
+        # Mapping's default would gather the column through __getitem__
+        return name in self.columns
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name not in self.columns:
+            raise KeyError(name)
+        return self.source[name].take(self.index, axis=0)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.index)
+
+    def dtype(self, name: str) -> np.dtype:
+        return self.source[name].dtype
+
+    def shapes(self) -> dict[str, tuple[int, ...]]:
+        return {
+            name: (self.num_rows, *self.source[name].shape[1:])
+            for name in self.columns
+        }
+
+    def rows(
+        self,
+        columns: Iterable[str],
+        start: int,
+        stop: int,
+    ) -> dict[str, np.ndarray]:
+        """Gather rows [start, stop) of the selection for `columns`."""
+
+        idx = self.index[start:stop]
+        return {name: self.source[name].take(idx, axis=0) for name in columns}
+
+    def iter_blocks(
+        self,
+        name: str,
+        block_rows: int = 1 << 20,
+    ) -> Iterator[np.ndarray]:
+        """Column `name` gathered `block_rows` selected rows at a time."""
+
+        col = self.source[name]
+        # An empty selection still yields one (empty) block
+        for start in range(0, max(self.num_rows, 1), block_rows):
+            yield col.take(self.index[start : start + block_rows], axis=0)
+
+    def materialize(self) -> dict[str, np.ndarray]:
+        return {name: self[name] for name in self.columns}
+
 
 @dataclass(frozen=True)
 class SplitPair:
+    """
+    The A and B sides of a split, as branch → column mappings.
+
+    Either side may be a plain dict of arrays or a LazyColumns view that
+    only gathers rows when a column is used (see `SplitPair.lazy`).
+    """
 
-    a: dict[str, np.ndarray]
-    b: dict[str, np.ndarray]
+    a: Mapping[str, np.ndarray]
+    b: Mapping[str, np.ndarray]
+
+    @classmethod
+    def lazy(
+        cls,
+        source: Mapping[str, np.ndarray],
+        idx_a: np.ndarray,
+        idx_b: np.ndarray,
+        columns: Iterable[str] | None = None,
+    ) -> "SplitPair":
+        """A pair that keeps `source` plus the A/B row indices only."""
+
+        columns = None if columns is None else list(columns)
+        return cls(
+            a=LazyColumns(source, idx_a, columns),
+            b=LazyColumns(source, idx_b, columns),
+        )
+
+    @property
+    def is_lazy(self) -> bool:
+        return isinstance(self.a, LazyColumns) or isinstance(self.b, LazyColumns)
+
+    def materialize(self) -> "SplitPair":
+        """An eager copy of this pair (itself if already eager)."""
+
+        if not self.is_lazy:
+            return self
+        return SplitPair(a=dict(self.a.items()), b=dict(self.b.items()))
 
     @staticmethod
-    def _combine_dict_to_matrix(
-        d: dict[str, np.ndarray],
+    def _shapes(
+        d: Mapping[str, np.ndarray],
+    ) -> dict[str, tuple[int, ...]]:
+        if isinstance(d, LazyColumns):
+            return d.shapes()
+        return {name: np.shape(arr) for name, arr in d.items()}
+
+    def shapes(self) -> tuple[dict[str, tuple[int, ...]], dict[str, tuple[int, ...]]]:
+        """Per-column shapes of (A, B), without gathering lazy columns."""
+        return self._shapes(self.a), self._shapes(self.b)
+
+    @staticmethod
+    def _num_rows(
+        d: Mapping[str, np.ndarray],
+        name: str,
+    ) -> int:
+        if isinstance(d, LazyColumns):
+            return d.num_rows
+        return np.asarray(d[name]).shape[0]
+
+    @staticmethod
+    def _dtype(
+        d: Mapping[str, np.ndarray],
+        name: str,
+    ) -> np.dtype:
+        if isinstance(d, LazyColumns):
+            return d.dtype(name)
+        return np.asarray(d[name]).dtype
+
+    @staticmethod
+    def _check_columns(
+        d: Mapping[str, np.ndarray],
         order: Iterable[str] | None = None,
-    ) -> Tuple[np.ndarray, list[str]]:
+    ) -> list[str]:
+        """Resolve the column order and check all columns share one length."""
 
         # Decide the column order
         if order is None:
@@ -29,6 +178,13 @@ class SplitPair:
         # Sanity: same length for all arrays
         lengths: list[int] = []
 
+        if isinstance(d, LazyColumns):
+            # Every lazy column shares one index: only check they exist
+            missing = [name for name in col_names if name not in d]
+            if missing:
+                raise KeyError(f"Columns missing from split: {missing}")
+            return col_names
+
         for name in col_names:
             # 1) Get the per-branch array (could already be a NumPy array)
             arr = d[name]
@@ -50,13 +206,122 @@ class SplitPair:
                 f"Inconsistent lengths across columns: {dict(zip(col_names, lengths))}"
             )
 
-        # Combine as columns → (N, D).  (np.column_stack avoids a transpose.)
-        X = np.column_stack(
-            [np.asarray(d[name]).reshape(-1) for name in col_names],
-        )
+        return col_names
+
+    @classmethod
+    def _combine_dict_to_matrix(
+        cls,
+        d: Mapping[str, np.ndarray],
+        order: Iterable[str] | None = None,
+        dtype: np.dtype | str | None = None,
+    ) -> Tuple[np.ndarray, list[str]]:
+
+        col_names = cls._check_columns(d, order)
+        cols = [np.asarray(d[name]).reshape(-1) for name in col_names]
+
+        # Same promotion as np.column_stack unless a target dtype is given;
+        # filling a preallocated (N, D) matrix casts each column on the way
+        # in instead of materializing a promoted float64 copy first.
+        if dtype is None:
+            dtype = np.result_type(*cols)
+
+        X = np.empty((cols[0].shape[0], len(cols)), dtype=dtype)
+        for j, col in enumerate(cols):
+            X[:, j] = col
 
         return X, col_names
 
+    @classmethod
+    def _combine_dict_to_records(
+        cls,
+        d: Mapping[str, np.ndarray],
+        order: Iterable[str] | None = None,
+        plan: DtypePlan | None = None,
+    ) -> Tuple[np.ndarray, list[str]]:
+
+        col_names = cls._check_columns(d, order)
+
+        if plan is None:
+            # No plan → keep every branch's native dtype
+            plan = DtypePlan({name: cls._dtype(d, name) for name in col_names})
+
+        n_rows = cls._num_rows(d, col_names[0])
+        R = np.empty(n_rows, dtype=plan.structured_dtype(col_names))
+        for name in col_names:
+            R[name] = d[name]
+
+        return R, col_names
+
+    @staticmethod
+    def resolve_prefix(
+        out_prefix: str | Path,
+    ) -> Path:
+        """
+        Turn a user prefix into the on-disk prefix used for saving.
+
+        Relative prefixes not already starting with 'output' are anchored
+        under 'output/'; any extension is stripped.
+        """
+        base = Path(out_prefix)
+
+        # Anchor under output/ when a relative path not already starting with 'output'
+        if not base.is_absolute():
+            if not base.parts or base.parts[0].lower() != "output":
+                base = Path("output") / base
+
+        # strip any extension to make a clean prefix
+        return base if base.suffix == "" else base.with_suffix("")
+
+    @classmethod
+    def _write_npy_blocks(
+        cls,
+        path: Path,
+        d: Mapping[str, np.ndarray],
+        columns: list[str],
+        dtype: np.dtype,
+        structured: bool,
+        budget: MemoryBudget,
+        on_block: Callable[[dict[str, np.ndarray]], None] | None = None,
+    ) -> None:
+        """Write one side as .npy, assembling at most a budget's worth of rows."""
+
+        n_rows = cls._num_rows(d, columns[0])
+
+        if structured:
+            shape: tuple[int, ...] = (n_rows,)
+            row_bytes = dtype.itemsize
+            plan = DtypePlan({name: dtype.fields[name][0] for name in columns})
+        else:
+            shape = (n_rows, len(columns))
+            row_bytes = dtype.itemsize * len(columns)
+
+        # Live copies per block: the assembled rows (+ slack for the write)
+        block = budget.entries_per_chunk(row_bytes, live_copies=2) or n_rows
+        block = max(1, min(block, n_rows))
+
+        header = {
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "fortran_order": False,
+            "shape": shape,
+        }
+
+        with open(path, "wb") as f:
+            np.lib.format.write_array_header_1_0(f, header)
+
+            for start in range(0, n_rows, block):
+                if isinstance(d, LazyColumns):
+                    # Gather straight from the source, one block at a time
+                    rows = d.rows(columns, start, start + block)
+                else:
+                    rows = {name: d[name][start : start + block] for name in columns}
+                if on_block is not None:
+                    on_block(rows)
+                if structured:
+                    X, _ = cls._combine_dict_to_records(rows, columns, plan)
+                else:
+                    X, _ = cls._combine_dict_to_matrix(rows, columns, dtype)
+                X.tofile(f)
+
     # --- public API ---
     def combined_a(
         self,
@@ -75,6 +340,7 @@ class SplitPair:
     def combined_both(
         self,
         order: Iterable[str] | None = None,
+        dtype: np.dtype | str | None = None,
     ) -> Tuple[np.ndarray, np.ndarray, list[str]]:
         """
         Return (Xa, Xb, columns). Ensures both use the *same* column order.
@@ -83,16 +349,36 @@ class SplitPair:
         if order is None:
             order = list(self.a.keys())
 
-        Xa, cols = self._combine_dict_to_matrix(self.a, order)
-        Xb, _ = self._combine_dict_to_matrix(self.b, cols)
+        Xa, cols = self._combine_dict_to_matrix(self.a, order, dtype)
+        Xb, _ = self._combine_dict_to_matrix(self.b, cols, dtype)
         return Xa, Xb, cols
 
+    def records_both(
+        self,
+        order: Iterable[str] | None = None,
+        plan: DtypePlan | None = None,
+    ) -> Tuple[np.ndarray, np.ndarray, list[str]]:
+        """
+        Return (Ra, Rb, columns) as structured arrays, one field per column,
+        each keeping its planned (or native) dtype instead of a common one.
+        """
+        if order is None:
+            order = list(self.a.keys())
+
+        Ra, cols = self._combine_dict_to_records(self.a, order, plan)
+        Rb, _ = self._combine_dict_to_records(self.b, cols, plan)
+        return Ra, Rb, cols
+
     def save_npy(
         self,
         out_prefix: str | Path,
         order: Iterable[str] | None = None,
         dtype: np.dtype | str | None = None,
         group_suffix: tuple[str, str] = ("A", "B"),
+        plan: DtypePlan | None = None,
+        structured: bool = False,
+        memory_budget: int | str | None = None,
+        on_block: Callable[[str, dict[str, np.ndarray]], None] | None = None,
     ) -> tuple[Path, Path, Path, list[str]]:
         """
         Save:
@@ -100,25 +386,39 @@ class SplitPair:
         - {prefix}_B.npy : (N_b, D) matrix
         - {prefix}_columns.txt : one column name per line (same order as matrices)
 
+        With `plan`, the matrix uses the plan's common dtype (unless `dtype`
+        is given). With `structured=True`, A/B are saved as record arrays of
+        shape (N,) that keep one dtype per column instead.
+
+        With `memory_budget` (bytes or e.g. "2 GB"), rows are assembled and
+        written in blocks that fit the budget instead of building each full
+        matrix in memory first. Lazy sides are gathered block by block
+        straight from their source columns. `on_block(suffix, rows)` sees
+        every block of native-dtype rows as it is written (e.g. to collect
+        statistics in the same pass).
+
         If `out_prefix` is relative and doesn't start with 'output', it will be saved under 'output/'.
         Returns (path_a, path_b, path_cols, columns).
         """
-        
-        Xa, Xb, columns = self.combined_both(order)
 
-        if dtype is not None:
-            Xa = Xa.astype(dtype, copy=False)
-            Xb = Xb.astype(dtype, copy=False)
+        columns = list(self.a.keys()) if order is None else list(order)
+        columns = self._check_columns(self.a, columns)
+        self._check_columns(self.b, columns)
 
-        base = Path(out_prefix)
+        if structured:
+            if plan is None:
+                plan = DtypePlan({n: self._dtype(self.a, n) for n in columns})
+            out_dtype = plan.structured_dtype(columns)
+        else:
+            if dtype is None and plan is not None:
+                dtype = plan.matrix_dtype(columns)
+            if dtype is None:
+                dtype = np.result_type(*[self._dtype(self.a, n) for n in columns])
+            out_dtype = np.dtype(dtype)
 
-        # Anchor under output/ when a relative path not already starting with 'output'
-        if not base.is_absolute():
-            if not base.parts or base.parts[0].lower() != "output":
-                base = Path("output") / base
+        budget = MemoryBudget.parse(memory_budget)
 
-        # strip any extension to make a clean prefix
-        base_no_ext = base if base.suffix == "" else base.with_suffix("")
+        base_no_ext = self.resolve_prefix(out_prefix)
         base_no_ext.parent.mkdir(parents=True, exist_ok=True)
 
         path_a = base_no_ext.with_name(
@@ -131,11 +431,92 @@ class SplitPair:
 
         path_cols = base_no_ext.with_name(base_no_ext.name + "_columns.txt")
 
-        np.save(path_a, Xa)
-        np.save(path_b, Xb)
+        for suffix, path, d in zip(group_suffix, (path_a, path_b), (self.a, self.b)):
+            side_block = None
+            if on_block is not None:
+                side_block = lambda rows, suffix=suffix: on_block(suffix, rows)
+            self._write_npy_blocks(
+                path, d, columns, out_dtype, structured, budget, side_block
+            )
 
         with open(path_cols, "w", encoding="utf-8") as f:
             for name in columns:
                 f.write(f"{name}\n")
 
         return path_a, path_b, path_cols, columns
+
+    @classmethod
+    def _extend_tree_blocks(
+        cls,
+        tree: Any,
+        d: Mapping[str, np.ndarray],
+        columns: list[str],
+        dtypes: dict[str, np.dtype],
+        block: int,
+    ) -> None:
+        """Append one side to a writable TTree, one basket per block."""
+
+        n_rows = cls._num_rows(d, columns[0])
+
+        for start in range(0, n_rows, block):
+            if isinstance(d, LazyColumns):
+                rows = d.rows(columns, start, start + block)
+            else:
+                rows = {name: d[name][start : start + block] for name in columns}
+            tree.extend(
+                {
+                    name: np.ascontiguousarray(rows[name], dtype=dtypes[name])
+                    for name in columns
+                }
+            )
+
+    def save_root(
+        self,
+        out_prefix: str | Path,
+        order: Iterable[str] | None = None,
+        plan: DtypePlan | None = None,
+        tree_names: tuple[str, str] = ("A", "B"),
+        compression: str | None = "ZLIB:1",
+        basket_entries: int = 100_000,
+        memory_budget: int | str | None = None,
+    ) -> tuple[Path, list[str]]:
+        """
+        Save both sides as TTrees of one ROOT file, `{prefix}.root`, with
+        one branch per column in its native (or planned) dtype.
+
+        Rows are appended in blocks of `basket_entries`, so every block
+        becomes one basket per branch; with `memory_budget` the blocks
+        shrink further to fit it. Only one block of rows is assembled at a
+        time, and lazy sides are gathered block by block from their source.
+        `compression` is e.g. "ZLIB:1", "LZMA:9", "LZ4:4", "ZSTD:5" or "none".
+
+        Returns (path, columns).
+        """
+
+        columns = list(self.a.keys()) if order is None else list(order)
+        columns = self._check_columns(self.a, columns)
+        self._check_columns(self.b, columns)
+
+        if plan is None:
+            plan = DtypePlan({n: self._dtype(self.a, n) for n in columns})
+        dtypes = {name: np.dtype(plan.dtypes[name]) for name in columns}
+
+        if basket_entries < 1:
+            raise ValueError(f"basket_entries must be >= 1, got {basket_entries}")
+
+        budget = MemoryBudget.parse(memory_budget)
+        row_bytes = sum(dt.itemsize for dt in dtypes.values())
+        # Live copies per block: gathered rows, cast rows, uproot's buffer
+        fitted = budget.entries_per_chunk(row_bytes, live_copies=3)
+        block = basket_entries if fitted is None else max(1, min(basket_entries, fitted))
+
+        base_no_ext = self.resolve_prefix(out_prefix)
+        base_no_ext.parent.mkdir(parents=True, exist_ok=True)
+        path = base_no_ext.with_suffix(".root")
+
+        with uproot.recreate(path, compression=parse_compression(compression)) as f:
+            for name, d in zip(tree_names, (self.a, self.b)):
+                tree = f.mktree(name, {col: dtypes[col] for col in columns})
+                self._extend_tree_blocks(tree, d, columns, dtypes, block)
+
+        return path, columns
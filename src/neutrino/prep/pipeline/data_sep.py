@@ -1,10 +1,20 @@
-from typing import Iterable
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Iterable, Iterator
 import numpy as np
+import uproot
 
+from neutrino.prep.io.root_io import parse_compression
 from neutrino.prep.io.tree_ref import TreeRef
 from neutrino.prep.io.tree_reader import TreeReader
+from neutrino.prep.io.category_index import CategoryIndex, EntrySet
+from neutrino.prep.io.sampler import SampleResult
 from neutrino.prep.config.split_config import SplitConfig
 from neutrino.prep.pipeline.data_pair import SplitPair
+from neutrino.prep.pipeline.cuts import CutSet
+from neutrino.prep.pipeline.hash_split import HashSplitter
+from neutrino.prep.pipeline.split_plan import SplitPlan, SplitPlanner
+from neutrino.prep.pipeline.split_spec import SplitSpec
 
 
 class DataSep:
@@ -13,9 +23,24 @@ class DataSep:
         ref: TreeRef,
     ) -> None:
 
-        self.reader = TreeReader(ref)
+        self.reader = TreeReader.from_config(ref)
         self.config = SplitConfig.load_config()
         self._default_flag = self.config.flag_branch
+        self._indexes: dict[str, CategoryIndex] = {}
+        self.planner = SplitPlanner(ref, self.config, reader=self.reader)
+
+    def close(self) -> None:
+        """Release the reader (its threads and the friend files it opened)."""
+        self.reader.close()
+
+    def __enter__(self) -> "DataSep":
+        """Allow: with DataSep(ref) as sep: ..."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        """Always close when leaving the with-block (even on exception)."""
+        self.close()
+        return False
 
     def _mask_eq(
         self,
@@ -26,130 +51,514 @@ class DataSep:
 
         return values == target
 
-    def split_by_flag(
-        self,
-        branches: Iterable[str] | None = None,
-        flag_branch: str | None = None,
-        a_value: int | None = None,
-        b_value: int | None = None,
-    ) -> SplitPair:
+    @staticmethod
+    def _concat_parts(
+        parts: dict[str, list[np.ndarray]],
+        dtypes: dict[str, np.dtype],
+    ) -> dict[str, np.ndarray]:
+        """Join per-chunk slices back into one array per branch (empty
+        arrays of the branch dtype when the tree has no entries)."""
+
+        out: dict[str, np.ndarray] = {}
+
+        for name, pieces in parts.items():
+            if not pieces:
+                out[name] = np.empty(0, dtype=dtypes[name])
+            # A single chunk needs no extra copy
+            elif len(pieces) == 1:
+                out[name] = pieces[0]
+            else:
+                out[name] = np.concatenate(pieces)
 
-        if flag_branch is None or flag_branch == "":
-            flag = self._default_flag
-        else:
-            flag = flag_branch
+        return out
 
-        if branches is None:
-            branches = self.config.target_branches
-        else:
-            branches = list(branches)
+    def explain(
+        self,
+        method: str = "flag",
+        branches: Iterable[str] | None = None,
+    ) -> SplitPlan:
+        """Dry run: validate the request and print what it would cost."""
 
-        if a_value is None:
-            a_value = self.config.flag_values["A"]
-        if b_value is None:
-            b_value = self.config.flag_values["B"]
+        plan = self.planner.plan(method, branches)
+        plan.report()
+        return plan
 
-        # Read user-requested branches + the flag branch
-        cols: list[str] = list(dict.fromkeys([*branches, flag]))
-        data = self.reader.read_multiple(cols)
+    def sample(
+        self,
+        branches: Iterable[str] | None = None,
+        fraction: float | None = None,
+        n_events: int | None = None,
+        stratify: bool = False,
+        seed: int = 0,
+    ) -> SampleResult:
+        """
+        Quick random sample of the target branches for exploration, e.g.
+        `sample(fraction=0.01)`; only the clusters drawn are read. With
+        `stratify`, every interaction type keeps its share (from the
+        category index of cat_branch).
+        """
+
+        cols = list(self.config.target_branches if branches is None else branches)
+        self.planner.validate(cols)
+
+        strata = self.category_index(self.config.cat_branch) if stratify else None
+        result = self.reader.sample(
+            cols, fraction=fraction, n_events=n_events, seed=seed, strata=strata
+        )
+        result.report()
+        return result
+
+    # ---------- index-backed selections ----------
+    def category_index(
+        self,
+        branch: str,
+    ) -> CategoryIndex:
+        """Sidecar index for a categorical branch (built on first use)."""
 
-        # Separate the flag from the rest (so it’s not returned in A/B sets).
-        flag_values = data.pop(flag)
+        if branch not in self._indexes:
+            self._indexes[branch] = CategoryIndex.open(self.reader.ref, branch)
+        return self._indexes[branch]
 
-        # Build masks and slice arrays.
-        mask_a = self._mask_eq(flag_values, a_value)
-        mask_b = self._mask_eq(flag_values, b_value)
+    def select_flag(
+        self,
+        value: int,
+        flag_branch: str | None = None,
+    ) -> EntrySet:
+        """Entries where the flag branch equals `value`, from the index."""
 
-        # data: dict[str, np.ndarray]  # e.g., {"energy": ..., "q2": ...}
-        # mask_a, mask_b: np.ndarray[bool]  # same length as the arrays in `data`
+        flag = flag_branch or self._default_flag
+        return self.category_index(flag).where(value)
 
-        a: dict[str, np.ndarray] = {}
-        b: dict[str, np.ndarray] = {}
+    def select_categories(
+        self,
+        labels: Iterable[str],
+        cat_branch: str | None = None,
+    ) -> EntrySet:
+        """Entries whose category is any of `labels` (e.g. QE/RES/DIS)."""
 
-        for name, arr in data.items():
-            # Keep only rows where mask_a is True (e.g., Sample_Flag == 0)
-            a[name] = arr[mask_a]
+        cat = cat_branch or self.config.cat_branch
+        codes = [self.config.type_map[label] for label in labels]
+        return self.category_index(cat).where(codes)
 
-            # Keep only rows where mask_b is True (e.g., Sample_Flag == 1)
-            b[name] = arr[mask_b]
+    @staticmethod
+    def _chunk_len(
+        data: dict[str, np.ndarray],
+    ) -> int:
+        return len(next(iter(data.values())))
 
-        # Now `a` and `b` are dicts with the same keys as `data`,
-        # but each array contains only the selected rows.
+    def _select_codes(
+        self,
+        branch: str,
+        codes: tuple[int, ...],
+    ) -> EntrySet:
+        """Entries where `branch` is any of `codes`, from the index."""
 
-        print("---------- Dataset A ----------")
-        for k, v in a.items():
-            print(f"{k}: {v.shape}")
+        return self.category_index(branch).where(list(codes))
 
-        print("---------- Dataset B ----------")
-        for k, v in b.items():
-            print(f"{k}: {v.shape}")
+    def _check_specs(
+        self,
+        specs: Iterable[SplitSpec] | None,
+        cuts: CutSet | None,
+    ) -> tuple[list[SplitSpec], CutSet]:
+        """Resolve config defaults and fail on bad specs before any reading."""
 
-        return SplitPair(a=a, b=b)
+        specs = SplitSpec.from_config(self.config) if specs is None else list(specs)
+        if not specs:
+            raise ValueError("No splits to run")
 
-    def split_by_categories(
-        self,
-        branches: Iterable[str] | None = None,
-        cat_branch: str | None = None,
-        groups: dict[str, list[str]] | None = None,
-        include_cat: bool | None = None,  # NEW: control whether cat column is returned
-    ) -> SplitPair:
-        
-        # ------ resolve inputs ------
-        if branches is None:
-            requested = list(self.config.target_branches)
-        else:
-            requested = list(branches)  # materialize once; preserves user order
+        names = [spec.name for spec in specs]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate split names: {names}")
 
-        if cat_branch is None or cat_branch == "":
-            cat_branch = self.config.cat_branch
+        if cuts is None:
+            cuts = CutSet.from_config(self.config)
 
-        if groups is None:
-            groups = self.config.type_group
+        # Fail on typos before any reading starts
+        self.planner.validate(
+            [*(b for spec in specs for b in spec.read_branches), *cuts.read_branches]
+        )
 
-        type_map = self.config.type_map  # {"QE":0, "RES":1, ...}
+        return specs, cuts
 
-        # Decide whether to include the category column in outputs:
-        # - If caller passed include_cat explicitly, respect it.
-        # - Otherwise, include it iff the caller explicitly requested it in `branches`.
-        if include_cat is None:
-            include_cat = cat_branch in requested
+    def _split_chunks(
+        self,
+        specs: list[SplitSpec],
+        use_index: bool,
+        cuts: CutSet,
+        extra_copies: float,
+    ) -> Iterator[tuple[int, dict[str, np.ndarray], dict[tuple, np.ndarray]]]:
+        """
+        Read every spec's columns in one pass and yield, per chunk,
+        (start, data, rows): rows maps each spec.mask_key(side) to the
+        chunk-local row numbers selected (cuts applied). Read stats and
+        the cutflow are printed once the tree is exhausted.
+        """
+
+        # With `use_index` the masks come from the sidecar bitmap index and
+        # a flag/category branch is only read if some split outputs it.
+        selections: dict[tuple, EntrySet] = {}
+        if use_index:
+            for spec in specs:
+                if spec.kind == "hash":
+                    continue
+                for side in ("A", "B"):
+                    key = spec.mask_key(side)
+                    if key not in selections:
+                        selections[key] = self._select_codes(*key)
+            cols: list[str] = list(
+                dict.fromkeys(b for spec in specs for b in spec.branches)
+            )
+        else:
+            cols = list(dict.fromkeys(b for spec in specs for b in spec.read_branches))
+
+        # Cut-only branches are read for masking but never output
+        cols = list(dict.fromkeys([*cols, *cuts.read_branches]))
+
+        chunks = self.reader.iter_chunks(cols, extra_copies=extra_copies)
+
+        # Hash splits need only entry numbers: one splitter per seed
+        splitters = {
+            spec.seed: HashSplitter.for_file(self.reader.io, spec.seed)
+            for spec in specs
+            if spec.kind == "hash"
+        }
+
+        start = 0
+
+        for data in chunks:
+            stop = start + self._chunk_len(data)
+
+            # One fused preselection mask per chunk (None → no cuts)
+            passed = cuts.apply(data, stop - start)
+
+            # Splits with the same selection share one index array per chunk
+            rows: dict[tuple, np.ndarray] = {}
+
+            for spec in specs:
+                for side in ("A", "B"):
+                    key = spec.mask_key(side)
+                    if key in rows:
+                        continue
+                    if spec.kind == "hash":
+                        _, seed, lo, hi = key
+                        mask = splitters[seed].mask(start, stop, lo, hi)
+                    elif use_index:
+                        mask = selections[key].mask(start, stop)
+                    elif len(key[1]) == 1:
+                        mask = self._mask_eq(data[key[0]], key[1][0])
+                    else:
+                        mask = np.isin(data[key[0]], key[1])
+
+                    if passed is not None:
+                        mask &= passed
+                    rows[key] = np.flatnonzero(mask)
+
+            yield start, data, rows
+            start = stop
+
+        chunks.stats.report()
+        if cuts:
+            cuts.cutflow.report()
+
+    def split_many(
+        self,
+        specs: Iterable[SplitSpec] | None = None,
+        use_index: bool = False,
+        cuts: CutSet | None = None,
+        lazy: bool = False,
+    ) -> dict[str, SplitPair]:
+        """
+        Run several splits over a single pass of the tree.
+
+        The union of every spec's branches is read once, chunk by chunk;
+        each chunk is then masked once per (branch, codes) and sliced into
+        every split that needs it. Defaults to SplitConfig.splits. "hash"
+        specs are masked from entry numbers alone (no branch is read).
+
+        `cuts` (default: SplitConfig.cuts) is a preselection evaluated once
+        per chunk and folded into every A/B mask; each mask becomes one
+        index array, applied with a single gather per branch.
+
+        With `lazy=True` nothing is gathered: the output columns are kept
+        once (shared by every split) together with each side's row
+        indices, and SplitPair.lazy views gather rows only when a column
+        is used or written.
+
+        The whole split is held in memory. When the eager `output_bytes`
+        exceed the ReadConfig memory budget, the split falls back to
+        `lazy=True`, which holds every output column once; if even that is
+        over budget a warning is printed and the split still runs.
+        split_to_root writes ROOT output chunk by chunk instead.
+        """
+
+        specs, cuts = self._check_specs(specs, cuts)
+
+        # Outputs live until the end: pick the mode that fits the budget
+        outputs = list(dict.fromkeys(b for spec in specs for b in spec.branches))
+        num_entries = int(self.reader._get_tree().num_entries)
+        budget = self.reader.budget
+        mb = 1024**2
+
+        if not lazy and not budget.fits(self.output_bytes(specs, num_entries)):
+            print(
+                "[DataSep.split_many] eager split is over the memory budget; "
+                "keeping one copy of the columns (lazy) instead"
+            )
+            lazy = True
+
+        need = self.output_bytes(specs, num_entries, lazy)
+        if not budget.fits(need):
+            print(
+                f"[DataSep.split_many] warning: needs about {need / mb:.1f} MB, "
+                f"over the budget of {budget.limit / mb:.1f} MB"
+            )
+
+        parts: dict[str, tuple[dict[str, list[np.ndarray]], ...]] = {
+            spec.name: (
+                {name: [] for name in spec.branches},
+                {name: [] for name in spec.branches},
+            )
+            for spec in specs
+        }
+
+        # Lazy mode: output columns filled in place, plus row indices per mask
+        source: dict[str, np.ndarray] = {}
+        index_parts: dict[tuple, list[np.ndarray]] = {}
+
+        # Masked slices of the current chunk are one extra chunk-sized copy
+        for start, data, rows in self._split_chunks(
+            specs, use_index, cuts, extra_copies=0 if lazy else 1
+        ):
+            if not lazy:
+                for spec in specs:
+                    for side, group in zip(("A", "B"), parts[spec.name]):
+                        idx = rows[spec.mask_key(side)]
+                        for name in spec.branches:
+                            group[name].append(data[name].take(idx))
+                continue
+
+            for key, r in rows.items():
+                index_parts.setdefault(key, []).append(r + start)
+
+            stop = start + self._chunk_len(data)
+            for name in outputs:
+                arr = data[name]
+                if name not in source:
+                    shape = (num_entries, *arr.shape[1:])
+                    source[name] = np.empty(shape, dtype=arr.dtype)
+                source[name][start:stop] = arr
+
+        out: dict[str, SplitPair] = {}
+
+        # An empty tree yields no chunks: outputs are empty, in native dtypes
+        dtypes = self.reader.branch_dtypes(outputs) if num_entries == 0 else {}
+
+        if lazy:
+            for name in outputs:
+                if name not in source:
+                    source[name] = np.empty(0, dtype=dtypes[name])
+
+            index = {key: np.concatenate(p) for key, p in index_parts.items()}
+            for spec in specs:
+                for side in ("A", "B"):
+                    index.setdefault(spec.mask_key(side), np.empty(0, np.int64))
+
+            for spec in specs:
+                out[spec.name] = SplitPair.lazy(
+                    source,
+                    index[spec.mask_key("A")],
+                    index[spec.mask_key("B")],
+                    spec.branches,
+                )
+        else:
+            for spec in specs:
+                out[spec.name] = SplitPair(
+                    a=self._concat_parts(parts[spec.name][0], dtypes),
+                    b=self._concat_parts(parts[spec.name][1], dtypes),
+                )
 
-        # Read requested branches + the categorical branch (ensure cat is available for masking)
-        cols: list[str] = list(dict.fromkeys([*requested, cat_branch]))
-        data = self.reader.read_multiple(cols)
+        self.reader.budget.check("DataSep.split_many")
 
-        # Don't pop yet — we might want to keep it in the outputs
-        cats = data[cat_branch]
+        for spec in specs:
+            label = f"{spec.name}: " if len(specs) > 1 else ""
+            shapes_a, shapes_b = out[spec.name].shapes()
 
-        # Build masks per group
-        out: dict[str, dict[str, np.ndarray]] = {}
+            print(f"---------- {label}Dataset A ----------")
+            for k, shape in shapes_a.items():
+                print(f"{k}: {shape}")
 
-        for group_name, labels in groups.items():
-            # Map labels -> integer codes (if your file stores ints)
-            codes: list[int] = [type_map[label] for label in labels]
-            mask = np.isin(cats, codes)
+            print(f"---------- {label}Dataset B ----------")
+            for k, shape in shapes_b.items():
+                print(f"{k}: {shape}")
 
-            # Choose which columns to output, preserving the user's requested order
-            if include_cat:
-                feature_order = requested  # may include cat_branch if user asked for it
-            else:
-                feature_order = [n for n in requested if n != cat_branch]
+        return out
 
-            group_data: dict[str, np.ndarray] = {}
-            for name in feature_order:
-                group_data[name] = data[name][mask]
+    def split_to_root(
+        self,
+        specs: Iterable[SplitSpec] | None = None,
+        use_index: bool = False,
+        cuts: CutSet | None = None,
+    ) -> dict[str, Path]:
+        """
+        Run split_many's single pass, appending every chunk's A/B rows
+        straight to `{prefix}.root` (trees A, B) of each split.
+
+        No split outlives its chunk, so the output is not bounded by the
+        memory budget. Branches keep their native dtypes; slices longer
+        than SplitConfig.root_basket_entries are appended in several
+        baskets. The prefix is spec.out_prefix or "{name}/data".
+
+        Returns {split name: path}.
+        """
+
+        specs, cuts = self._check_specs(specs, cuts)
+
+        outputs = list(dict.fromkeys(b for spec in specs for b in spec.branches))
+        dtypes = self.reader.branch_dtypes(outputs)
+        basket = max(1, self.config.root_basket_entries)
+        compression = parse_compression(self.config.root_compression)
+
+        paths: dict[str, Path] = {}
+        trees: dict[str, tuple[Any, Any]] = {}
+        counts: dict[str, list[int]] = {spec.name: [0, 0] for spec in specs}
+
+        with ExitStack() as stack:
+            for spec in specs:
+                base = SplitPair.resolve_prefix(spec.out_prefix or f"{spec.name}/data")
+                base.parent.mkdir(parents=True, exist_ok=True)
+                paths[spec.name] = base.with_suffix(".root")
+
+                f = stack.enter_context(
+                    uproot.recreate(paths[spec.name], compression=compression)
+                )
+                branches = {name: dtypes[name] for name in spec.branches}
+                trees[spec.name] = (f.mktree("A", branches), f.mktree("B", branches))
+
+            # Masked slices of the current chunk are one extra chunk-sized copy
+            for _, data, rows in self._split_chunks(specs, use_index, cuts, 1):
+                for spec in specs:
+                    for i, side in enumerate(("A", "B")):
+                        idx = rows[spec.mask_key(side)]
+                        counts[spec.name][i] += len(idx)
+
+                        for lo in range(0, len(idx), basket):
+                            block = idx[lo : lo + basket]
+                            trees[spec.name][i].extend(
+                                {
+                                    name: np.ascontiguousarray(
+                                        data[name].take(block), dtype=dtypes[name]
+                                    )
+                                    for name in spec.branches
+                                }
+                            )
+
+        for spec in specs:
+            label = f"{spec.name}: " if len(specs) > 1 else ""
+            n_a, n_b = counts[spec.name]
+            print(f"---------- {label}ROOT output ----------")
+            print(f"{paths[spec.name]}: A {n_a} rows, B {n_b} rows")
+
+        return paths
+
+    def output_bytes(
+        self,
+        specs: Iterable[SplitSpec],
+        num_entries: int,
+        lazy: bool = False,
+    ) -> float:
+        """
+        Upper bound on what split_many holds once the tree is read.
+
+        Eager splits keep their masked slices and then concatenate them,
+        so every output column is held twice (A and B together cover at
+        most every entry). Lazy splits keep the output columns once,
+        filled in place, plus int64 row indices of every side.
+        """
+
+        specs = list(specs)
+        if lazy:
+            outputs = list(dict.fromkeys(b for spec in specs for b in spec.branches))
+            columns = num_entries * self.reader.bytes_per_entry(outputs)
+            return columns + 8 * num_entries * len(specs)
+
+        return sum(
+            2 * num_entries * self.reader.bytes_per_entry(spec.branches)
+            for spec in specs
+        )
 
-            out[group_name] = group_data
+    def split_by_flag(
+        self,
+        branches: Iterable[str] | None = None,
+        flag_branch: str | None = None,
+        a_value: int | None = None,
+        b_value: int | None = None,
+        use_index: bool = False,
+        lazy: bool = False,
+    ) -> SplitPair:
+        """Rows with flag == a_value go to A, flag == b_value to B."""
 
-        print("---------- Dataset A ----------")
-        for k, v in out["A"].items():
-            print(f"{k}: {v.shape}")
+        spec = SplitSpec.flag(
+            self.config,
+            branches=branches,
+            flag_branch=flag_branch,
+            a_value=a_value,
+            b_value=b_value,
+        )
+        return self.split_many([spec], use_index=use_index, lazy=lazy)[spec.name]
 
-        print("---------- Dataset B ----------")
-        for k, v in out["B"].items():
-            print(f"{k}: {v.shape}")
+    def split_by_categories(
+        self,
+        branches: Iterable[str] | None = None,
+        cat_branch: str | None = None,
+        groups: dict[str, list[str]] | None = None,
+        include_cat: bool | None = None,  # NEW: control whether cat column is returned
+        use_index: bool = False,
+        lazy: bool = False,
+    ) -> SplitPair:
+        """
+        Rows whose category is in groups["A"] go to A, groups["B"] to B.
+        The category column is kept iff `include_cat` (default: iff it is
+        one of the requested `branches`).
+        """
+
+        if groups is not None:
+            self.planner.validate_labels(groups)
+
+        spec = SplitSpec.categories(
+            self.config,
+            branches=branches,
+            cat_branch=cat_branch,
+            groups=groups,
+            include_cat=include_cat,
+        )
+        return self.split_many([spec], use_index=use_index, lazy=lazy)[spec.name]
+
+    def split_by_hash(
+        self,
+        branches: Iterable[str] | None = None,
+        fractions: dict[str, float] | None = None,
+        seed: int = 0,
+        lazy: bool = False,
+    ) -> SplitPair:
+        """
+        Random A/B split by a hash of (file, entry number, seed), e.g.
+        fractions {"A": 0.8, "B": 0.2}; needs no Sample_Flag branch.
+        """
+
+        spec = SplitSpec.hash(
+            self.config,
+            branches=branches,
+            fractions=fractions,
+            seed=seed,
+        )
+        return self.split_many([spec], lazy=lazy)[spec.name]
+
+    def hash_folds(
+        self,
+        n_folds: int,
+        seed: int = 0,
+    ) -> np.ndarray:
+        """Fold number (int8) of every entry of the tree, without reading it."""
 
-        # Return as SplitPair (assumes 'A' and 'B' keys exist in config)
-        # Todo: Make this more elegant
-        # ? Should we
-        return SplitPair(a=out["A"], b=out["B"])
+        n = int(self.reader._get_tree().num_entries)
+        return HashSplitter.for_file(self.reader.io, seed).folds(0, n, n_folds)
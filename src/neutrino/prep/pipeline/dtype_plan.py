@@ -0,0 +1,251 @@
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Mapping
+
+import numpy as np
+
+from neutrino.prep.io.tree_meta import TreeMeta, ValueRange
+from neutrino.prep.config.split_config import SplitConfig
+
+# Integer candidates, smallest first; unsigned preferred when min >= 0.
+_INT_CANDIDATES: list[np.dtype] = [
+    np.dtype(t)
+    for t in (
+        np.uint8,
+        np.int8,
+        np.uint16,
+        np.int16,
+        np.uint32,
+        np.int32,
+        np.uint64,
+        np.int64,
+    )
+]
+
+# float64 → float32 rounds with a relative error of at most 2**-24.
+_FLOAT32_ROUNDOFF: float = 2.0**-24
+
+
+@dataclass(frozen=True)
+class DtypePlan:
+    """
+    Output dtype for every branch of a split.
+
+    Integer branches (and float branches that only ever hold whole numbers)
+    are narrowed to the smallest integer type covering their value range,
+    which is always lossless. float64 branches are narrowed to float32 only
+    when the configured relative tolerance allows it. Explicit per-branch
+    overrides always win, but are checked against the data when available.
+    """
+
+    dtypes: dict[str, np.dtype]
+
+    # ---------- planning ----------
+    @staticmethod
+    def _blocks(
+        d: Mapping[str, np.ndarray],
+        name: str,
+    ) -> Iterator[np.ndarray]:
+        """A column in blocks: lazy sides (LazyColumns) gather block by block."""
+
+        iter_blocks = getattr(d, "iter_blocks", None)
+        if iter_blocks is not None:
+            yield from iter_blocks(name)
+        else:
+            yield np.asarray(d[name])
+
+    @staticmethod
+    def _plan_one(
+        native: np.dtype,
+        rng: ValueRange,
+        tolerance: float,
+    ) -> np.dtype:
+
+        # Empty branch or non-numeric: nothing to learn from the range
+        if native.kind not in "biuf" or rng.min > rng.max:
+            return native
+
+        if native.kind == "b":
+            return native
+
+        if native.kind in "iu" or (rng.integral and not rng.has_nan):
+            for cand in _INT_CANDIDATES:
+                if cand.kind == "u" and rng.min < 0:
+                    continue
+                info = np.iinfo(cand)
+                if info.min <= rng.min and rng.max <= info.max:
+                    # Never widen: an int8 branch stays int8
+                    if native.kind in "iu" and cand.itemsize >= native.itemsize:
+                        return native
+                    # A whole-number float becomes an int only if it shrinks
+                    if native.kind == "f" and cand.itemsize >= native.itemsize:
+                        break
+                    return cand
+
+        if native.kind == "f" and native.itemsize > 4:
+            f32_max = float(np.finfo(np.float32).max)
+            if (
+                tolerance >= _FLOAT32_ROUNDOFF
+                and abs(rng.min) <= f32_max
+                and abs(rng.max) <= f32_max
+            ):
+                return np.dtype(np.float32)
+
+        return native
+
+    @classmethod
+    def from_ranges(
+        cls,
+        native: Mapping[str, np.dtype],
+        ranges: Mapping[str, ValueRange],
+        tolerance: float = 0.0,
+        overrides: Mapping[str, str] | None = None,
+    ) -> "DtypePlan":
+
+        overrides = overrides or {}
+        dtypes: dict[str, np.dtype] = {}
+
+        for name, dt in native.items():
+            if name in overrides:
+                dtypes[name] = np.dtype(overrides[name])
+            else:
+                dtypes[name] = cls._plan_one(np.dtype(dt), ranges[name], tolerance)
+
+        return cls(dtypes=dtypes)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        sources: Iterable[Mapping[str, np.ndarray]],
+        tolerance: float = 0.0,
+        overrides: Mapping[str, str] | None = None,
+    ) -> "DtypePlan":
+        """
+        Plan from in-memory columns, e.g. `[pair.a, pair.b]` so that both
+        sides of a split share one layout.
+        """
+
+        sources = list(sources)
+        native: dict[str, np.dtype] = {}
+        ranges: dict[str, ValueRange] = {}
+
+        for d in sources:
+            for name in d:
+                for arr in cls._blocks(d, name):
+                    rng = ValueRange.from_array(arr)
+                    native[name] = (
+                        np.result_type(native[name], arr.dtype)
+                        if name in native
+                        else arr.dtype
+                    )
+                    ranges[name] = ranges[name].merge(rng) if name in ranges else rng
+
+        plan = cls.from_ranges(native, ranges, tolerance, overrides)
+
+        # Overrides are the only casts not derived from the data: verify them.
+        for d in sources:
+            plan.check(d, tolerance, only=list(overrides or {}))
+
+        return plan
+
+    @classmethod
+    def from_meta(
+        cls,
+        meta: TreeMeta,
+        branches: Iterable[str],
+        tolerance: float = 0.0,
+        overrides: Mapping[str, str] | None = None,
+    ) -> "DtypePlan":
+        """Plan from the tree itself (native dtypes + one range pass)."""
+
+        cols = list(dict.fromkeys(branches))
+        native = meta.get_branch_dtypes(cols)
+        ranges = meta.get_value_ranges(cols)
+
+        return cls.from_ranges(native, ranges, tolerance, overrides)
+
+    @classmethod
+    def from_config(
+        cls,
+        config: SplitConfig,
+        sources: Iterable[Mapping[str, np.ndarray]],
+    ) -> "DtypePlan":
+        """from_arrays with tolerance and overrides taken from SplitConfig."""
+
+        return cls.from_arrays(
+            sources,
+            tolerance=config.dtype_tolerance,
+            overrides=config.output_dtypes,
+        )
+
+    # ---------- verification ----------
+    def check(
+        self,
+        d: Mapping[str, np.ndarray],
+        tolerance: float = 0.0,
+        only: Iterable[str] | None = None,
+    ) -> None:
+        """Raise ValueError if casting `d` loses more than `tolerance`."""
+
+        names = list(d) if only is None else [n for n in only if n in d]
+        bad: dict[str, float] = {}
+
+        for name in names:
+            block_worst: list[float] = []
+            for src in self._blocks(d, name):
+                with np.errstate(invalid="ignore", over="ignore"):
+                    dst = src.astype(self.dtypes[name])
+
+                # Compare in float64, treating NaN == NaN as exact
+                back = dst.astype(np.float64)
+                ref = src.astype(np.float64)
+                same = (back == ref) | (np.isnan(ref) & np.isnan(back))
+                with np.errstate(invalid="ignore", over="ignore"):
+                    err = np.abs(back - ref) / np.maximum(
+                        np.abs(ref), np.finfo(float).tiny
+                    )
+                err = np.where(same, 0.0, err)
+
+                if err.size:
+                    block_worst.append(float(np.max(err)))
+
+            # np.max keeps a NaN error (it must fail the check)
+            worst = float(np.max(block_worst)) if block_worst else 0.0
+            if not worst <= tolerance:
+                bad[name] = worst
+
+        if bad:
+            raise ValueError(
+                f"Casting exceeds tolerance {tolerance}: "
+                + ", ".join(
+                    f"{n} → {self.dtypes[n]} (rel. error {e:.3g})"
+                    for n, e in bad.items()
+                )
+            )
+
+    # ---------- layouts ----------
+    def matrix_dtype(
+        self,
+        order: Iterable[str],
+    ) -> np.dtype:
+        """Common dtype for a (N, D) matrix of the planned columns."""
+
+        return np.result_type(*[self.dtypes[name] for name in order])
+
+    def structured_dtype(
+        self,
+        order: Iterable[str],
+    ) -> np.dtype:
+        """Record dtype keeping each column's planned dtype."""
+
+        return np.dtype([(name, self.dtypes[name]) for name in order])
+
+    def apply(
+        self,
+        d: Mapping[str, np.ndarray],
+    ) -> dict[str, np.ndarray]:
+        """Cast every planned column (no copy if already the right dtype)."""
+
+        return {
+            name: np.asarray(arr).astype(self.dtypes.get(name, arr.dtype), copy=False)
+            for name, arr in d.items()
+        }
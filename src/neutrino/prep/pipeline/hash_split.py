@@ -0,0 +1,112 @@
+import hashlib
+from typing import Any
+
+import numpy as np
+
+from neutrino.prep.io.root_io import RootIO
+
+_MASK64 = (1 << 64) - 1
+
+# Streams keep A/B assignment and fold numbers independent of each other
+STREAM_SPLIT = 0
+STREAM_FOLD = 1
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer on a uint64 array (wrap-around arithmetic)."""
+
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def file_key(
+    io: RootIO,
+) -> int:
+    """
+    64-bit key of a ROOT file's identity.
+
+    The ROOT UUID (written once when the file is created) survives copies
+    and renames; a closed file falls back to its file name.
+    """
+
+    identity: dict[str, Any] = io.file_identity()
+    token = identity["uuid"] or io.root_path.name
+    return int.from_bytes(hashlib.sha256(str(token).encode("utf-8")).digest()[:8], "little")
+
+
+class HashSplitter:
+    """
+    Deterministic per-entry randomness from (file key, entry number, seed).
+
+    Every entry gets a uniform value in [0, 1) that depends on nothing
+    else, so the same entry lands in the same group however the tree is
+    chunked, which worker reads it, and whether its file is processed
+    alone (incremental appends) or with others. No branch is read.
+    """
+
+    def __init__(
+        self,
+        key: int,
+        seed: int = 0,
+    ) -> None:
+
+        self.key = int(key) & _MASK64
+        self.seed = int(seed)
+
+    @classmethod
+    def for_file(
+        cls,
+        io: RootIO,
+        seed: int = 0,
+    ) -> "HashSplitter":
+        return cls(file_key(io), seed)
+
+    def _stream_key(
+        self,
+        stream: int,
+    ) -> np.uint64:
+        seeded = self.key ^ ((self.seed * 0x632BE59BD9B4E019) & _MASK64)
+        mixed = _splitmix64(np.array([seeded], dtype=np.uint64))
+        return _splitmix64(mixed ^ np.uint64(stream))[0]
+
+    def uniform(
+        self,
+        start: int,
+        stop: int,
+        stream: int = STREAM_SPLIT,
+    ) -> np.ndarray:
+        """Uniform [0, 1) value of every entry in [start, stop)."""
+
+        entries = np.arange(start, stop, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            h = _splitmix64(entries ^ self._stream_key(stream))
+        # Top 53 bits → an exactly representable double in [0, 1)
+        return (h >> np.uint64(11)).astype(np.float64) * 2.0**-53
+
+    def mask(
+        self,
+        start: int,
+        stop: int,
+        lo: float,
+        hi: float,
+    ) -> np.ndarray:
+        """Entries in [start, stop) whose value falls in [lo, hi)."""
+
+        u = self.uniform(start, stop)
+        return (u >= lo) & (u < hi)
+
+    def folds(
+        self,
+        start: int,
+        stop: int,
+        n_folds: int,
+    ) -> np.ndarray:
+        """Fold number (int8) of every entry in [start, stop)."""
+
+        if not 1 < n_folds <= 127:
+            raise ValueError(f"n_folds must be in [2, 127], got {n_folds}")
+
+        u = self.uniform(start, stop, STREAM_FOLD)
+        return np.minimum((u * n_folds).astype(np.int8), n_folds - 1)
@@ -0,0 +1,373 @@
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+
+from neutrino.prep.config.split_config import SplitConfig
+from neutrino.prep.io.branch_stats import BranchSummary
+from neutrino.prep.io.root_io import RootIO
+from neutrino.prep.io.sidecar import identity_matches
+from neutrino.prep.io.tree_ref import TreeRef
+from neutrino.prep.pipeline.data_pair import SplitPair
+from neutrino.prep.pipeline.data_sep import DataSep
+from neutrino.prep.pipeline.dtype_plan import DtypePlan
+from neutrino.prep.pipeline.split_spec import SplitSpec
+
+
+class ShardSet:
+    """
+    A split dataset grown one ROOT file at a time.
+
+    Every source file becomes its own shard (`{prefix}_part00000_A.npy`,
+    `..._B.npy`, `..._columns.txt`) and is listed in `{prefix}_shards.json`
+    with its file identity, row counts, outputs and per-column
+    BranchSummary statistics.
+    `update` only reads files that are new or changed since they were
+    added: unchanged inputs are recognised from their size / mtime without
+    being opened, a changed file has its shard replaced, and the dataset's
+    row totals and merged statistics are rewritten after every shard.
+
+    Shards share one column order and one dtype per column: the branch's
+    native dtype, or its SplitConfig "output_dtypes" override (checked
+    against every shard). Nothing is narrowed from one file's values, so
+    later files cannot outgrow the layout. The split itself (SplitConfig
+    contents, spec, tree name) is fingerprinted; a dataset made with a
+    different split must be rebuilt.
+    """
+
+    MANIFEST_SUFFIX = "_shards.json"
+    VERSION = 2  # bump when the on-disk shard layout changes
+
+    def __init__(
+        self,
+        spec: SplitSpec,
+        config: SplitConfig,
+        out_prefix: str | Path | None = None,
+        tree_name: str | None = None,
+    ) -> None:
+
+        self.spec = spec
+        self.config = config
+        self.tree_name = tree_name
+
+        self.prefix: Path = SplitPair.resolve_prefix(
+            out_prefix or spec.out_prefix or f"{spec.name}/data"
+        )
+        self.manifest_path: Path = self.prefix.with_name(
+            self.prefix.name + self.MANIFEST_SUFFIX
+        )
+        self.columns_path: Path = self.prefix.with_name(self.prefix.name + "_columns.txt")
+
+        self.manifest: dict[str, Any] = self._read_manifest()
+
+    # ---------- manifest ----------
+    @property
+    def fingerprint(self) -> str:
+        """Everything that decides a shard's contents, except its source file."""
+
+        contents = asdict(self.config)
+        contents.pop("config_path", None)
+        contents.pop("splits", None)  # only this spec matters
+
+        payload = {
+            "version": self.VERSION,
+            "tree_name": self.tree_name,
+            "spec": asdict(self.spec),
+            "config": contents,
+        }
+
+        blob = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _empty_manifest(self) -> dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "split": self.spec.name,
+            "columns": None,
+            "dtypes": None,
+            "structured": self.config.structured_output,
+            "next_shard": 0,
+            "shards": [],
+            "rows": {"A": 0, "B": 0},
+            "stats": {"A": {}, "B": {}},
+        }
+
+    def _read_manifest(self) -> dict[str, Any]:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return self._empty_manifest()
+
+    def _write_manifest(self) -> None:
+        """Write atomically: a crash mid-update leaves the previous manifest."""
+
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=4)
+        os.replace(tmp, self.manifest_path)
+
+    @property
+    def shards(self) -> list[dict[str, Any]]:
+        return self.manifest["shards"]
+
+    @property
+    def columns(self) -> list[str] | None:
+        return self.manifest["columns"]
+
+    @property
+    def rows(self) -> dict[str, int]:
+        return self.manifest["rows"]
+
+    def paths(
+        self,
+        side: str,
+    ) -> list[Path]:
+        """Shard files of one side ("A" or "B"), oldest first."""
+        return [Path(shard[side]["path"]) for shard in self.shards]
+
+    def stats(
+        self,
+        side: str,
+    ) -> dict[str, BranchSummary]:
+        """Merged per-column statistics of one side over every shard."""
+
+        return {
+            name: BranchSummary.from_dict(raw)
+            for name, raw in self.manifest["stats"][side].items()
+        }
+
+    # ---------- shard bookkeeping ----------
+    @staticmethod
+    def _intact(shard: dict[str, Any]) -> bool:
+        for side in ("A", "B"):
+            path = Path(shard[side]["path"])
+            if not path.is_file() or path.stat().st_size != shard[side]["size"]:
+                return False
+        return True
+
+    def _find(
+        self,
+        source: Path,
+    ) -> dict[str, Any] | None:
+        key = str(source.resolve())
+        for shard in self.shards:
+            if shard["source"]["path"] == key:
+                return shard
+        return None
+
+    def is_current(
+        self,
+        source: str | Path,
+    ) -> bool:
+        """True if `source` is already in the dataset, unchanged and intact."""
+
+        source = Path(source)
+        shard = self._find(source)
+        if shard is None or not source.is_file():
+            return False
+
+        current = RootIO(source).file_identity()  # not opened → cheap
+        return identity_matches(shard["source"], current) and self._intact(shard)
+
+    def _drop(
+        self,
+        shard: dict[str, Any],
+    ) -> None:
+        for side in ("A", "B"):
+            Path(shard[side]["path"]).unlink(missing_ok=True)
+        Path(shard["columns"]).unlink(missing_ok=True)
+        self.shards.remove(shard)
+
+    def _refresh_totals(self) -> None:
+        """Row counts and merged statistics from the per-shard entries."""
+
+        for side in ("A", "B"):
+            self.rows[side] = sum(shard[side]["rows"] for shard in self.shards)
+
+            merged: dict[str, BranchSummary] = {}
+            for shard in self.shards:
+                for name, raw in shard[side]["stats"].items():
+                    part = BranchSummary.from_dict(raw)
+                    if name in merged:
+                        merged[name].merge(part)
+                    else:
+                        merged[name] = part
+
+            self.manifest["stats"][side] = {
+                name: summary.to_dict() for name, summary in merged.items()
+            }
+
+    def _plan(
+        self,
+        pair: SplitPair,
+    ) -> DtypePlan:
+        """Native dtypes plus declared overrides; the first shard records them."""
+
+        overrides = self.config.output_dtypes
+        native = {
+            name: np.result_type(
+                SplitPair._dtype(pair.a, name), SplitPair._dtype(pair.b, name)
+            )
+            for name in self.spec.branches
+        }
+        plan = DtypePlan(
+            {name: np.dtype(overrides.get(name, dt)) for name, dt in native.items()}
+        )
+        # Overrides are declared, not derived: check them on this shard
+        for side in (pair.a, pair.b):
+            plan.check(side, self.config.dtype_tolerance, only=list(overrides))
+
+        recorded = self.manifest["dtypes"]
+
+        if recorded is None:
+            self.manifest["dtypes"] = {
+                name: plan.dtypes[name].str for name in self.spec.branches
+            }
+            return plan
+
+        fixed = {name: np.dtype(d) for name, d in recorded.items()}
+        wider = {
+            name: str(plan.dtypes[name])
+            for name in fixed
+            if np.promote_types(plan.dtypes[name], fixed[name]) != fixed[name]
+        }
+        if wider:
+            raise ValueError(
+                f"New data does not fit the dataset's dtypes ({wider}); "
+                f"rebuild {self.manifest_path}"
+            )
+
+        return DtypePlan(fixed)
+
+    # ---------- appending ----------
+    def add(
+        self,
+        source: str | Path,
+        use_index: bool = False,
+    ) -> dict[str, Any]:
+        """Split one ROOT file into a new shard (replacing its old one)."""
+
+        source = Path(source)
+        old = self._find(source)
+
+        with RootIO(source) as rio:
+            ref = TreeRef.load_ref(rio, self.tree_name)
+            identity = rio.file_identity()
+
+            # Lazy sides gather from columns already in memory, not the reader
+            with DataSep(ref) as sep:
+                pair = sep.split_many([self.spec], use_index=use_index, lazy=True)[
+                    self.spec.name
+                ]
+            plan = self._plan(pair)
+
+            # Statistics are collected from the blocks as they are written
+            summaries = {
+                side: {name: BranchSummary.empty(name) for name in self.spec.branches}
+                for side in ("A", "B")
+            }
+
+            def on_block(
+                side: str,
+                rows: dict[str, np.ndarray],
+            ) -> None:
+                for name, summary in summaries[side].items():
+                    summary.update(rows[name])
+
+            n = int(self.manifest["next_shard"])
+            path_a, path_b, path_cols, columns = pair.save_npy(
+                self.prefix.with_name(f"{self.prefix.name}_part{n:05d}"),
+                order=self.spec.branches,
+                plan=plan,
+                structured=self.manifest["structured"],
+                memory_budget=sep.reader.config.memory_budget,
+                on_block=on_block,
+            )
+
+            shard: dict[str, Any] = {
+                "shard": n,
+                "source": identity,
+                "columns": str(path_cols),
+            }
+            for side, path, d in (("A", path_a, pair.a), ("B", path_b, pair.b)):
+                shard[side] = {
+                    "path": str(path),
+                    "size": int(path.stat().st_size),
+                    "rows": int(SplitPair._num_rows(d, columns[0])),
+                    "stats": {
+                        name: summary.to_dict()
+                        for name, summary in summaries[side].items()
+                    },
+                }
+
+        if self.columns is None:
+            self.manifest["columns"] = columns
+            self.columns_path.write_text(
+                "".join(f"{name}\n" for name in columns), encoding="utf-8"
+            )
+
+        if old is not None:
+            self._drop(old)
+
+        self.shards.append(shard)
+        self.manifest["next_shard"] = n + 1
+        self._refresh_totals()
+        self._write_manifest()
+
+        return shard
+
+    def update(
+        self,
+        sources: Iterable[str | Path],
+        use_index: bool = False,
+        rebuild: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Bring the dataset up to date with `sources`.
+
+        New and changed files are split and appended as shards; unchanged
+        ones are skipped without being read. Files no longer listed are
+        kept (the dataset only grows). Returns the shards added.
+        """
+
+        if rebuild or self.manifest.get("fingerprint") != self.fingerprint:
+            if self.shards and not rebuild:
+                raise ValueError(
+                    f"{self.manifest_path} was made with a different split; "
+                    "rebuild it to change the split"
+                )
+            for shard in list(self.shards):
+                self._drop(shard)
+            self.manifest = self._empty_manifest()
+
+        added: list[dict[str, Any]] = []
+
+        for source in dict.fromkeys(Path(s) for s in sources):
+            if self.is_current(source):
+                print(f"{source} already in {self.spec.name}, skipping.")
+                continue
+
+            shard = self.add(source, use_index=use_index)
+            print(
+                f"{source} → shard {shard['shard']} "
+                f"(A: {shard['A']['rows']}, B: {shard['B']['rows']} rows)"
+            )
+            added.append(shard)
+
+        return added
+
+    def report(self) -> None:
+        print(f"---------- {self.spec.name}: shards ----------")
+        for shard in self.shards:
+            print(
+                f"{shard['shard']:>5}  A: {shard['A']['rows']:>10}  "
+                f"B: {shard['B']['rows']:>10}  {shard['source']['path']}"
+            )
+        print(f"total  A: {self.rows['A']:>10}  B: {self.rows['B']:>10}")
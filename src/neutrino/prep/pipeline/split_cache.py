@@ -0,0 +1,203 @@
+import hashlib
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+
+from neutrino.prep.io.root_io import RootIO
+from neutrino.prep.io.tree_ref import TreeRef
+from neutrino.prep.config.split_config import SplitConfig
+from neutrino.prep.pipeline.data_pair import SplitPair
+
+
+class SplitCache:
+    """
+    Content-addressed manifest for one split output prefix.
+
+    A fingerprint is computed from everything that determines the split
+    result: the ROOT file identity, tree name, split method, SplitConfig
+    contents, branch list and output dtype. After a successful save the
+    fingerprint and the produced files are recorded in
+    `{prefix}_manifest.json`; a later run with the same fingerprint and
+    intact outputs can skip the read + split entirely.
+    """
+
+    MANIFEST_SUFFIX = "_manifest.json"
+    VERSION = 1  # bump when the on-disk output format changes
+
+    def __init__(
+        self,
+        ref: TreeRef,
+        config: SplitConfig,
+        out_prefix: str | Path,
+        method: str,
+        branches: Iterable[str] | None = None,
+        dtype: np.dtype | str | None = None,
+    ) -> None:
+
+        self.ref = ref
+        self.config = config
+        self.method = method
+        self.branches = None if branches is None else list(branches)
+        self.dtype = None if dtype is None else np.dtype(dtype).str
+
+        self.prefix: Path = SplitPair.resolve_prefix(out_prefix)
+        self.manifest_path: Path = self.prefix.with_name(
+            self.prefix.name + self.MANIFEST_SUFFIX
+        )
+
+    # ---------- fingerprint ----------
+    def _config_contents(self) -> dict[str, Any]:
+        contents = asdict(self.config)
+        # Where the JSON lives does not change the result, only what it says.
+        contents.pop("config_path", None)
+        return contents
+
+    @property
+    def fingerprint(self) -> str:
+
+        payload = {
+            "version": self.VERSION,
+            "source": self.ref.io.file_identity(),
+            "tree_name": self.ref.tree_name,
+            "method": self.method,
+            "config": self._config_contents(),
+            "branches": self.branches,
+            "dtype": self.dtype,
+        }
+
+        blob = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    # ---------- manifest ----------
+    @staticmethod
+    def _read_manifest(path: Path) -> dict[str, Any] | None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _outputs_intact(manifest: dict[str, Any]) -> bool:
+        """Every recorded output exists with the recorded size."""
+
+        for entry in manifest.get("outputs", []):
+            path = Path(entry["path"])
+            if not path.is_file() or path.stat().st_size != entry["size"]:
+                return False
+
+        return True
+
+    def is_valid(self) -> bool:
+        """True if matching, intact outputs already exist for this split."""
+
+        manifest = self._read_manifest(self.manifest_path)
+
+        if manifest is None:
+            return False
+        if manifest.get("fingerprint") != self.fingerprint:
+            return False
+
+        return self._outputs_intact(manifest)
+
+    def record(
+        self,
+        outputs: Iterable[str | Path],
+    ) -> Path:
+        """Write the manifest for freshly saved `outputs`. Returns its path."""
+
+        entries: list[dict[str, Any]] = []
+
+        for out in outputs:
+            path = Path(out)
+            entries.append({"path": str(path), "size": int(path.stat().st_size)})
+
+        manifest = {
+            "fingerprint": self.fingerprint,
+            "source": self.ref.io.file_identity(),
+            "tree_name": self.ref.tree_name,
+            "method": self.method,
+            "outputs": entries,
+        }
+
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=4)
+
+        return self.manifest_path
+
+    def invalidate(self) -> None:
+        """Force the next run to redo the split (drops manifest + outputs)."""
+
+        manifest = self._read_manifest(self.manifest_path)
+
+        if manifest is not None:
+            self._remove_outputs(manifest)
+
+        self.manifest_path.unlink(missing_ok=True)
+
+    # ---------- garbage collection ----------
+    @staticmethod
+    def _remove_outputs(manifest: dict[str, Any]) -> list[Path]:
+        removed: list[Path] = []
+
+        for entry in manifest.get("outputs", []):
+            path = Path(entry["path"])
+            if path.is_file():
+                path.unlink()
+                removed.append(path)
+
+        return removed
+
+    @staticmethod
+    def _source_unchanged(manifest: dict[str, Any]) -> bool:
+        """Compare the recorded source identity with the file on disk now."""
+
+        recorded = manifest.get("source", {})
+        path = Path(recorded.get("path", ""))
+
+        if not path.is_file():
+            return False
+
+        current = RootIO(path).file_identity()  # not opened → no UUID
+        return all(
+            current[key] == recorded.get(key) for key in ("size", "mtime_ns")
+        )
+
+    @classmethod
+    def collect_garbage(
+        cls,
+        root: str | Path = "output",
+        dry_run: bool = False,
+    ) -> list[Path]:
+        """
+        Remove split outputs under `root` that can no longer be trusted.
+
+        A manifest is stale when its source ROOT file is gone or has changed
+        since the split was made, or when any of its outputs is missing or
+        truncated. Returns the manifests that were (or would be) removed.
+        """
+
+        stale: list[Path] = []
+
+        for manifest_path in sorted(Path(root).rglob(f"*{cls.MANIFEST_SUFFIX}")):
+            manifest = cls._read_manifest(manifest_path)
+
+            if (
+                manifest is not None
+                and cls._source_unchanged(manifest)
+                and cls._outputs_intact(manifest)
+            ):
+                continue
+
+            stale.append(manifest_path)
+
+            if not dry_run:
+                if manifest is not None:
+                    cls._remove_outputs(manifest)
+                manifest_path.unlink(missing_ok=True)
+
+        return stale
@@ -0,0 +1,258 @@
+import difflib
+import math
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+
+from neutrino.prep.io.threads import ThreadBudget
+from neutrino.prep.io.tree_ref import TreeRef
+from neutrino.prep.io.tree_meta import TreeMeta
+from neutrino.prep.io.category_index import CategoryIndex
+from neutrino.prep.config.split_config import SplitConfig
+from neutrino.prep.pipeline.cuts import CutSet
+
+if TYPE_CHECKING:
+    from neutrino.prep.io.tree_reader import TreeReader
+
+_MB = 1024**2
+
+
+@dataclass
+class SplitPlan:
+    """Dry-run estimate for one DataSep request (only one cluster is read)."""
+
+    method: str
+    output_branches: list[str]
+    read_branches: list[str]
+    num_entries: int
+    compressed_bytes: int  # bytes to pull off disk
+    uncompressed_bytes: int  # bytes after decompression (all read branches)
+    output_rows: int  # rows over A + B
+    output_rows_exact: bool  # False → upper bound (no category index yet)
+    output_bytes: int  # size of the saved A + B matrices
+    throughput_mb_s: float  # measured decompressed MB/s on one cluster
+    est_wall_s: float  # estimated read time with the recommended workers
+    chunk_size: int  # recommended entries per chunk
+    workers: int  # recommended reader processes
+
+    def report(self) -> None:
+        print(f"---------- Plan: {self.method} ----------")
+        print(f"entries: {self.num_entries}")
+        print(f"branches read: {len(self.read_branches)}")
+        print(f"compressed read: {self.compressed_bytes / _MB:.1f} MB")
+        print(f"decompressed: {self.uncompressed_bytes / _MB:.1f} MB")
+        bound = "" if self.output_rows_exact else " (upper bound)"
+        print(f"output rows: {self.output_rows}{bound}")
+        print(f"output size: {self.output_bytes / _MB:.1f} MB{bound}")
+        print(f"throughput: {self.throughput_mb_s:.1f} MB/s per worker")
+        print(f"estimated wall time: {self.est_wall_s:.1f} s")
+        print(f"recommended chunk size: {self.chunk_size} entries")
+        print(f"recommended workers: {self.workers}")
+
+
+class SplitPlanner:
+    """
+    Validate and cost a split before any data is read.
+
+    Every requested branch, the flag/category branch and the configured
+    labels are checked against TreeMeta up front (with close-match hints
+    for typos). Costs come from basket metadata; throughput is measured by
+    decompressing the first cluster of the requested branches.
+
+    Given the TreeReader doing the split, friend-tree branches are
+    validated too; costs cover the main tree's branches only.
+    """
+
+    # Aim for chunks of roughly this many decompressed bytes
+    CHUNK_BYTES_TARGET = 256 * _MB
+    # Below this many compressed bytes per worker, more workers do not pay
+    BYTES_PER_WORKER_MIN = 64 * _MB
+    # Decompressed bytes read to measure throughput
+    PROBE_BYTES = 4 * _MB
+
+    def __init__(
+        self,
+        ref: TreeRef,
+        config: SplitConfig | None = None,
+        reader: "TreeReader | None" = None,
+    ) -> None:
+
+        self.ref = ref
+        self.meta = TreeMeta(ref)
+        self.config = config or SplitConfig.load_config()
+        self.reader = reader
+
+    def _main(
+        self,
+        branches: list[str],
+    ) -> list[str]:
+        """Drop friend-tree branches (not costed)."""
+
+        if self.reader is None or not self.reader.friends:
+            return branches
+        return self.reader.main_branches(branches)
+
+    # ---------- validation ----------
+    def validate(
+        self,
+        branches: Iterable[str],
+    ) -> None:
+        """Raise ValueError naming every branch the tree does not have."""
+
+        if self.reader is not None:
+            available = self.reader.branch_names()
+        else:
+            available = self.meta.get_branch_names()
+        known = set(available)
+        missing = [name for name in dict.fromkeys(branches) if name not in known]
+
+        if not missing:
+            return
+
+        hints: list[str] = []
+        for name in missing:
+            close = difflib.get_close_matches(name, available, n=1)
+            hint = f" (did you mean {close[0]!r}?)" if close else ""
+            hints.append(f"{name!r}{hint}")
+
+        raise ValueError(
+            f"Tree {self.ref.tree_name!r} has no branch " + ", ".join(hints)
+        )
+
+    def validate_labels(
+        self,
+        groups: dict[str, list[str]],
+    ) -> None:
+
+        unknown = [
+            label
+            for labels in groups.values()
+            for label in labels
+            if label not in self.config.type_map
+        ]
+        if unknown:
+            raise ValueError(f"Labels missing from type_map: {unknown}")
+
+    # ---------- cost model ----------
+    def _measure_throughput(
+        self,
+        cols: list[str],
+    ) -> float:
+        """Decompressed MB/s over the first cluster of `cols` (<= PROBE_BYTES)."""
+
+        bounds = self.meta.get_cluster_boundaries(cols)
+        if len(bounds) < 2:
+            return math.nan
+
+        tree = self.meta._get_tree()
+
+        # A probe, not a read: large clusters are cut to ~PROBE_BYTES
+        uncompressed = sum(int(tree[n].uncompressed_bytes) for n in cols)
+        num_entries = max(self.meta.get_num_entries(), 1)
+        probe = max(1, int(self.PROBE_BYTES * num_entries // max(uncompressed, 1)))
+        stop = min(int(bounds[1]), probe)
+
+        t0 = time.perf_counter()
+        arrs = tree.arrays(cols, entry_start=0, entry_stop=stop, library="np")
+        dt = time.perf_counter() - t0
+
+        nbytes = sum(np.asarray(arrs[name]).nbytes for name in cols)
+        return (nbytes / _MB) / dt if dt > 0 else math.inf
+
+    def _estimate_rows(
+        self,
+        branch: str,
+        codes: list[int],
+    ) -> tuple[int, bool]:
+        """Selected rows from an existing index; otherwise the entry count."""
+
+        index = CategoryIndex.load(self.ref, branch)
+        if index is None:
+            return self.meta.get_num_entries(), False
+
+        counts = index.counts
+        return sum(counts.get(code, 0) for code in codes), True
+
+    def plan(
+        self,
+        method: str = "flag",
+        branches: Iterable[str] | None = None,
+    ) -> SplitPlan:
+        """
+        Cost a `split_by_flag` ("flag") or `split_by_categories`
+        ("categories") request with the current SplitConfig.
+        """
+
+        output = list(dict.fromkeys(branches or self.config.target_branches))
+
+        if method == "flag":
+            select = self.config.flag_branch
+            codes = [self.config.flag_values["A"], self.config.flag_values["B"]]
+            output = [n for n in output if n != select]
+        elif method == "categories":
+            select = self.config.cat_branch
+            self.validate_labels(self.config.type_group)
+            codes = [
+                self.config.type_map[label]
+                for group in ("A", "B")
+                for label in self.config.type_group[group]
+            ]
+        else:
+            raise ValueError(f"Unknown split method: {method!r}")
+
+        cuts = CutSet.from_config(self.config)
+        read = list(dict.fromkeys([*output, select, *cuts.read_branches]))
+        self.validate(read)
+        costed = self._main(read)
+
+        tree = self.meta._get_tree()
+        num_entries = self.meta.get_num_entries()
+
+        compressed = sum(int(tree[n].compressed_bytes) for n in costed)
+        uncompressed = sum(int(tree[n].uncompressed_bytes) for n in costed)
+
+        rows, exact = self._estimate_rows(select, codes)
+        # Cut efficiencies are unknown until the data is read
+        exact = exact and not cuts
+        dtypes = self.meta.get_branch_dtypes(self._main(output))
+        itemsize = np.result_type(*dtypes.values()).itemsize if dtypes else 0
+        output_bytes = rows * len(output) * itemsize
+
+        # Chunk: ~CHUNK_BYTES_TARGET decompressed, rounded to whole clusters
+        bytes_per_entry = max(uncompressed / max(num_entries, 1), 1.0)
+        chunk = int(self.CHUNK_BYTES_TARGET // bytes_per_entry)
+        bounds = self.meta.get_cluster_boundaries(costed)
+        cluster = max(int(np.median(np.diff(bounds))), 1) if len(bounds) > 1 else 1
+        chunk = max(cluster, (chunk // cluster) * cluster)
+        chunk = min(chunk, max(num_entries, 1))
+
+        n_clusters = max(len(bounds) - 1, 1)
+        workers = max(
+            1,
+            min(
+                ThreadBudget.from_config().total_cores,
+                n_clusters,
+                math.ceil(compressed / self.BYTES_PER_WORKER_MIN),
+            ),
+        )
+
+        throughput = self._measure_throughput(costed)
+        est_wall = (uncompressed / _MB) / (throughput * workers)
+
+        return SplitPlan(
+            method=method,
+            output_branches=output,
+            read_branches=read,
+            num_entries=num_entries,
+            compressed_bytes=compressed,
+            uncompressed_bytes=uncompressed,
+            output_rows=rows,
+            output_rows_exact=exact,
+            output_bytes=output_bytes,
+            throughput_mb_s=throughput,
+            est_wall_s=est_wall,
+            chunk_size=chunk,
+            workers=workers,
+        )
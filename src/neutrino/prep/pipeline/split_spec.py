@@ -0,0 +1,229 @@
+from dataclasses import dataclass
+from typing import Any, Iterable, Literal
+
+from neutrino.prep.config.split_config import SplitConfig
+
+
+@dataclass(frozen=True)
+class SplitSpec:
+    """
+    One A/B split definition, independent of how the data is read.
+
+    Rows whose `select_branch` value is in `a_codes` go to A, those in
+    `b_codes` go to B. A "hash" split reads no selection branch: each
+    entry goes to A or B by a hash of (file, entry number, seed) with the
+    given `fractions` (see HashSplitter). `branches` is the final output
+    column order. DataSep can run many specs over a single pass of the tree.
+    """
+
+    name: str
+    kind: Literal["flag", "categories", "hash"]
+    select_branch: str | None  # flag or category branch (None for "hash")
+    a_codes: tuple[int, ...]
+    b_codes: tuple[int, ...]
+    branches: tuple[str, ...]  # output columns, in order
+    out_prefix: str | None = None  # where save_npy should put the result
+    fractions: tuple[float, float] = (0.0, 0.0)  # "hash": share of entries in A, B
+    seed: int = 0  # "hash": changes the assignment
+
+    @property
+    def read_branches(self) -> list[str]:
+        """Everything that must be read to evaluate and output this split."""
+        if self.select_branch is None:
+            return list(self.branches)
+        return list(dict.fromkeys([*self.branches, self.select_branch]))
+
+    def mask_key(
+        self,
+        side: str,
+    ) -> tuple[Any, ...]:
+        """Identifies one side's row selection; equal keys share a mask."""
+
+        if self.kind == "hash":
+            # Hash values fall in [lo, hi): A takes the first share, B the next
+            lo = 0.0 if side == "A" else self.fractions[0]
+            hi = lo + self.fractions[0 if side == "A" else 1]
+            return ("hash", self.seed, lo, hi)
+
+        return (self.select_branch, self.a_codes if side == "A" else self.b_codes)
+
+    # ---------- builders ----------
+    @classmethod
+    def flag(
+        cls,
+        config: SplitConfig,
+        name: str = "flag",
+        branches: Iterable[str] | None = None,
+        flag_branch: str | None = None,
+        a_value: int | None = None,
+        b_value: int | None = None,
+        out_prefix: str | None = None,
+    ) -> "SplitSpec":
+        """Equality split on a flag branch (like split_by_flag)."""
+
+        flag = flag_branch or config.flag_branch
+        requested = list(config.target_branches if branches is None else branches)
+
+        if a_value is None:
+            a_value = config.flag_values["A"]
+        if b_value is None:
+            b_value = config.flag_values["B"]
+
+        return cls(
+            name=name,
+            kind="flag",
+            select_branch=flag,
+            a_codes=(int(a_value),),
+            b_codes=(int(b_value),),
+            # The flag itself is never part of the A/B outputs
+            branches=tuple(n for n in dict.fromkeys(requested) if n != flag),
+            out_prefix=out_prefix,
+        )
+
+    @classmethod
+    def categories(
+        cls,
+        config: SplitConfig,
+        name: str = "categories",
+        branches: Iterable[str] | None = None,
+        cat_branch: str | None = None,
+        groups: dict[str, list[str]] | None = None,
+        include_cat: bool | None = None,
+        out_prefix: str | None = None,
+    ) -> "SplitSpec":
+        """Category-group split (like split_by_categories)."""
+
+        cat = cat_branch or config.cat_branch
+        requested = list(config.target_branches if branches is None else branches)
+
+        if groups is None:
+            groups = config.type_group
+
+        unknown = [
+            label
+            for labels in groups.values()
+            for label in labels
+            if label not in config.type_map
+        ]
+        if unknown:
+            raise ValueError(f"Labels missing from type_map: {unknown}")
+
+        # Keep the category column iff asked for (explicitly or in `branches`)
+        if include_cat is None:
+            include_cat = cat in requested
+
+        output = [n for n in requested if include_cat or n != cat]
+
+        return cls(
+            name=name,
+            kind="categories",
+            select_branch=cat,
+            a_codes=tuple(config.type_map[label] for label in groups["A"]),
+            b_codes=tuple(config.type_map[label] for label in groups["B"]),
+            branches=tuple(dict.fromkeys(output)),
+            out_prefix=out_prefix,
+        )
+
+    @classmethod
+    def hash(
+        cls,
+        config: SplitConfig,
+        name: str = "hash",
+        branches: Iterable[str] | None = None,
+        fractions: dict[str, float] | None = None,
+        seed: int = 0,
+        out_prefix: str | None = None,
+    ) -> "SplitSpec":
+        """
+        Random split by entry hash, e.g. fractions {"A": 0.8, "B": 0.2}.
+        Fractions may add up to less than 1 (the rest is dropped).
+        """
+
+        fractions = {"A": 0.5, "B": 0.5} if fractions is None else fractions
+        fa, fb = float(fractions["A"]), float(fractions["B"])
+        if fa < 0 or fb < 0 or fa + fb > 1.0 + 1e-12:
+            raise ValueError(
+                f"Hash split fractions must be >= 0 and sum to <= 1, got {fractions}"
+            )
+
+        requested = list(config.target_branches if branches is None else branches)
+
+        return cls(
+            name=name,
+            kind="hash",
+            select_branch=None,
+            a_codes=(),
+            b_codes=(),
+            branches=tuple(dict.fromkeys(requested)),
+            out_prefix=out_prefix,
+            fractions=(fa, fb),
+            seed=int(seed),
+        )
+
+    @classmethod
+    def from_dict(
+        cls,
+        raw: dict[str, Any],
+        config: SplitConfig,
+    ) -> "SplitSpec":
+        """
+        Build from one entry of SplitConfig.splits, e.g.
+        {"name": "split3", "kind": "categories",
+         "groups": {"A": ["QE"], "B": ["RES", "DIS"]},
+         "out_prefix": "split3/data"}
+        or {"name": "rand", "kind": "hash", "fractions": {"A": 0.8, "B": 0.2},
+         "seed": 1}.
+        Keys that are left out fall back to the SplitConfig defaults.
+        """
+
+        kind = str(raw["kind"])
+        name = str(raw["name"])
+        branches = raw.get("branches")
+        out_prefix = raw.get("out_prefix")
+
+        if kind == "flag":
+            return cls.flag(
+                config,
+                name=name,
+                branches=branches,
+                flag_branch=raw.get("flag_branch"),
+                a_value=raw.get("a_value"),
+                b_value=raw.get("b_value"),
+                out_prefix=out_prefix,
+            )
+        if kind == "categories":
+            return cls.categories(
+                config,
+                name=name,
+                branches=branches,
+                cat_branch=raw.get("cat_branch"),
+                groups=raw.get("groups"),
+                include_cat=raw.get("include_cat"),
+                out_prefix=out_prefix,
+            )
+        if kind == "hash":
+            return cls.hash(
+                config,
+                name=name,
+                branches=branches,
+                fractions=raw.get("fractions"),
+                seed=int(raw.get("seed", 0)),
+                out_prefix=out_prefix,
+            )
+
+        raise ValueError(f"Unknown split kind: {kind!r}")
+
+    @classmethod
+    def from_config(
+        cls,
+        config: SplitConfig,
+    ) -> list["SplitSpec"]:
+        """All split definitions declared in SplitConfig.splits."""
+
+        specs = [cls.from_dict(raw, config) for raw in config.splits]
+
+        names = [s.name for s in specs]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate split names: {names}")
+
+        return specs
@@ -0,0 +1,86 @@
+import numpy as np
+
+from neutrino.prep.io.branch_stats import (
+    AdaptiveHistogram,
+    BranchSummary,
+    QuantileSketch,
+)
+
+
+def grid(h: AdaptiveHistogram, exp: int) -> dict[int, int]:
+    """Non-empty bins of `h` coarsened to width 2**exp, by grid index."""
+
+    h = h.copy()
+    while h.exp < exp:
+        h._coarsen()
+    return {h.start + i: int(c) for i, c in enumerate(h.counts) if c}
+
+
+rng = np.random.default_rng(0)
+x = np.concatenate([rng.normal(5.0, 2.0, 150_000), rng.exponential(40.0, 50_000)])
+x[rng.choice(x.size, 500, replace=False)] = np.nan
+chunks = np.array_split(x, 37)
+
+# ---------- histogram: merged parts == one pass, on a common grid ----------
+whole = AdaptiveHistogram(64)
+whole.update(x[np.isfinite(x)])
+
+parts = [AdaptiveHistogram(64) for _ in range(4)]
+for i, chunk in enumerate(chunks):
+    parts[i % 4].update(chunk[np.isfinite(chunk)])
+merged = AdaptiveHistogram(64)
+for h in parts:
+    merged.merge(h)
+
+exp = max(whole.exp, merged.exp)
+assert merged.counts.size <= 64
+assert merged.counts.sum() == whole.counts.sum() == np.isfinite(x).sum()
+assert grid(merged, exp) == grid(whole, exp)
+print(f"histogram: {merged.counts.size} bins of 2**{merged.exp}, merge == one pass")
+
+# ---------- summary: merged moments == one pass ----------
+one = BranchSummary.empty("x")
+one.update(x)
+
+summaries = [BranchSummary.empty("x") for _ in range(4)]
+for i, chunk in enumerate(chunks):
+    summaries[i % 4].update(chunk)
+total = BranchSummary.empty("x")
+for s in summaries:
+    total.merge(s)
+
+finite = x[np.isfinite(x)]
+assert (total.count, total.nan_count, total.inf_count) == (finite.size, 500, 0)
+assert (total.min, total.max) == (finite.min(), finite.max())
+assert np.isclose(total.mean, finite.mean(), rtol=1e-12)
+assert np.isclose(total.std, finite.std(), rtol=1e-9)
+assert np.isclose(total.std, one.std, rtol=1e-9)
+print(f"summary: mean {total.mean:.6f}  std {total.std:.6f}  merge == one pass")
+
+# ---------- sketch: rank error stays bounded after merges ----------
+probs = np.linspace(0.01, 0.99, 99)
+ordered = np.sort(finite)
+worst = 0.0
+
+for seed in range(5):
+    sketches = [QuantileSketch(256, seed=seed * 4 + i) for i in range(4)]
+    for i, chunk in enumerate(chunks):
+        sketches[i % 4].update(chunk[np.isfinite(chunk)])
+    sketch = sketches[0]
+    for s in sketches[1:]:
+        sketch.merge(s)
+
+    assert sketch.n == finite.size
+    found = np.searchsorted(ordered, sketch.quantiles(probs), side="right")
+    ranks = found / finite.size
+    worst = max(worst, float(np.abs(ranks - probs).max()))
+
+# KLL with k = 256: normalized rank error well below 5 / k
+assert worst < 0.02, worst
+print(f"sketch: worst rank error {worst:.4f} over {len(probs)} quantiles")
+
+# ---------- sidecar round trip keeps the mergeable state ----------
+restored = BranchSummary.from_dict(total.to_dict())
+assert grid(restored.hist, restored.hist.exp) == grid(total.hist, total.hist.exp)
+assert restored.quantiles() == total.quantiles()
+print("round trip: ok")
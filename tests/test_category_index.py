@@ -0,0 +1,17 @@
+from neutrino.prep.io.root_io import RootIO
+from neutrino.prep.io.tree_ref import TreeRef
+from neutrino.prep.io.category_index import CategoryIndex
+from neutrino.prep.pipeline.data_sep import DataSep
+
+with RootIO() as rio:
+    ref: TreeRef = TreeRef.load_ref(rio)
+
+    index: CategoryIndex = CategoryIndex.open(ref, "Interaction_Type")
+    print(index.counts)
+
+    sep: DataSep = DataSep(ref)
+    qe_res_dis = sep.select_categories(["QE", "RES", "DIS"])
+    flag_b = sep.select_flag(1)
+
+    print(len(qe_res_dis), len(flag_b))
+    print(len(qe_res_dis & flag_b), len(qe_res_dis | flag_b), len(~flag_b))
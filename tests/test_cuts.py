@@ -0,0 +1,75 @@
+import numpy as np
+
+from neutrino.prep.pipeline.cuts import Cut, CutSet
+
+rng = np.random.default_rng(0)
+n = 100_000
+data = {
+    "energy": rng.uniform(-5.0, 25.0, n),
+    "x": rng.uniform(0.0, 1.0, n),
+    "type": rng.integers(0, 4, n).astype(np.int32),
+}
+# NaN / inf rows and values sitting exactly on the range edges
+data["energy"][1::89] = 0.0
+data["energy"][2::89] = 20.0
+data["energy"][::97] = np.nan
+data["x"][::101] = np.inf
+
+cuts = [
+    Cut(name="0 <= energy <= 20", kind="range", branches=("energy",), lo=0.0, hi=20.0),
+    Cut(name="finite", kind="finite", branches=("energy", "x", "type")),
+    Cut(name="type in [1, 3]", kind="in", branches=("type",), values=(1, 3)),
+    Cut(
+        name="x <= 0.2 or x > 0.5",
+        kind="or",
+        children=(
+            Cut(name="x <= 0.2", kind="range", branches=("x",), hi=0.2),
+            Cut(
+                name="not x <= 0.5",
+                kind="not",
+                children=(Cut(name="x <= 0.5", kind="range", branches=("x",), hi=0.5),),
+            ),
+        ),
+    ),
+]
+
+# Expected masks, one cut at a time, written out independently
+energy, x, kind = data["energy"], data["x"], data["type"]
+expected = [
+    (energy >= 0.0) & (energy <= 20.0),
+    np.isfinite(energy) & np.isfinite(x),
+    (kind == 1) | (kind == 3),
+    (x <= 0.2) | ~(x <= 0.5),
+]
+
+for cut, want in zip(cuts, expected):
+    assert np.array_equal(cut.mask(data), want), cut.name
+
+# NaN never passes a range cut; both edges are inclusive
+assert not cuts[0].mask(data)[::97].any()
+assert cuts[0].mask(data)[1::89][np.isfinite(energy[1::89])].all()
+assert cuts[0].mask(data)[2::89][np.isfinite(energy[2::89])].all()
+
+# ---------- fused mask and cutflow, over uneven chunks ----------
+cutset = CutSet(cuts)
+fused: list[np.ndarray] = []
+
+for lo, hi in zip([0, 1, 7_000, 7_001, 50_000], [1, 7_000, 7_001, 50_000, n]):
+    chunk = {name: arr[lo:hi] for name, arr in data.items()}
+    fused.append(cutset.apply(chunk, hi - lo))
+
+sequential = np.ones(n, dtype=bool)
+counts = []
+for want in expected:
+    sequential &= want
+    counts.append(int(sequential.sum()))
+
+assert np.array_equal(np.concatenate(fused), sequential)
+assert cutset.cutflow.total == n
+assert cutset.cutflow.passed == counts, (cutset.cutflow.passed, counts)
+cutset.cutflow.report()
+
+# An empty CutSet passes everything but still counts entries
+empty = CutSet()
+assert empty.apply(data, n) is None and empty.cutflow.total == n
+print("cuts: fused mask == sequential masks, cutflow ok")
@@ -0,0 +1,98 @@
+import math
+
+import numpy as np
+
+from neutrino.clf.evaluate import RocEvaluator
+from neutrino.clf.train import finite_rows
+
+
+def mann_whitney_auc(scores: np.ndarray, labels: np.ndarray) -> float:
+    """P(signal score > background score), ties counted half."""
+
+    sig = np.sort(scores[labels == 1])
+    bkg = np.sort(scores[labels == 0])
+    below = np.searchsorted(bkg, sig, side="left")
+    ties = np.searchsorted(bkg, sig, side="right") - below
+    return float((below + 0.5 * ties).sum() / (len(sig) * len(bkg)))
+
+
+rng = np.random.default_rng(0)
+n = 200_000
+labels = (rng.random(n) < 0.4).astype(np.int8)
+# Overlapping classes; rounded so the exact path sees many ties
+raw = 1.0 / (1.0 + np.exp(-(rng.normal(0.0, 1.0, n) + labels)))
+scores = np.round(raw, 3)
+
+# ---------- exact AUC == Mann-Whitney; binned AUC agrees ----------
+reference = mann_whitney_auc(scores, labels)
+exact = RocEvaluator.exact_auc(scores, labels)
+assert math.isclose(exact, reference, rel_tol=1e-12), (exact, reference)
+
+# Unrounded scores share bins: those pairs count half right
+binned = RocEvaluator(n_bins=4096)
+binned.update(raw, labels)
+raw_reference = mann_whitney_auc(raw, labels)
+assert abs(binned.auc() - raw_reference) < 1e-3, (binned.auc(), raw_reference)
+print(f"AUC exact {exact:.6f} (reference {reference:.6f})")
+print(f"AUC binned {binned.auc():.6f} (reference {raw_reference:.6f})")
+
+# ---------- merging shard evaluators == one evaluator ----------
+for exact_mode in (False, True):
+    whole = RocEvaluator(exact=exact_mode)
+    whole.update(scores, labels)
+
+    merged = RocEvaluator(exact=exact_mode)
+    for part in np.array_split(np.arange(n), 7):
+        shard = RocEvaluator(exact=exact_mode)
+        shard.update(scores[part], labels[part])
+        merged.merge(shard)
+
+    assert np.array_equal(merged.counts, whole.counts)
+    assert merged.auc() == whole.auc()
+    assert np.allclose(merged.curve().tpr, whole.curve().tpr)
+
+try:
+    RocEvaluator(n_bins=10).merge(RocEvaluator(n_bins=20))
+    raise AssertionError("merge of different binnings must fail")
+except ValueError:
+    pass
+
+# ---------- weights: integer weights == repeated rows ----------
+weights = rng.integers(1, 4, n)
+weighted = RocEvaluator(exact=True)
+weighted.update(scores, labels, weights)
+repeated = RocEvaluator.exact_auc(
+    np.repeat(scores, weights), np.repeat(labels, weights)
+)
+assert math.isclose(weighted.auc(), repeated, rel_tol=1e-12)
+
+# ---------- NaN scores and one-class inputs ----------
+bad = scores.copy()
+bad[::50] = np.nan
+for exact_mode in (False, True):
+    try:
+        RocEvaluator(exact=exact_mode).update(bad, labels)
+        raise AssertionError("NaN scores must be rejected")
+    except ValueError:
+        pass
+
+# Scripts drop rows with non-finite features (their scores are NaN) first
+X = np.stack([bad, scores], axis=1)
+rows = finite_rows(X)
+assert len(rows) == n - len(bad[::50])
+assert math.isclose(
+    RocEvaluator.exact_auc(bad[rows], labels[rows]),
+    mann_whitney_auc(scores[rows], labels[rows]),
+    rel_tol=1e-12,
+)
+
+one_class = RocEvaluator()
+one_class.update(scores[labels == 1], labels[labels == 1])
+try:
+    one_class.auc()
+    raise AssertionError("AUC of one class must fail")
+except ValueError:
+    pass
+assert math.isnan(RocEvaluator.exact_auc(scores[labels == 0], labels[labels == 0]))
+
+print("evaluator: merge, weights, NaN and one-class paths ok")